@@ -0,0 +1,243 @@
+"""
+This module builds and loads precompiled asset bundles.  Graphics are
+packed into texture atlas pages of raw pixels and sounds are stored as raw
+PCM, so startup can map them straight into memory instead of decoding PNGs
+and sound files.  Build the bundle from the repository root with:
+
+    python -m data.asset_bundle
+
+The bundle records the modification time and size of every source file.
+If any of them change the bundle is stale and the loaders return None, so
+prepare falls back to loading the resource directories directly.
+"""
+
+import os
+import sys
+import json
+import mmap
+import pygame as pg
+from . import tools
+
+
+BUNDLE_VERSION = 1
+PAGE_SIZE = 1024
+#Must match pg.mixer.pre_init in prepare; sounds are stored in this format
+MIXER = (44100, -16, 1, 512)
+GFX_ACCEPT = (".png", ".jpg", ".bmp")
+SFX_ACCEPT = (".wav", ".mp3", ".ogg", ".mdi")
+
+
+def _sources(directory, accept):
+    """Map each accepted file in directory to its [mtime, size]."""
+    sources = {}
+    for filename in os.listdir(directory):
+        if os.path.splitext(filename)[1].lower() in accept:
+            info = os.stat(os.path.join(directory, filename))
+            sources[filename] = [info.st_mtime, info.st_size]
+    return sources
+
+
+def pack(sizes, page_size=PAGE_SIZE):
+    """
+    Shelf-pack rects onto pages no wider or taller than page_size.  Sizes
+    is a dict of name: (width, height).  Returns a list of page sizes and
+    a dict of name: (page, x, y).  Anything bigger than a page gets a page
+    of its own.
+    """
+    pages = []
+    shelves = []
+    places = {}
+    for name in sorted(sizes, key=lambda n: (-sizes[n][1], -sizes[n][0], n)):
+        w, h = sizes[name]
+        if w > page_size or h > page_size:
+            places[name] = (len(pages), 0, 0)
+            pages.append([w, h])
+            shelves.append(None)
+            continue
+        for page, page_shelves in enumerate(shelves):
+            if page_shelves is None:
+                continue
+            placed = False
+            for shelf in page_shelves:
+                y, shelf_h, x = shelf
+                if h <= shelf_h and x+w <= page_size:
+                    places[name] = (page, x, y)
+                    shelf[2] += w
+                    placed = True
+                    break
+            if not placed and pages[page][1]+h <= page_size:
+                places[name] = (page, 0, pages[page][1])
+                page_shelves.append([pages[page][1], h, w])
+                pages[page][1] += h
+                placed = True
+            if placed:
+                pages[page][0] = max(pages[page][0], places[name][1]+w)
+                break
+        else:
+            places[name] = (len(pages), 0, 0)
+            pages.append([w, h])
+            shelves.append([[0, h, w]])
+    return [tuple(size) for size in pages], places
+
+
+def build_graphics(directory, bundle_dir, page_size=PAGE_SIZE):
+    """
+    Pack every graphic in directory into atlas pages and write them with
+    their index to bundle_dir.  Images with alpha and without are packed
+    onto separate pages, matching how tools.load_image converts them.
+    """
+    images = {}
+    for filename in os.listdir(directory):
+        name, ext = os.path.splitext(filename)
+        if ext.lower() in GFX_ACCEPT:
+            images[name] = pg.image.load(os.path.join(directory, filename))
+    index = {"version": BUNDLE_VERSION, "file": "graphics.bin",
+             "sources": _sources(directory, GFX_ACCEPT),
+             "pages": [], "images": {}}
+    offset = 0
+    with open(os.path.join(bundle_dir, index["file"]), "wb") as data:
+        for alpha in (True, False):
+            fmt, depth = ("RGBA", 4) if alpha else ("RGB", 3)
+            sizes = dict((name, image.get_size())
+                         for name, image in images.items()
+                         if bool(image.get_alpha()) == alpha)
+            pages, places = pack(sizes, page_size)
+            first = len(index["pages"])
+            for w, h in pages:
+                index["pages"].append({"offset": offset, "size": [w, h],
+                                       "format": fmt})
+                offset += w*h*depth
+            pixels = [bytearray(w*h*depth) for w, h in pages]
+            for name, (page, x, y) in places.items():
+                w, h = sizes[name]
+                page_w = pages[page][0]
+                raw = pg.image.tostring(images[name], fmt)
+                for row in range(h):
+                    start = ((y+row)*page_w+x)*depth
+                    pixels[page][start:start+w*depth] = raw[row*w*depth:
+                                                            (row+1)*w*depth]
+                index["images"][name] = [first+page, x, y, w, h]
+            for page in pixels:
+                data.write(page)
+    with open(os.path.join(bundle_dir, "graphics.json"), "w") as f:
+        json.dump(index, f)
+    return index
+
+
+def build_sounds(directory, bundle_dir):
+    """
+    Decode every sound in directory to raw PCM in the current mixer
+    format and write it with its index to bundle_dir.
+    """
+    index = {"version": BUNDLE_VERSION, "file": "sounds.bin",
+             "sources": _sources(directory, SFX_ACCEPT),
+             "mixer": list(pg.mixer.get_init()), "sounds": {}}
+    offset = 0
+    with open(os.path.join(bundle_dir, index["file"]), "wb") as data:
+        for filename in sorted(os.listdir(directory)):
+            name, ext = os.path.splitext(filename)
+            if ext.lower() in SFX_ACCEPT:
+                raw = pg.mixer.Sound(os.path.join(directory, filename)).get_raw()
+                data.write(raw)
+                index["sounds"][name] = [offset, len(raw)]
+                offset += len(raw)
+    with open(os.path.join(bundle_dir, "sounds.json"), "w") as f:
+        json.dump(index, f)
+    return index
+
+
+def _read_index(bundle_dir, kind, directory, accept):
+    """Return the bundle index for kind, or None if missing or stale."""
+    try:
+        with open(os.path.join(bundle_dir, "{}.json".format(kind))) as f:
+            index = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if index.get("version") != BUNDLE_VERSION:
+        return None
+    if index["sources"] != _sources(directory, accept):
+        return None
+    if not os.path.isfile(os.path.join(bundle_dir, index["file"])):
+        return None
+    return index
+
+
+def _map(path):
+    """Memory map a bundle data file for reading."""
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _read_page(data, page):
+    """Copy an atlas page's pixels out of the bundle; safe from any thread."""
+    w, h = page["size"]
+    end = page["offset"]+w*h*len(page["format"])
+    return data[page["offset"]:end]
+
+
+def _make_page(pixels, page, colorkey):
+    """Make a surface from an atlas page, converted like tools.load_image."""
+    surface = pg.image.frombuffer(pixels, tuple(page["size"]), page["format"])
+    return tools.convert_image(surface, colorkey)
+
+
+def load_gfx(bundle_dir, directory, colorkey=(0,0,0), budget=None):
+    """
+    Return an AssetManager serving the graphics in directory from the
+    bundle in bundle_dir, or None if there is no up to date bundle.  Atlas
+    pages are loaded when first needed and each graphic is registered as
+    a piece of its page.
+    """
+    index = _read_index(bundle_dir, "graphics", directory, GFX_ACCEPT)
+    if index is None:
+        return None
+    data = _map(os.path.join(bundle_dir, index["file"]))
+    graphics = tools.AssetManager(budget, tools.surface_bytes)
+    for i, page in enumerate(index["pages"]):
+        graphics.register("_atlas_{}".format(i),
+                          lambda pixels, page=page: _make_page(pixels, page, colorkey),
+                          lambda page=page: _read_page(data, page))
+    for name, (page, x, y, w, h) in index["images"].items():
+        graphics.register_piece(name, "_atlas_{}".format(page), (x, y, w, h))
+    return graphics
+
+
+def load_sfx(bundle_dir, directory, budget=None):
+    """
+    Return an AssetManager serving the sounds in directory from the bundle
+    in bundle_dir, or None if there is no up to date bundle or it was
+    built for a different mixer format.
+    """
+    index = _read_index(bundle_dir, "sounds", directory, SFX_ACCEPT)
+    if index is None or list(pg.mixer.get_init() or []) != index["mixer"]:
+        return None
+    data = _map(os.path.join(bundle_dir, index["file"]))
+    effects = tools.AssetManager(budget, tools.sound_bytes)
+    for name, (offset, length) in index["sounds"].items():
+        view = memoryview(data)[offset:offset+length]
+        effects.register(name, lambda sound: sound,
+                         lambda view=view: pg.mixer.Sound(buffer=view))
+    return effects
+
+
+def main(resources="resources"):
+    """Build the bundle for the resources directory."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pg.mixer.pre_init(*MIXER)
+    pg.init()
+    bundle_dir = os.path.join(resources, "bundle")
+    if not os.path.isdir(bundle_dir):
+        os.makedirs(bundle_dir)
+    graphics = build_graphics(os.path.join(resources, "graphics"), bundle_dir)
+    sounds = build_sounds(os.path.join(resources, "sound"), bundle_dir)
+    print("Packed {} graphics onto {} pages and {} sounds into {}".format(
+        len(graphics["images"]), len(graphics["pages"]),
+        len(sounds["sounds"]), bundle_dir))
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
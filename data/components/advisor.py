@@ -1,4 +1,4 @@
-from .. import prepare
+from .. import prepare, tools
 from .animation import *
 from .dialog import *
 
@@ -13,15 +13,16 @@ class Advisor(object):
     margins = 25, 55
     max_size = 900, 150
     position = 10, 55
+    _font = tools.lazy_attribute(
+        lambda: pg.font.Font(prepare.FONTS["Saniretro"], 64))
+    _dialog_box = tools.lazy_attribute(lambda: GraphicBox(
+        pg.transform.smoothscale(prepare.GFX['callout'], (300, 300))))
 
     def __init__(self, draw_group, animation_group):
         self._draw_group = draw_group
         self._animations = animation_group
         self._animation_dict = dict()
         self._message_queue = list()
-        self._font = pg.font.Font(prepare.FONTS["Saniretro"], 64)
-        self._dialog_box = GraphicBox(
-            pg.transform.smoothscale(prepare.GFX['callout'], (300, 300)))
 
     @property
     def current_message(self):
@@ -1,12 +1,26 @@
 from .loggable import getLogger
+from ..scheduler import Scheduler
+from functools import partial
+from itertools import compress
 from math import sqrt, cos, sin, pi
 import pygame
 import sys
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-__all__ = ('Task', 'Animation', 'remove_animations_of')
+__all__ = ('Task', 'Animation', 'AnimationGroup', 'remove_animations_of',
+           'easing_table')
 
 logger = getLogger('animation')
 
+#Steps each transition is sampled at for its EasingTable.
+EASING_TABLE_SIZE = 1000
+#Steps where interpolating is further off than this are computed instead.
+EASING_TABLE_TOLERANCE = 1e-5
+EASING_TABLES = {}
+
 
 PY2 = sys.version_info[0] == 2
 string_types = None
@@ -54,6 +68,10 @@ class Task(pygame.sprite.Sprite):
         # chain tasks
         task = Task(call_later, 2500)
         task.chain(Task(something_else))
+
+    Tasks can be added to any sprite group that is updated, but an
+    AnimationGroup or a Scheduler (every State has one, as
+    State.scheduler) only spends time on them when they are due.
     """
     def __init__(self, callback, interval=0, loops=1, args=None, kwargs=None):
         assert (callable(callback))
@@ -67,6 +85,8 @@ class Task(pygame.sprite.Sprite):
         self._kwargs = kwargs if kwargs else dict()
         self._loops = loops
         self._chain = list()
+        self._scheduler = None
+        self._entry = None
 
     def chain(self, *others):
         """Schedule Task(s) to execute when this one is finished
@@ -94,18 +114,30 @@ class Task(pygame.sprite.Sprite):
         self._timer += dt
         if self._timer >= self.interval:
             self._timer -= self.interval
-            self.callback(*self._args, **self._kwargs)
-            if not self._loops == -1:
-                self._loops -= 1
-                if self._loops <= 0:
-                    self._execute_chain()
-                    self._chain = None
-                    self.kill()
+            self._fire()
+
+    def kill(self):
+        """Remove the Task from its groups and its Scheduler"""
+        if self._scheduler is not None:
+            self._scheduler.cancel(self)
+        super(Task, self).kill()
+
+    def _fire(self):
+        self.callback(*self._args, **self._kwargs)
+        if not self._loops == -1:
+            self._loops -= 1
+            if self._loops <= 0:
+                self._execute_chain()
+                self._chain = None
+                self.kill()
 
     def _execute_chain(self):
         groups = self.groups()
         for task in self._chain:
-            task.add(*groups)
+            if groups or self._scheduler is None:
+                task.add(*groups)
+            else:
+                self._scheduler.add(task)
 
 
 class Animation(pygame.sprite.Sprite):
@@ -139,6 +171,11 @@ class Animation(pygame.sprite.Sprite):
     You can optionally delay the start of the animation using the
     delay keyword.
 
+    Passing 'tabled=True' makes the animation look its transition up
+    in an EasingTable instead of computing it, which is cheaper for
+    the elastic, bounce and expo transitions, at the cost of an error
+    of about 1e-5 (see EasingTable and test/benchmark_easing.py).
+
 
     Callable Attributes
     ===================
@@ -174,9 +211,12 @@ class Animation(pygame.sprite.Sprite):
         self._initial = kwargs.get('initial', None)
         if isinstance(self._transition, string_types):
             self._transition = getattr(AnimationTransition, self._transition)
+        if kwargs.get('tabled', False):
+            self._transition = easing_table(self._transition).lookup
         self._elapsed = 0.
+        self._slots = None
         for key in ('duration', 'transition', 'round_values', 'delay',
-                    'initial'):
+                    'initial', 'tabled'):
             kwargs.pop(key, None)
         self.props = kwargs
 
@@ -201,6 +241,22 @@ class Animation(pygame.sprite.Sprite):
             else:
                 return self._initial
 
+    @staticmethod
+    def _get_setter(target, name):
+        """Get a function that sets the value of name on target
+
+        Used to look up once, when the animation starts, what
+        _set_value would do on every update.
+
+        :param target: object to be modified
+        :param name: name of attribute to be modified
+        :return: callable taking the value
+        """
+        attr = getattr(target, name)
+        if callable(attr):
+            return attr
+        return partial(setattr, target, name)
+
     @staticmethod
     def _set_value(target, name, value):
         """Set a value on some other object
@@ -243,15 +299,13 @@ class Animation(pygame.sprite.Sprite):
 
         p = min(1., self._elapsed / self._duration)
         t = self._transition(p)
-        for target, props in self.targets:
-            for name, values in props.items():
-                a, b = values
-                value = (a * (1. - t)) + (b * t)
+        for setter, a, b in self._slots:
+            value = (a * (1. - t)) + (b * t)
 
-                if self._round_values:
-                    value = int(round(value, 0))
+            if self._round_values:
+                value = int(round(value, 0))
 
-                self._set_value(target, name, value)
+            setter(value)
 
         if hasattr(self, 'update_callback'):
             self.update_callback()
@@ -267,15 +321,14 @@ class Animation(pygame.sprite.Sprite):
         :return: None
         """
         if self.targets is not None:
-            for target, props in self.targets:
-                for name, values in props.items():
-                    a, b = values
-                    self._set_value(target, name, b)
+            for setter, a, b in self._slots:
+                setter(b)
 
         if hasattr(self, 'update_callback'):
             self.update_callback()
 
         self.targets = None
+        self._slots = None
         self.kill()
         if hasattr(self, 'callback'):
             self.callback()
@@ -289,12 +342,200 @@ class Animation(pygame.sprite.Sprite):
         :param sprite: Any valid python object
         """
         self.targets = [(sprite, dict())]
+        slots = list()
         for target, props in self.targets:
             if isinstance(target, pygame.Rect):
                 logger.debug('pass "round_values=True" when using Rects')
             for name, value in self.props.items():
                 initial = self._get_value(target, name)
                 props[name] = initial, value
+                slots.append((self._get_setter(target, name), initial, value))
+        self._slots = slots
+
+
+class AnimationGroup(pygame.sprite.Group):
+    """Sprite group that updates its Animations together
+
+    Use it in place of a plain sprite group for Animations and
+    Tasks.  Tasks are kept in a Scheduler, self.timeline, which is
+    advanced after the Animations, so waiting Tasks take no time.
+    Other sprites are updated one by one, as usual, but
+    when numpy is available the started Animations are advanced
+    in one pass: their elapsed time, delay and duration, and the
+    start and end value of every attribute they change, are kept
+    in arrays, so each frame the progress of all of them and all
+    of the new values are computed together, and then applied with
+    the setters each Animation looked up when it was started.
+
+    The arrays are rebuilt whenever sprites are added or removed or
+    an Animation is started again, and the time they hold is copied
+    back to the Animations first, so Animations can move between
+    groups, be killed or finished as usual.
+
+    Transitions other than linear are computed for each Animation,
+    giving exactly the values a plain group would.  A group made with
+    'tabled=True' instead looks them up for all the Animations using
+    them at once, in their EasingTables; this only pays off for many
+    Animations sharing a costly transition (elastic, bounce or expo).
+
+    Animations that override update are updated one by one.
+    """
+    def __init__(self, *sprites, **kwargs):
+        self._batch = None
+        self.tabled = kwargs.get('tabled', False)
+        self.timeline = Scheduler()
+        super(AnimationGroup, self).__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        if isinstance(sprite, Task):
+            self.timeline.add(sprite)
+        else:
+            self._release()
+        super(AnimationGroup, self).add_internal(sprite, layer)
+
+    def remove_internal(self, sprite):
+        if isinstance(sprite, Task):
+            if sprite._scheduler is self.timeline:
+                self.timeline.cancel(sprite)
+        else:
+            self._release()
+        super(AnimationGroup, self).remove_internal(sprite)
+
+    def update(self, dt, *args):
+        """Update every sprite in the group
+
+        :param dt: Time passed since last update.
+        """
+        if numpy is None:
+            for sprite in self.sprites():
+                if not isinstance(sprite, Task):
+                    sprite.update(dt, *args)
+        else:
+            batch = self._batch
+            if batch is None or not batch.valid():
+                self._release()
+                batch = self._batch = _AnimationBatch(self.sprites(),
+                                                      self.tabled)
+            others = list(batch.others)
+            batch.update(dt)
+            for sprite in others:
+                sprite.update(dt, *args)
+        self.timeline.advance(dt)
+
+    def _release(self):
+        """Copy the batch's time back to its Animations and drop it"""
+        if self._batch is not None:
+            self._batch.release()
+            self._batch = None
+
+
+class _AnimationBatch(object):
+    """Packed arrays for the started Animations of an AnimationGroup"""
+    def __init__(self, sprites, tabled):
+        self.animations = list()
+        self.others = list()
+        self.checked = list()
+        for sprite in sprites:
+            if isinstance(sprite, Task):
+                continue
+            if isinstance(sprite, Animation):
+                self.checked.append((sprite, sprite._slots))
+                if (sprite._slots is not None and
+                        type(sprite).update is Animation.update):
+                    self.animations.append(sprite)
+                    continue
+            self.others.append(sprite)
+
+        animations = self.animations
+        self.elapsed = numpy.array([ani._elapsed for ani in animations])
+        self.delay = numpy.array([max(ani.delay, 0) for ani in animations],
+                                 dtype=float)
+        self.duration = numpy.array([ani._duration for ani in animations])
+
+        transitions = dict()
+        for i, ani in enumerate(animations):
+            transitions.setdefault(ani._transition, list()).append(i)
+        self.transitions = list()
+        for transition, indices in transitions.items():
+            table = getattr(transition, 'table', None)
+            if tabled and transition is not AnimationTransition.linear:
+                table = easing_table(transition)
+            self.transitions.append((transition, table, numpy.array(indices)))
+
+        self.values = list()
+        for round_values in (False, True):
+            owners, setters, starts, ends = list(), list(), list(), list()
+            for i, ani in enumerate(animations):
+                if bool(ani._round_values) == round_values:
+                    for setter, a, b in ani._slots:
+                        owners.append(i)
+                        setters.append(setter)
+                        starts.append(a)
+                        ends.append(b)
+            if setters:
+                self.values.append((round_values, numpy.array(owners),
+                                    setters, numpy.array(starts, dtype=float),
+                                    numpy.array(ends, dtype=float)))
+
+    def valid(self):
+        """False if an Animation has been started again"""
+        for ani, slots in self.checked:
+            if ani._slots is not slots:
+                return False
+        return True
+
+    def update(self, dt):
+        """Advance the Animations by dt"""
+        if not self.animations:
+            return
+        self.elapsed += dt
+        run = self.elapsed - self.delay
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            progress = numpy.where(self.duration > 0, run / self.duration, 1.)
+        progress = numpy.clip(progress, 0., 1.)
+
+        eased = numpy.empty_like(progress)
+        for transition, table, indices in self.transitions:
+            if table is not None:
+                eased[indices] = table.evaluate(progress[indices])
+            elif transition is AnimationTransition.linear:
+                eased[indices] = progress[indices]
+            else:
+                eased[indices] = [transition(p)
+                                  for p in progress[indices].tolist()]
+
+        started = run >= 0
+        everything_started = started.all()
+        for round_values, owners, setters, starts, ends in self.values:
+            t = eased[owners]
+            values = (starts * (1. - t)) + (ends * t)
+            if round_values:
+                values = numpy.round(values).astype(int)
+            values = values.tolist()
+            if not everything_started:
+                selected = started[owners].tolist()
+                setters = compress(setters, selected)
+                values = compress(values, selected)
+            for setter, value in zip(setters, values):
+                setter(value)
+
+        finished = (progress >= 1.).tolist()
+        for ani, ani_started, done in zip(list(self.animations),
+                                          started.tolist(), finished):
+            if not ani_started:
+                continue
+            if hasattr(ani, 'update_callback'):
+                ani.update_callback()
+            if done and ani.targets is not None:
+                ani.finish()
+
+    def release(self):
+        """Copy the time passed back to the Animations"""
+        for ani, elapsed in zip(self.animations, self.elapsed.tolist()):
+            if ani.delay > 0 and elapsed >= ani.delay:
+                elapsed -= ani.delay
+                ani.delay = 0
+            ani._elapsed = elapsed
 
 
 class AnimationTransition(object):
@@ -575,3 +816,82 @@ class AnimationTransition(object):
             return AnimationTransition._in_bounce_internal(p, 1.) * .5
         return AnimationTransition._out_bounce_internal(p - 1., 1.) * .5 + .5
 
+
+class EasingTable(object):
+    """A transition sampled at size + 1 evenly spaced points
+
+    Looking a value up, and interpolating linearly between the two
+    samples around it, takes the place of the trig and pow that
+    transitions like in_out_elastic and in_out_expo compute.  lookup
+    is a function that can be used in place of the transition, and
+    evaluate looks up a numpy array of progress values at once.
+
+    Steps where the transition bends too sharply for interpolating
+    to be within tolerance of it (at the corners of the bounce
+    transitions, and the ends of the circ ones) are marked, and
+    progress within those is computed with the transition instead.
+    Results are exact at 0 and 1.
+    """
+    def __init__(self, transition, size=EASING_TABLE_SIZE,
+                 tolerance=EASING_TABLE_TOLERANCE):
+        self.transition = transition
+        self.size = size
+        self.values = [transition(i / float(size)) for i in range(size + 1)]
+        self.exact = list()
+        for i, (a, b) in enumerate(zip(self.values, self.values[1:])):
+            middle = transition((i + .5) / size)
+            self.exact.append(abs(middle - (a + b) / 2.) > tolerance)
+        self.lookup = self._make_lookup()
+        if numpy is not None:
+            self.points = numpy.linspace(0., 1., size + 1)
+            self.array = numpy.array(self.values)
+            # one more so progress 1 can be looked up
+            self.exact_array = numpy.array(self.exact + [False])
+
+    def _make_lookup(self):
+        size = self.size
+        transition = self.transition
+        # the last value is repeated so progress 1 needs no special case
+        values = self.values + self.values[-1:]
+        steps = [None if exact else b - a for a, b, exact in
+                 zip(values, values[1:], self.exact)] + [0.]
+
+        def lookup(progress):
+            x = progress * size
+            i = int(x)
+            step = steps[i]
+            if step is None:
+                return transition(progress)
+            return values[i] + step * (x - i)
+
+        lookup.table = self
+        return lookup
+
+    def evaluate(self, progress):
+        """Look up every value of progress, a numpy array
+
+        :param progress: numpy array of values in the range 0-1
+        :return: numpy array
+        """
+        values = numpy.interp(progress, self.points, self.array)
+        exact = self.exact_array[(progress * self.size).astype(int)]
+        if exact.any():
+            values[exact] = [self.transition(p)
+                             for p in progress[exact].tolist()]
+        return values
+
+
+def easing_table(transition):
+    """Get the EasingTable of a transition, sampling it the first time
+
+    :param transition: name of an AnimationTransition, or a function
+    :return: EasingTable
+    """
+    if isinstance(transition, string_types):
+        transition = getattr(AnimationTransition, transition)
+    table = getattr(transition, 'table', None)
+    if table is None:
+        table = EASING_TABLES.get(transition)
+        if table is None:
+            table = EASING_TABLES[transition] = EasingTable(transition)
+    return table
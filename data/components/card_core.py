@@ -0,0 +1,228 @@
+"""
+Playing cards as small integers, for game rules and simulations that
+don't need sprites.  A card is an int from 0 to 51: card // 13 is the
+index of its suit in SUITS and card % 13 + 1 its value (1 for Ace up to
+13 for King), so a new deck in order is simply range(52), ordered like
+the decks components.cards.Deck has always made.
+
+Decks are kept in array('B') buffers (one byte a card), and a Shoe deals
+from one or more decks shuffled in a buffer, using NumPy when it is
+installed.  Nothing here imports pygame; components.cards.Card is the
+sprite that shows a card on screen, made from its code only when the card
+is dealt.
+"""
+
+from array import array
+import random
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+SUITS = ("Clubs", "Hearts", "Diamonds", "Spades")
+VALUE_NAMES = {1: "Ace",
+               2: "Two",
+               3: "Three",
+               4: "Four",
+               5: "Five",
+               6: "Six",
+               7: "Seven",
+               8: "Eight",
+               9: "Nine",
+               10: "Ten",
+               11: "Jack",
+               12: "Queen",
+               13: "King"}
+DECK_SIZE = 52
+SUIT_INDICES = {name.lower(): index for index, name in enumerate(SUITS)}
+
+
+def make_card(value, suit):
+    """
+    Return the card of value (1-13) and suit (an index into SUITS or a
+    suit name in any case).
+    """
+    if not isinstance(suit, int):
+        suit = SUIT_INDICES[suit.lower()]
+    return suit*13 + value - 1
+
+
+def value(card):
+    """Value of card, from 1 (Ace) to 13 (King)."""
+    return card % 13 + 1
+
+
+def suit(card):
+    """Index of card's suit in SUITS."""
+    return card // 13
+
+
+def suit_name(card):
+    return SUITS[card // 13]
+
+
+def long_name(card):
+    """E.g. "Ace of Spades" or "Two of Clubs"."""
+    return "{} of {}".format(VALUE_NAMES[card % 13 + 1], SUITS[card // 13])
+
+
+def name(card):
+    """E.g. "Ace of Spades" or "2 of Clubs", as used for the card images."""
+    card_value = card % 13 + 1
+    if 1 < card_value < 11:
+        return "{} of {}".format(card_value, SUITS[card // 13])
+    return long_name(card)
+
+
+def short_name(card):
+    """E.g. "AS" or "2C"."""
+    card_value = card % 13 + 1
+    if 1 < card_value < 11:
+        return "{}{}".format(card_value, SUITS[card // 13][0])
+    return "{}{}".format(VALUE_NAMES[card_value][0], SUITS[card // 13][0])
+
+
+def new_deck(num_decks=1):
+    """Return num_decks decks of cards, in order, as an array."""
+    return array('B', range(DECK_SIZE)) * num_decks
+
+
+def shuffle(cards, rng=random):
+    """Shuffle a deck in place with rng (a random.Random or the random module)."""
+    rng.shuffle(cards)
+
+
+def blackjack_scores(cards):
+    """
+    Return every total of cards counting each Ace as 1 or 11 (face cards
+    count 10), one for each way of counting the Aces.
+    """
+    total = 0
+    aces = 0
+    for card in cards:
+        card_value = card % 13 + 1
+        if card_value == 1:
+            aces += 1
+        total += min(card_value, 10)
+    if not aces:
+        return [total]
+    #Each Ace doubles the ways, as Hand.get_scores always listed them.
+    scores = [total]
+    for _ in range(aces):
+        scores = [score + extra for score in scores for extra in (0, 10)]
+    return scores
+
+
+def baccarat_points(cards):
+    """Baccarat points of cards: their total mod 10, with face cards worth 0."""
+    return sum(card % 13 + 1 for card in cards if card % 13 < 9) % 10
+
+
+class Shoe(object):
+    """
+    Cards dealt from num_decks shuffled decks. The shoe is shuffled into a
+    buffer once, and dealing only moves an index through it, so draw is
+    O(1) and deal(n) takes n cards in one slice. counts holds how many of
+    each card (by code) are left, kept up to date as cards are dealt.
+
+    The cut card is placed so that a penetration fraction of the cards are
+    dealt before the shoe needs shuffling: once it is reached draw returns
+    None and deal returns no cards until reset or refill is called.
+
+    The shoe is shuffled with rng (the random module by default), so a
+    seeded rng always deals the same cards. If vectorized is True the
+    cards are kept in a NumPy array and shuffled by a NumPy permutation
+    (seeded from rng), which is much faster for big shoes and bulk deals;
+    the order then differs from the one rng.shuffle gives. By default
+    NumPy is used if it is installed; games pass vectorized=False so that
+    they deal the same cards with or without it (and replays match).
+    """
+    def __init__(self, num_decks=1, penetration=1.0, shuffled=True,
+                 rng=random, vectorized=None):
+        if vectorized is None:
+            vectorized = numpy is not None
+        elif vectorized and numpy is None:
+            raise ImportError("a vectorized Shoe needs NumPy")
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.shuffled = shuffled
+        self.rng = rng
+        self.vectorized = vectorized
+        self.reset()
+
+    def __len__(self):
+        """The number of cards left in the shoe, including any behind the cut."""
+        return self.left
+
+    @property
+    def needs_shuffle(self):
+        """True once the cut card has been reached."""
+        return self.left <= self.cut
+
+    def reset(self):
+        """Put all num_decks decks back in the shoe and shuffle it."""
+        self.refill(new_deck(self.num_decks))
+
+    def refill(self, cards):
+        """Replace the cards in the shoe with cards (codes) and shuffle it."""
+        if self.vectorized:
+            if not isinstance(cards, (array, numpy.ndarray)):
+                cards = list(cards)
+            cards = numpy.array(cards, dtype=numpy.uint8)
+            if self.shuffled:
+                seed = self.rng.getrandbits(64)
+                cards = numpy.random.default_rng(seed).permutation(cards)
+            self.counts = numpy.bincount(cards, minlength=DECK_SIZE)
+        else:
+            cards = array('B', cards)
+            if self.shuffled:
+                self.rng.shuffle(cards)
+            self.counts = array('L', [0]) * DECK_SIZE
+            for card in cards:
+                self.counts[card] += 1
+        #Cards are dealt from the end of the buffer, like popping a list.
+        self.cards = cards
+        self.left = len(cards)
+        self.cut = len(cards) - int(round(len(cards)*self.penetration))
+
+    def remaining(self):
+        """The cards left in the shoe, the next to be dealt last."""
+        return self.cards[:self.left]
+
+    def draw(self):
+        """Deal one card, or return None if the cut card has been reached."""
+        if self.left <= self.cut:
+            return None
+        self.left -= 1
+        card = int(self.cards[self.left])
+        self.counts[card] -= 1
+        return card
+
+    def deal(self, n):
+        """
+        Deal n cards (fewer if the cut card is reached first), returned in
+        the order they were dealt as an array, or a NumPy array if
+        vectorized.
+        """
+        start = max(self.left - n, self.cut)
+        if start >= self.left:
+            return self.cards[:0]
+        cards = self.cards[start:self.left]
+        self.left = start
+        if self.vectorized:
+            cards = cards[::-1].copy()
+            self.counts -= numpy.bincount(cards, minlength=DECK_SIZE)
+        else:
+            cards.reverse()
+            for card in cards:
+                self.counts[card] -= 1
+        return cards
+
+    def value_counts(self):
+        """How many cards of each value (index 0 for Aces) are left."""
+        counts = self.counts
+        if self.vectorized:
+            return counts.reshape(4, 13).sum(axis=0).tolist()
+        return [sum(counts[value::13]) for value in range(13)]
@@ -1,25 +1,58 @@
 import os
-from random import shuffle
 import pygame as pg
 from .. import prepare
+from ..components import card_core
 from ..components.angles import get_angle, project
 
 
+#Card images shared by every Card, keyed by (image name, size, angle).
+#Faces are named like their graphic (e.g. "ace_of_spades"), backs "back".
+CARD_IMAGES = {}
+
+
+def card_image(name, size, angle=0):
+    """
+    Return the image of a card face (or the back, if name is "back")
+    scaled to size and rotated angle degrees. Images are made once and
+    shared, so must not be drawn on.
+    """
+    size = tuple(size)
+    angle %= 360
+    key = (name, size, angle)
+    try:
+        return CARD_IMAGES[key]
+    except KeyError:
+        pass
+    if angle:
+        image = pg.transform.rotate(card_image(name, size), angle)
+    elif name == "back":
+        image = make_back_image(size)
+    else:
+        image = pg.transform.scale(prepare.GFX[name], size)
+    CARD_IMAGES[key] = image
+    return image
+
+
+def make_back_image(size):
+    """Draw the back of a card."""
+    back_image = pg.Surface(size).convert()
+    back_image.fill(pg.Color("dodgerblue"))
+    snake = prepare.GFX["pysnakeicon"]
+    s_rect = snake.get_rect().fit(back_image.get_rect())
+    s_rect.midbottom = back_image.get_rect().midbottom
+    snake = pg.transform.scale(snake, s_rect.size)
+    back_image.blit(snake, s_rect)
+    pg.draw.rect(back_image, pg.Color("gray95"), back_image.get_rect(), 4)
+    pg.draw.rect(back_image, pg.Color("gray20"), back_image.get_rect(), 1)
+    return back_image
+
+
 class Card(pg.sprite.Sprite):
-    """Class to represent a single playing card."""
-    card_names = {1: "Ace",
-                           2: "Two",
-                           3: "Three",
-                           4: "Four",
-                           5: "Five",
-                           6: "Six",
-                           7: "Seven",
-                           8: "Eight",
-                           9: "Nine",
-                           10: "Ten",
-                           11: "Jack",
-                           12: "Queen",
-                           13: "King"}
+    """
+    Class to represent a single playing card on screen. code is the card
+    as an int (see card_core), for game rules to work with.
+    """
+    card_names = card_core.VALUE_NAMES
 
     def __init__(self, value, suit, card_size, speed):
         super(Card, self).__init__()
@@ -27,13 +60,11 @@ class Card(pg.sprite.Sprite):
         self.speed = speed
         self.value = value
         self.suit = suit
-        self.long_name = "{} of {}".format(self.card_names[self.value], self.suit)
-        if 1 < self.value < 11:
-            self.name = "{} of {}".format(self.value, self.suit)
-            self.short_name = "{}{}".format(self.value, self.suit[0])
-        else:
-            self.name = self.long_name
-            self.short_name = "{}{}".format(self.card_names[self.value][0], self.suit[0])
+        self.code = code = card_core.make_card(value, suit)
+        self.long_name = card_core.long_name(code)
+        self.name = card_core.name(code)
+        self.short_name = card_core.short_name(code)
+        self.angle = 0
         self.load_images()
         self.rect = self.image.get_rect()
         self.pos = self.rect.center
@@ -41,19 +72,26 @@ class Card(pg.sprite.Sprite):
         
         
 
+    @classmethod
+    def from_code(cls, code, card_size, speed):
+        """Make the Card showing the card code."""
+        return cls(card_core.value(code), card_core.suit_name(code),
+                   card_size, speed)
+
     def load_images(self):
+        """Set the face and back images for the card's size and angle."""
         img_name = self.name.lower().replace(" ", "_")
-        image = prepare.GFX[img_name]
-        self.image = pg.transform.scale(image, self.card_size)
-        self.back_image = pg.Surface(self.card_size).convert()
-        self.back_image.fill(pg.Color("dodgerblue"))
-        snake = prepare.GFX["pysnakeicon"]
-        s_rect = snake.get_rect().fit(self.back_image.get_rect())
-        s_rect.midbottom = self.back_image.get_rect().midbottom
-        snake = pg.transform.scale(snake, s_rect.size)
-        self.back_image.blit(snake, s_rect)
-        pg.draw.rect(self.back_image, pg.Color("gray95"), self.back_image.get_rect(), 4)
-        pg.draw.rect(self.back_image, pg.Color("gray20"), self.back_image.get_rect(), 1)
+        self.image = card_image(img_name, self.card_size, self.angle)
+        self.back_image = card_image("back", self.card_size, self.angle)
+
+    def rotate(self, angle):
+        """
+        Turn the card's images a further angle degrees (counterclockwise)
+        and resize its rect to fit them, keeping its center.
+        """
+        self.angle = (self.angle + angle) % 360
+        self.load_images()
+        self.rect = self.image.get_rect(center=self.rect.center)
 
     def draw(self, surface):
         if self.face_up:
@@ -73,10 +111,16 @@ class Deck(object):
     the deck will be shuffled upon creation. If reuse_discards is True, the
     discard pile will replenish the deck on exhaustion. If infinite is True, the
     deck will replenish itself with a new deck upon exhaustion. Reusing
-    discards supersedes infinite replenishment.
+    discards supersedes infinite replenishment. penetration is the fraction
+    of the cards dealt before the deck counts as exhausted (the cut card).
+
+    The cards still in the deck are kept as codes in a card_core.Shoe,
+    drawn face down; a Card sprite is only made for a card when it is
+    drawn from the deck.
     """
     def __init__(self, topleft, card_size=prepare.CARD_SIZE, card_speed=16.0,
-                        default_shuffle=True, reuse_discards=True, infinite=False):
+                        default_shuffle=True, reuse_discards=True, infinite=False,
+                        num_decks=1, penetration=1.0):
         self.topleft = topleft
         self.card_size = card_size
         self.card_speed = card_speed
@@ -85,25 +129,15 @@ class Deck(object):
         self.default_shuffle = default_shuffle
         self.reuse_discards= reuse_discards
         self.infinite = infinite
-        self.num_decks = 1
-        self.cards = self.make_cards()
+        self.num_decks = num_decks
+        #Shuffled like a list of cards, so the deal doesn't depend on NumPy.
+        self.shoe = card_core.Shoe(num_decks, penetration, default_shuffle,
+                                   vectorized=False)
         self.discards = []
 
 
     def __len__(self):
-        return len(self.cards)
-
-    def make_cards(self):
-        """Return a list of Cards."""
-        suits = ("Clubs", "Hearts", "Diamonds", "Spades")
-        cards = [Card(i, suit, self.card_size, self.card_speed)
-                     for suit in suits for i in range(1, 14)]
-        for _ in range(self.num_decks - 1):
-            cards.extend([Card(i, suit, self.card_size, self.card_speed)
-                                 for suit in suits for i in range(1, 14)])
-        if self.default_shuffle:
-            shuffle(cards)
-        return cards
+        return len(self.shoe)
 
     def discard(self, card):
         """Add card to deck's discards."""
@@ -111,29 +145,39 @@ class Deck(object):
 
     def burn(self):
         """Add top card of deck to discards."""
-        self.discards.append(self.cards.pop())
+        code = self.shoe.draw()
+        if code is not None:
+            self.discards.append(self.view(code))
 
     def draw_card(self):
         """
         Draw top card from deck. If deck is exhausted
         deck will be replenished according to deck options.
         """
-        try:
-            return self.cards.pop()
-        except IndexError:
+        code = self.shoe.draw()
+        if code is None:
             if self.reuse_discards and self.discards:
-                self.cards = self.discards
-                for card in self.cards:
-                    card.face_up = False
-                if self.default_shuffle:
-                    shuffle(self.cards)
+                #Cards behind the cut go back in with the discards.
+                cards = list(self.shoe.remaining())
+                cards.extend(card.code for card in self.discards)
+                self.shoe.refill(cards)
                 self.discards = []
-                return self.cards.pop()
             elif self.infinite:
-                self.cards = self.make_cards()
-                return self.cards.pop()
+                self.shoe.reset()
             else:
                 return None
+            code = self.shoe.draw()
+        return self.view(code)
+
+    def view(self, code):
+        """
+        Return a face down Card showing the card code, placed where the top
+        of the deck is drawn.
+        """
+        card = Card.from_code(code, self.card_size, self.card_speed)
+        card.rect.topleft = self.pile_position(self.topleft, len(self.shoe))
+        card.pos = card.rect.center
+        return card
 
     def make_hand(self, num_cards=5):
         """Create a hand of cards."""
@@ -155,10 +199,25 @@ class Deck(object):
                 left += x_offset
                 top += y_offset
 
+    def draw_backs(self, surface, count, lefttop, x_offset=2,
+                            y_offset=-1, toggle_num=4):
+        """Draw count face down cards to surface as draw_pile would."""
+        back = card_image("back", self.card_size)
+        left, top = lefttop
+        surface.blits([(back, (left + x_offset*(i//toggle_num),
+                               top + y_offset*(i//toggle_num)))
+                       for i in range(count)], False)
+
+    @staticmethod
+    def pile_position(lefttop, index, x_offset=2, y_offset=-1, toggle_num=4):
+        """Topleft of the card at index in a pile drawn by draw_pile."""
+        offset = index // toggle_num
+        return lefttop[0] + x_offset*offset, lefttop[1] + y_offset*offset
+
     def draw(self, surface):
         """Draw deck and discard pile to surface."""
         self.draw_pile(surface, self.discards, self.discard_rect.topleft)
-        self.draw_pile(surface, self.cards, self.topleft)
+        self.draw_backs(surface, len(self.shoe), self.topleft)
 
 
 class MultiDeck(Deck):
@@ -167,10 +226,5 @@ class MultiDeck(Deck):
     def __init__(self, num_decks, card_size=prepare.CARD_SIZE, card_speed=20.0,
                         default_shuffle=True, reuse_discards=True, shuffle_discards=True,
                         infinite=False):
-        super(MultiDeck, self).__init__(card_size, card_speed, default_shuffle,
-                                                      reuse_discards, infinite)
-        self.num_decks = num_decks
-        for _ in range(num_decks - 1):
-            self.cards.extend(self.make_cards())
-        if self.default_shuffle:
-            shuffle(self.cards)
+        super(MultiDeck, self).__init__((0, 0), card_size, card_speed, default_shuffle,
+                                                      reuse_discards, infinite, num_decks)
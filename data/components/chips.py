@@ -2,7 +2,7 @@ from collections import OrderedDict, defaultdict
 from random import choice
 
 import pygame as pg
-from .. import prepare
+from .. import prepare, tools
 from .labels import Label
 
 
@@ -33,7 +33,9 @@ class Chip(object):
                                ("green", 10),
                                ("red", 5),
                                ("white", 1)])
-    images, flat_images = get_chip_images()
+    _all_images = tools.lazy_attribute(get_chip_images)
+    images = tools.lazy_attribute(lambda: Chip._all_images[0])
+    flat_images = tools.lazy_attribute(lambda: Chip._all_images[1])
     thicknesses = {19: 5, 30: 7}
 
 
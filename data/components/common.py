@@ -21,9 +21,9 @@ E_MOUSE_MOVE = 'mouse-move'
 E_MOUSE_LEAVE = 'mouse-leave'
 
 
-def getLabel(name, position, text, settings):
+def getLabel(name, position, text, settings, label_class=labels.Label):
     """Return a label using properties defined in the settings dictionary"""
-    return labels.Label(
+    return label_class(
         path=settings["{}-font".format(name)],
         color=settings["{}-font-color".format(name)],
         size=settings["{}-font-size".format(name)],
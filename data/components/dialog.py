@@ -1,6 +1,7 @@
 from itertools import product
 from pygame import Rect, RLEACCEL
 import pygame
+from . import text_cache, text_layout
 
 __all__ = ('GraphicBox', 'draw_text')
 
@@ -66,6 +67,10 @@ def draw_text(surface, text, rect, font=None, fg_color=None, bg_color=None, aa=F
     automatically wraps words
     returns size and any text that didn't get blit
     passing None as the surface is ok
+
+    line breaks are worked out by text_layout.wrap and remembered, and
+    lines are rendered through text_cache, so measuring text and then
+    drawing it, or drawing the same text every frame, is cheap
     """
     if fg_color is None:
         fg_color = (0, 0, 0)
@@ -87,41 +92,33 @@ def draw_text(surface, text, rect, font=None, fg_color=None, bg_color=None, aa=F
         aa = 0
         bg_color = None
 
-    while text:
-        char_index = 1
-
+    for start, end, line_width in text_layout.wrap(font, text, rect.width):
         # determine if the row of text will be outside our area
         if y + font_height > rect.bottom:
-            break
-
-        # determine maximum width of line
-        line_width = font.size(text[:char_index])[0]
-        while line_width < rect.width and char_index < len(text):
-            if text[char_index] == "\n":
-                text = text[:char_index] + text[char_index + 1:]
-                break
-
-            char_index += 1
-            line_width = font.size(text[:char_index])[0]
-            total_width = max(total_width, line_width)
-        else:
-            # if we've wrapped the text, then adjust the wrap to the last word
-            if char_index < len(text):
-                char_index = text.rfind(" ", 0, char_index) + 1
+            return total_width, text[start:]
+
+        total_width = max(total_width, line_width)
 
         if surface:
-            # render the line and blit it to the surface
+            # render the line (or reuse the last render) and blit it
+            line = text[start:end]
             if bg_color:
-                image = font.render(text[:char_index], 1, fg_color, bg_color)
-                image.set_colorkey(bg_color)
+                key = ("draw_text", font, line, text_cache.color_key(fg_color),
+                       text_cache.color_key(bg_color))
+                image = text_cache.CACHE.get(key, lambda: _render_keyed(
+                    font, line, fg_color, bg_color))
             else:
-                image = font.render(text[:char_index], aa, fg_color)
+                image = text_cache.render(font, line, aa, fg_color)
 
             surface.blit(image, (rect.left, y))
 
         y += font_height + line_spacing
 
-        # remove the text we just blitted
-        text = text[char_index:]
+    return total_width, ""
+
 
-    return total_width, text
+def _render_keyed(font, text, fg_color, bg_color):
+    """Render text antialiased against bg_color, then make bg_color clear."""
+    image = font.render(text, 1, fg_color, bg_color)
+    image.set_colorkey(bg_color)
+    return image
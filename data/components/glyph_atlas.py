@@ -0,0 +1,150 @@
+"""
+Glyph atlases for text that changes often, such as balances and counters.
+An atlas renders every character of a font at one size and color once,
+onto a single surface.  Strings are then put together by blitting pieces
+of the atlas, without rendering through the font.  Characters missing
+from CHARSET are rendered the first time they are used.
+
+Characters are placed one after another by their advance, so kerning is
+ignored; the project fonts have none, so the result matches font.render.
+Some characters (like "$" in PerfectDOSVGA437) reach above the font's
+ascent, and font.render moves the whole line down to fit them.  Atlas text
+is always drawn as if it held the tallest characters of the charset, so it
+may be lower and taller than font.render gives for text without them.
+"""
+
+import string
+
+import pygame as pg
+from . import text_cache
+
+
+CHARSET = string.digits+string.ascii_letters+string.punctuation+" "
+
+LOADED_ATLASES = {}
+
+
+class GlyphAtlas(object):
+    """Pre-rendered characters of font in color."""
+    def __init__(self, font, color, charset=CHARSET):
+        self.font = font
+        self.color = color
+        self.blanks = {}
+        glyphs = [(char, font.render(char, True, color)) for char in charset]
+        #How far the tallest characters push the baseline down
+        self.top = max([self._top(char) for char in charset] + [0])
+        self.height = max([font.get_height()] +
+                          [self.top - self._top(char) + glyph.get_height()
+                           for char, glyph in glyphs])
+        width = sum(glyph.get_width() for char, glyph in glyphs)
+        self.image = pg.Surface((max(width, 1), self.height), pg.SRCALPHA)
+        self.glyphs = {}
+        x = 0
+        for char, glyph in glyphs:
+            self.glyphs[char] = self._place(self.image, x, char, glyph)
+            x += glyph.get_width()
+
+    def _top(self, char):
+        """How far char alone is drawn below the top of the font."""
+        metrics = self.font.metrics(char)[0]
+        if metrics is None:
+            return 0
+        return max(0, metrics[3] - self.font.get_ascent())
+
+    def _place(self, image, x, char, glyph):
+        """
+        Put glyph, rendered char, on image at x, on the atlas baseline.
+        Returns image with the area of it the character takes up.
+        """
+        position = (x, self.top - self._top(char))
+        #Adding to transparent pixels copies the glyph exactly
+        image.blit(glyph, position, special_flags=pg.BLEND_RGBA_ADD)
+        return image, pg.Rect(x, 0, glyph.get_width(), self.height)
+
+    def glyph(self, char):
+        """Return the surface holding char and the area it takes up."""
+        try:
+            return self.glyphs[char]
+        except KeyError:
+            glyph = self.font.render(char, True, self.color)
+            image = pg.Surface((glyph.get_width(), self.height), pg.SRCALPHA)
+            self.glyphs[char] = self._place(image, 0, char, glyph)
+            return self.glyphs[char]
+
+    def render(self, text, bg=None):
+        """
+        Return a new surface with text on it, like font.render(text, True,
+        color, bg) would.
+        """
+        glyphs = [self.glyph(char) for char in text]
+        width = sum(area.width for image, area in glyphs)
+        blits = []
+        if bg is None:
+            surface = pg.Surface((width, self.height), pg.SRCALPHA)
+            flags = pg.BLEND_RGBA_ADD
+        else:
+            surface = pg.Surface((width, self.height))
+            blank = self._blank(bg, width)[0]
+            blits.append((blank, (0, 0), (0, 0, width, self.height), 0))
+            flags = 0
+        x = 0
+        for image, area in glyphs:
+            blits.append((image, (x, 0), area, flags))
+            x += area.width
+        surface.blits(blits, False)
+        return surface
+
+    def redraw(self, surface, old_text, text, bg=None):
+        """
+        Change surface, made by render(old_text, bg), to show text by
+        redrawing only the characters that differ. Returns False without
+        changing surface if the characters of text don't line up with
+        those of old_text.
+        """
+        if len(text) != len(old_text):
+            return False
+        changes = []
+        x = 0
+        for old, new in zip(old_text, text):
+            image, area = self.glyph(new)
+            if area.width != self.glyph(old)[1].width:
+                return False
+            if new != old:
+                changes.append((image, (x, 0), area))
+            x += area.width
+        if not changes:
+            return True
+        width = max(area.width for image, position, area in changes)
+        blank, clear_flags = self._blank(bg, width)
+        flags = pg.BLEND_RGBA_ADD if bg is None else 0
+        blits = []
+        for image, position, area in changes:
+            blits.append((blank, position, (0, 0)+area.size, clear_flags))
+            blits.append((image, position, area, flags))
+        surface.blits(blits, False)
+        return True
+
+    def _blank(self, bg, width):
+        """
+        Return a surface at least width wide for clearing characters off
+        text drawn on bg, with the flags to blit it with. Blitting is used
+        as it is much faster than filling small areas.
+        """
+        key = text_cache.color_key(bg)
+        blank = self.blanks.get(key)
+        if blank is None or blank.get_width() < width:
+            if bg is None:
+                blank = pg.Surface((width, self.height), pg.SRCALPHA)
+            else:
+                blank = pg.Surface((width, self.height))
+                blank.fill(bg)
+            self.blanks[key] = blank
+        return blank, (pg.BLEND_RGBA_MULT if bg is None else 0)
+
+
+def get_atlas(font, color):
+    """Return the atlas for font (a pg.font.Font) in color, making it once."""
+    key = (font, text_cache.color_key(color))
+    if key not in LOADED_ATLASES:
+        LOADED_ATLASES[key] = GlyphAtlas(font, color)
+    return LOADED_ATLASES[key]
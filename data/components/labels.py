@@ -2,6 +2,7 @@ from itertools import cycle
 
 import pygame as pg
 from .. import prepare, tools
+from . import text_cache, text_layout, glyph_atlas
 import string
 
 
@@ -31,26 +32,6 @@ BUTTON_DEFAULTS = {"call"               : None,
                    "bindings"           : ()}
 
 
-#Helper function for MultiLineLabel class
-def wrap_text(text, char_limit, separator=" "):
-    """Splits a string into a list of strings no longer than char_limit."""
-    words = text.split(separator)
-    lines = []
-    current_line = []
-    current_length = 0
-    for word in words:
-        if len(word) + current_length <= char_limit:
-            current_length += len(word) + len(separator)
-            current_line.append(word)
-        else:
-            lines.append(separator.join(current_line))
-            current_line = [word]
-            current_length = len(word) + len(separator)
-    if current_line:
-        lines.append(separator.join(current_line))
-    return lines
-
-
 def _parse_color(color):
     if color is not None:
         try:
@@ -60,7 +41,28 @@ def _parse_color(color):
     return color
 
 
-class Label(object):
+class _SharedImageMixin(object):
+    """
+    For labels whose image may be shared through text_cache. self.own_image
+    should be False while self.image is shared.
+    """
+    def _copy_image(self):
+        """Give the label its own copy of the shared image to change."""
+        if not self.own_image:
+            self.image = self.image.copy()
+            self.own_image = True
+        return self.image
+
+    def set_alpha(self, alpha):
+        """Set the alpha of self.image."""
+        self._copy_image().set_alpha(alpha)
+
+    def set_colorkey(self, color):
+        """Set the colorkey of self.image."""
+        self._copy_image().set_colorkey(color)
+
+
+class Label(_SharedImageMixin):
     """
     Parent class all labels inherit from. Color arguments can use color names
     or an RGB tuple. rect_attr should be a dict with keys of pygame.Rect
@@ -69,6 +71,10 @@ class Label(object):
     Creates a surface with text blitted to it (self.image) and an associated
     rectangle (self.rect). Label will have a transparent bg if
     bg is not passed to __init__.
+
+    Rendered text is shared through text_cache with every label showing
+    the same thing, so use set_alpha and set_colorkey rather than changing
+    self.image directly.
     """
     def __init__(self, path, size, text, color, rect_attr, bg=None):
         self.path, self.size = path, size
@@ -87,11 +93,9 @@ class Label(object):
 
     def update_text(self):
         """Update the surface using the current properties and text."""
-        if self.bg:
-            render_args = (self.text, True, self.color, self.bg)
-        else:
-            render_args = (self.text, True, self.color)
-        self.image = self.font.render(*render_args)
+        self.image = text_cache.render(self.font, self.text, True,
+                                       self.color, self.bg or None)
+        self.own_image = False
         self.rect = self.image.get_rect(**self.rect_attr)
 
     def draw(self, surface):
@@ -99,6 +103,34 @@ class Label(object):
         surface.blit(self.image, self.rect)
 
 
+class GlyphLabel(Label):
+    """
+    A Label built from pre-rendered characters (see glyph_atlas) instead of
+    being rendered by the font, for money and counter displays that change
+    often. Takes the same arguments as Label.
+
+    Keep the label and call set_text: text that hasn't changed isn't drawn
+    again, and when only some characters change just those are redrawn,
+    in place, so self.image keeps any alpha or colorkey that was set.
+    """
+    def __init__(self, path, size, text, color, rect_attr, bg=None):
+        self.drawn = None
+        super(GlyphLabel, self).__init__(path, size, text, color, rect_attr, bg)
+
+    def update_text(self):
+        """Update the surface using the current properties and text."""
+        atlas = glyph_atlas.get_atlas(self.font, self.color)
+        bg = self.bg or None
+        if self.drawn != (self.text, atlas, bg):
+            redrawn = (self.drawn is not None and self.drawn[1:] == (atlas, bg)
+                       and atlas.redraw(self.image, self.drawn[0], self.text, bg))
+            if not redrawn:
+                self.image = atlas.render(self.text, bg)
+                self.own_image = True
+            self.drawn = (self.text, atlas, bg)
+        self.rect = self.image.get_rect(**self.rect_attr)
+
+
 # Should probably be depracated with Labels turned into sprites so that
 # They can use standard sprite groups.
 class GroupLabel(Label):
@@ -108,29 +140,42 @@ class GroupLabel(Label):
         group.append(self)
 
 
-class MultiLineLabel(object):
-    """Creates a single surface with multiple labels blitted to it."""
+class MultiLineLabel(_SharedImageMixin):
+    """
+    Creates a single surface with multiple labels blitted to it. The
+    surface is shared through text_cache with other MultiLineLabels showing
+    the same text, so use set_alpha and set_colorkey to change it.
+    """
     def __init__(self, path, size, text, color, rect_attr,
                  bg=None, char_limit=42, align="left", vert_space=0):
+        key = ("MultiLineLabel", path, size, text, text_cache.color_key(color),
+               text_cache.color_key(bg), char_limit, align, vert_space)
+        self.image = text_cache.CACHE.get(key, lambda: self.make_image(
+            path, size, text, color, bg, char_limit, align, vert_space))
+        self.own_image = False
+        self.rect = self.image.get_rect(**rect_attr)
+
+    @staticmethod
+    def make_image(path, size, text, color, bg, char_limit, align, vert_space):
         attr = {"center": (0, 0)}
-        lines = wrap_text(text, char_limit)
+        lines = text_layout.wrap_words(text, char_limit)
         labels = [Label(path, size, line, color, attr, bg) for line in lines]
         width = max([label.rect.width for label in labels])
         spacer = vert_space*(len(lines)-1)
         height = sum([label.rect.height for label in labels])+spacer
-        self.image = pg.Surface((width, height)).convert()
-        self.image.set_colorkey(pg.Color("black"))
-        self.image.fill(pg.Color("black"))
-        self.rect = self.image.get_rect(**rect_attr)
+        image = pg.Surface((width, height)).convert()
+        image.set_colorkey(pg.Color("black"))
+        image.fill(pg.Color("black"))
         aligns = {"left"  : {"left": 0},
-                  "center": {"centerx": self.rect.width//2},
-                  "right" : {"right": self.rect.width}}
+                  "center": {"centerx": width//2},
+                  "right" : {"right": width}}
         y = 0
         for label in labels:
             label.rect = label.image.get_rect(**aligns[align])
             label.rect.top = y
-            label.draw(self.image)
+            label.draw(image)
             y += label.rect.height+vert_space
+        return image
 
     def draw(self, surface):
         surface.blit(self.image, self.rect)
@@ -228,8 +273,8 @@ class ButtonGroup(pg.sprite.Group):
 
 
 class Button(pg.sprite.Sprite, tools._KwargMixin):
-    _invisible = pg.Surface((1,1)).convert_alpha()
-    _invisible.fill((0,0,0,0))
+    #SRCALPHA surfaces start transparent and need no display to create
+    _invisible = pg.Surface((1,1), pg.SRCALPHA)
 
     def __init__(self, rect_style, *groups, **kwargs):
         super(Button, self).__init__(*groups)
@@ -296,7 +341,7 @@ class Button(pg.sprite.Sprite, tools._KwargMixin):
 
     def update(self, prescaled_mouse_pos):
         hover = self.rect.collidepoint(prescaled_mouse_pos)
-        pressed = pg.key.get_pressed()
+        pressed = tools.get_pressed()
         if any(pressed[key] for key in self.bindings):
             hover = True
         if not self.visible:
@@ -461,9 +506,9 @@ class TextBox(object):
                                            self.render_rect.height)
             else:
                 self.render_area = self.rendered.get_rect(topleft=(0,0))
-        if pg.time.get_ticks()-self.blink_timer > 200:
+        if tools.get_ticks()-self.blink_timer > 200:
             self.blink = not self.blink
-            self.blink_timer = pg.time.get_ticks()
+            self.blink_timer = tools.get_ticks()
 
     def draw(self,surface):
         outline_color = self.active_color if self.active else self.outline_color
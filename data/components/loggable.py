@@ -4,19 +4,23 @@ import logging
 import sys
 from .. import prepare
 
-LOGGING_LEVEL = logging.DEBUG if prepare.ARGS['debug'] else logging.ERROR
+
+def logging_level():
+    """The level set by the debug argument, read once prepare.init has run"""
+    return logging.DEBUG if prepare.DEBUG else logging.ERROR
 
 log = logger = logging.getLogger('pyroller')
 handler = logging.StreamHandler(sys.stdout)
 formatter = logging.Formatter('[%(relativeCreated)6d] :: %(levelname)7s %(name)20s :: %(message)s')
 handler.setFormatter(formatter)
 logger.addHandler(handler)
-log.level = LOGGING_LEVEL
+log.level = logging_level()
 
 
 def getLogger(name):
     """Return a new logger with the name"""
     l = logging.getLogger(name)
+    logger.setLevel(logging_level())
     l.addHandler(handler)
     l.setLevel(logger.level)
     l.propagate = False
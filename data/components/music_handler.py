@@ -129,7 +129,7 @@ class MusicHandler(object):
         pg.mixer.music.play() if self.music_on else pg.mixer.music.stop()
 
     def update(self, scale):
-        pos = tools.scaled_mouse_pos(pg.mouse.get_pos(), scale)
+        pos = tools.scaled_mouse_pos(scale)
         self.buttons.update(pos)
         if self.music_on:
             if not pg.mixer.music.get_busy():
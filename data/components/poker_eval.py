@@ -0,0 +1,233 @@
+"""
+Poker hand ranks from lookup tables, for cards as card_core ints.
+
+evaluate5 gives a 5 card hand its rank among all 7462 distinct poker
+hands: 1 is a royal flush and 7462 the worst high card (7-5-4-3-2), so
+a lower rank is a better hand and equal ranks tie.  This is Cactus Kev's
+scheme: a flush is looked up by the bit pattern of its values, as are
+hands of five different values (straights and high cards); every other
+hand by the product of a prime number for each value, which is the same
+for any hand with the same values in any order.
+
+evaluate2 ranks the 2 card hands of guts the same way: 1 is a pair of
+Aces and 91 Three-Two high.  The bulk versions take NumPy arrays of
+hands (one row of card ints per hand) and return an array of ranks.
+
+The tables are built the first time a hand is evaluated.
+"""
+
+from itertools import combinations
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from . import card_core
+
+
+#Ranks 0 (Two) to 12 (Ace) of each card_core value (1 for Ace to 13).
+def _rank(value):
+    return 12 if value == 1 else value - 2
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+CATEGORIES = (("Straight Flush", 10), ("Four of a Kind", 156),
+              ("Full House", 156), ("Flush", 1277), ("Straight", 10),
+              ("Three of a Kind", 858), ("Two Pair", 858), ("One Pair", 2860),
+              ("High Card", 1277))
+WORST_RANK = 7462
+WORST_RANK2 = 91
+
+#For each card int: the bit and prime of its rank, and its suit.
+CARD_BITS = tuple(1 << _rank(card_core.value(card))
+                  for card in range(card_core.DECK_SIZE))
+CARD_PRIMES = tuple(PRIMES[_rank(card_core.value(card))]
+                    for card in range(card_core.DECK_SIZE))
+CARD_RANKS = tuple(_rank(card_core.value(card))
+                   for card in range(card_core.DECK_SIZE))
+CARD_SUITS = tuple(card_core.suit(card) for card in range(card_core.DECK_SIZE))
+
+_tables = None
+
+
+def _descending(ranks, count):
+    """Every choice of count of ranks, best first."""
+    return combinations(sorted(ranks, reverse=True), count)
+
+
+def _build_tables():
+    """
+    Number every distinct hand, best first, and file the numbers under the
+    bit patterns (flushes and five different values) or prime products
+    (hands with a pair or better) they are looked up by.
+    """
+    flushes = [0] * 8192
+    unique5 = [0] * 8192
+    products = {}
+    #Ace high down to Six high, then the wheel (Five high, with the Ace low).
+    straights = [0b11111 << low for low in range(8, -1, -1)]
+    straights.append(0b1000000001111)
+    straight_set = set(straights)
+    highs = [sum(1 << rank for rank in ranks)
+             for ranks in _descending(range(13), 5)]
+    highs = [bits for bits in highs if bits not in straight_set]
+    every = range(13)
+
+    def product(*ranks):
+        result = 1
+        for rank in ranks:
+            result *= PRIMES[rank]
+        return result
+
+    rank = 1
+    for bits in straights:
+        flushes[bits] = rank
+        rank += 1
+    for quad in reversed(every):
+        for kicker in _descending(set(every) - {quad}, 1):
+            products[product(quad, quad, quad, quad, *kicker)] = rank
+            rank += 1
+    for trips in reversed(every):
+        for pair in _descending(set(every) - {trips}, 1):
+            products[product(trips, trips, trips, pair[0], pair[0])] = rank
+            rank += 1
+    for bits in highs:
+        flushes[bits] = rank
+        rank += 1
+    for bits in straights:
+        unique5[bits] = rank
+        rank += 1
+    for trips in reversed(every):
+        for kickers in _descending(set(every) - {trips}, 2):
+            products[product(trips, trips, trips, *kickers)] = rank
+            rank += 1
+    for high, low in _descending(every, 2):
+        for kicker in _descending(set(every) - {high, low}, 1):
+            products[product(high, high, low, low, *kicker)] = rank
+            rank += 1
+    for pair in reversed(every):
+        for kickers in _descending(set(every) - {pair}, 3):
+            products[product(pair, pair, *kickers)] = rank
+            rank += 1
+    for bits in highs:
+        unique5[bits] = rank
+        rank += 1
+
+    pairs2 = [0] * 169
+    rank = 1
+    for pair in reversed(every):
+        pairs2[pair*13 + pair] = rank
+        rank += 1
+    for high, low in _descending(every, 2):
+        pairs2[high*13 + low] = pairs2[low*13 + high] = rank
+        rank += 1
+    return flushes, unique5, products, pairs2
+
+
+def tables():
+    """The lookup tables: (flushes, unique5, products, pairs2)."""
+    global _tables
+    if _tables is None:
+        _tables = _build_tables()
+    return _tables
+
+
+def evaluate5(a, b, c, d, e):
+    """Rank of the hand of cards a to e, from 1 (royal flush) to 7462."""
+    flushes, unique5, products, pairs2 = _tables or tables()
+    bits = CARD_BITS[a] | CARD_BITS[b] | CARD_BITS[c] | CARD_BITS[d] | CARD_BITS[e]
+    suit = CARD_SUITS[a]
+    if suit == CARD_SUITS[b] == CARD_SUITS[c] == CARD_SUITS[d] == CARD_SUITS[e]:
+        return flushes[bits]
+    rank = unique5[bits]
+    if rank:
+        return rank
+    return products[CARD_PRIMES[a] * CARD_PRIMES[b] * CARD_PRIMES[c] *
+                    CARD_PRIMES[d] * CARD_PRIMES[e]]
+
+
+def evaluate2(a, b):
+    """Rank of the guts hand of cards a and b, from 1 (pair of Aces) to 91."""
+    pairs2 = (_tables or tables())[3]
+    return pairs2[CARD_RANKS[a]*13 + CARD_RANKS[b]]
+
+
+def evaluate(cards):
+    """Rank of a hand of 2 or 5 cards, as evaluate2 or evaluate5."""
+    if len(cards) == 2:
+        return evaluate2(*cards)
+    return evaluate5(*cards)
+
+
+def category(rank):
+    """Name of the kind of 5 card hand of rank, e.g. "Full House"."""
+    for name, count in CATEGORIES:
+        if rank <= count:
+            return name
+        rank -= count
+    raise ValueError("no 5 card hand has rank {}".format(rank))
+
+
+def pair_value(rank):
+    """
+    The card_core value (1 for Ace to 13) of the pair in a 5 card hand of
+    rank if it is One Pair, otherwise None.
+    """
+    start = WORST_RANK - 1277 - 2860
+    if not start < rank <= start + 2860:
+        return None
+    pair = 12 - (rank - start - 1) // 220
+    return 1 if pair == 12 else pair + 2
+
+
+def best(hands, evaluator=evaluate):
+    """The indices of the best of hands (ties included), in order."""
+    ranks = [evaluator(hand) for hand in hands]
+    if not ranks:
+        return []
+    top = min(ranks)
+    return [index for index, rank in enumerate(ranks) if rank == top]
+
+
+_arrays = None
+
+
+def _numpy_tables():
+    global _arrays
+    if _arrays is None:
+        flushes, unique5, products, pairs2 = tables()
+        keys = numpy.array(sorted(products), dtype=numpy.int64)
+        values = numpy.array([products[key] for key in keys.tolist()],
+                             dtype=numpy.int32)
+        _arrays = (numpy.array(CARD_BITS, dtype=numpy.int32),
+                   numpy.array(CARD_PRIMES, dtype=numpy.int64),
+                   numpy.array(CARD_SUITS, dtype=numpy.int8),
+                   numpy.array(CARD_RANKS, dtype=numpy.int32),
+                   numpy.array(flushes, dtype=numpy.int32),
+                   numpy.array(unique5, dtype=numpy.int32),
+                   keys, values, numpy.array(pairs2, dtype=numpy.int32))
+    return _arrays
+
+
+def evaluate5_array(hands):
+    """Ranks of an (n, 5) NumPy array of hands, as evaluate5."""
+    (bits, primes, suits, ranks, flushes, unique5, keys, values,
+     pairs2) = _numpy_tables()
+    hands = numpy.asarray(hands, dtype=numpy.intp)
+    pattern = numpy.bitwise_or.reduce(bits[hands], axis=1)
+    hand_suits = suits[hands]
+    flush = (hand_suits == hand_suits[:, :1]).all(axis=1)
+    result = numpy.where(flush, flushes[pattern], unique5[pattern])
+    paired = result == 0
+    if paired.any():
+        product = primes[hands[paired]].prod(axis=1)
+        result[paired] = values[numpy.searchsorted(keys, product)]
+    return result
+
+
+def evaluate2_array(hands):
+    """Ranks of an (n, 2) NumPy array of hands, as evaluate2."""
+    arrays = _numpy_tables()
+    ranks, pairs2 = arrays[3], arrays[8]
+    hands = numpy.asarray(hands, dtype=numpy.intp)
+    return pairs2[ranks[hands[:, 0]]*13 + ranks[hands[:, 1]]]
@@ -0,0 +1,96 @@
+"""
+Shared cache of rendered text.  Labels and text sprites render through
+render, so text that hasn't changed since the last frame (or that another
+label already shows) costs a dictionary lookup instead of a font render
+and a new surface.  Renders are keyed by the font object, so fonts should
+be loaded once per path and size (as labels.LOADED_FONTS does).
+
+Returned surfaces are shared by everything showing the same text: copy
+one before changing it.  Once the renders held take more pixel memory
+than the cache's budget the least recently used are dropped.
+"""
+
+from collections import OrderedDict
+
+import pygame as pg
+from .. import tools
+
+
+#Bytes of pixel memory kept before old renders are dropped.
+BUDGET = 8*1024*1024
+
+
+def color_key(color):
+    """Make equal colors given as names, tuples or pg.Colors equal keys."""
+    if color is None:
+        return None
+    if isinstance(color, str):
+        color = pg.Color(color)
+    color = tuple(color)
+    return color if len(color) == 4 else color+(255,)
+
+
+class TextCache(object):
+    """Least recently used cache of font renders."""
+    def __init__(self, budget=BUDGET):
+        self.budget = budget
+        self.surfaces = OrderedDict()
+        self.size = 0
+
+    def render(self, font, text, antialias, color, bg=None):
+        """
+        Return font.render(text, antialias, color, bg), converted to the
+        display format if there is a display. The surface may be shared.
+        """
+        key = (font, text, bool(antialias), color_key(color), color_key(bg))
+        try:
+            surface = self.surfaces.pop(key)
+        except KeyError:
+            surface = self._add(self._render(font, text, antialias, color, bg))
+        self.surfaces[key] = surface
+        return surface
+
+    def get(self, key, make):
+        """
+        Return the surface cached under key, calling make() to create it if
+        there isn't one. For text drawn in other ways than a single render;
+        key should include everything the surface depends on.
+        """
+        try:
+            surface = self.surfaces.pop(key)
+        except KeyError:
+            surface = self._add(make())
+        self.surfaces[key] = surface
+        return surface
+
+    def _add(self, surface):
+        self.size += tools.surface_bytes(surface)
+        self._shrink()
+        return surface
+
+    def _render(self, font, text, antialias, color, bg):
+        if bg is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, bg)
+        if pg.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if bg is None else surface.convert()
+
+    def _shrink(self):
+        while self.size > self.budget and self.surfaces:
+            key, surface = self.surfaces.popitem(last=False)
+            self.size -= tools.surface_bytes(surface)
+
+    def clear(self):
+        """Drop every render."""
+        self.surfaces.clear()
+        self.size = 0
+
+
+CACHE = TextCache()
+
+
+def render(font, text, antialias, color, bg=None):
+    """Render text through the shared cache; see TextCache.render."""
+    return CACHE.render(font, text, antialias, color, bg)
@@ -0,0 +1,95 @@
+"""
+Word wrapping for blocks of text, by width in pixels (wrap) or by number
+of characters (wrap_words).
+
+wrap finds line breaks by adding up the advance of each character, taken
+from font.metrics in one pass over the text, instead of measuring longer
+and longer slices of it with font.size; each finished line is then
+measured once with font.size, which also counts kerning.  Both are
+memoized: a message that is measured and then drawn, or a block drawn
+every frame, is only wrapped once.
+"""
+
+from collections import OrderedDict
+
+
+#Results kept by each memoized function before the oldest are dropped.
+MAX_LAYOUTS = 512
+
+
+def memoize(function):
+    """
+    Remember the results of function (which must take hashable arguments
+    and return something that isn't changed) for the last MAX_LAYOUTS
+    argument tuples.
+    """
+    results = OrderedDict()
+    def memoized(*args):
+        try:
+            result = results.pop(args)
+        except KeyError:
+            result = function(*args)
+            if len(results) >= MAX_LAYOUTS:
+                results.popitem(last=False)
+        results[args] = result
+        return result
+    memoized.results = results
+    memoized.__doc__ = function.__doc__
+    memoized.__name__ = function.__name__
+    return memoized
+
+
+@memoize
+def wrap(font, text, width):
+    """
+    Break text into lines no wider than width pixels when drawn with font.
+    Lines are broken after the last space that fits, or mid-word if a word
+    is wider than width, and at newlines (which are dropped). Returns a
+    tuple of (start, end, line_width) for each line: text[start:end] is
+    the line and line_width its width in pixels.
+    """
+    metrics = font.metrics(text) if text else []
+    lines = []
+    start = 0
+    line_width = 0
+    space = None
+    for i, char in enumerate(text):
+        if char == "\n":
+            lines.append((start, i, line_width))
+            start, line_width, space = i+1, 0, None
+            continue
+        advance = metrics[i][4] if metrics[i] else 0
+        while line_width+advance > width and i > start:
+            if space is None:
+                end, end_width = i, line_width
+            else:
+                end, end_width = space
+            lines.append((start, end, end_width))
+            start, line_width, space = end, line_width-end_width, None
+        line_width += advance
+        if char == " ":
+            space = (i+1, line_width)
+    if start < len(text):
+        lines.append((start, len(text), line_width))
+    return tuple((start, end, font.size(text[start:end])[0])
+                 for start, end, line_width in lines)
+
+
+@memoize
+def wrap_words(text, char_limit, separator=" "):
+    """Splits a string into a tuple of strings no longer than char_limit."""
+    words = text.split(separator)
+    lines = []
+    current_line = []
+    current_length = 0
+    for word in words:
+        if len(word) + current_length <= char_limit:
+            current_length += len(word) + len(separator)
+            current_line.append(word)
+        else:
+            lines.append(separator.join(current_line))
+            current_line = [word]
+            current_length = len(word) + len(separator)
+    if current_line:
+        lines.append(separator.join(current_line))
+    return tuple(lines)
@@ -109,13 +109,71 @@ class OtherComponent2:
         if the_player_did_well:
             Broadcaster.processEvent((E_DID_WELL, +20))
 
+
+3. Queued broadcasting
+======================
+
+processEvent calls every handler straight away, so an event that triggers
+other events runs the whole cascade inside the code that raised it (eg a
+mouse handler). A Broadcaster created with queued=True can instead defer
+events that nobody is waiting on the result of:
+
+ 1. Call broadcaster.postEvent(("player-did-well", ..)) rather than processEvent
+ 2. The event is queued, and handled when broadcaster.drain() is next called
+    (Control drains prepare.BROADCASTER once a frame, within a time budget)
+ 3. Events with a higher priority are handled first, otherwise they are
+    handled in the order they were posted
+ 4. With coalesce=True an event is dropped if the same event (equal name and
+    object) is already waiting, so a burst of "tray-changed" events from one
+    component is handled once
+
+Handlers can also be given a priority when linked; handlers with a higher
+priority are called first, otherwise they are called in the order linked.
+
+A Broadcaster that is not queued handles posted events immediately.
+
+
+Links to methods
+================
+
+When the callback is a method of an object (eg self.button_clicked) only a weak
+reference to it is kept, so linking to a long lived broadcaster does not keep
+the object alive. Once the object is gone its links are dropped the next time
+the event happens; liveHandlers reports how many handlers are still linked to
+each event, which helps to find components that were never unlinked. Other
+callables (functions, lambdas, partials) are kept until they are unlinked.
+
 """
 
+import heapq
+import weakref
+from itertools import count
+
+try:
+    from time import perf_counter as timer
+except ImportError:
+    from time import time as timer
+
 
 class EventNotLinked(Exception):
     """An event was not found or linked to anything"""
 
 
+def _reference(callback):
+    """Return a function returning callback, or None once callback is gone
+
+    Methods are only weakly referenced, other callables strongly.
+
+    """
+    if getattr(callback, '__self__', None) is not None and hasattr(callback, '__func__'):
+        try:
+            return weakref.WeakMethod(callback)
+        except TypeError:
+            # The object can't be weakly referenced
+            pass
+    return lambda: callback
+
+
 class EventAware(object):
     """A mixin class that allows objects to respond to events"""
 
@@ -128,6 +186,7 @@ class EventAware(object):
         """
         self._event_handlers = {}
         self._registered_events = set()
+        self._dispatching = 0
 
     def processEvent(self, event):
         """Process an incoming event
@@ -152,11 +211,22 @@ class EventAware(object):
         else:
             #
             # Process all the handler functions
-            for callback, arg in links:
-                new_inhibits = callback(obj, arg)
-                # Watch for new events to inhibit
-                if new_inhibits:
-                    inhibits.add(new_inhibits)
+            dead = False
+            self._dispatching += 1
+            try:
+                for reference, arg, priority in links:
+                    callback = reference()
+                    if callback is None:
+                        dead = True
+                        continue
+                    new_inhibits = callback(obj, arg)
+                    # Watch for new events to inhibit
+                    if new_inhibits:
+                        inhibits.add(new_inhibits)
+            finally:
+                self._dispatching -= 1
+            if dead:
+                self._pruneLinks(name)
         return inhibits
 
     def handleEvent(self, event):
@@ -167,7 +237,7 @@ class EventAware(object):
         """
         return None
 
-    def linkEvent(self, name, callback, arg=None):
+    def linkEvent(self, name, callback, arg=None, priority=0):
         """Link an event to a callback
 
         Name should be an event name (typically a string) and callback should be a callable
@@ -177,8 +247,20 @@ class EventAware(object):
         The optional argument arg will be passed to the callback. This allows more general
         callback functions to be defined.
 
+        Callbacks with a higher priority are called before those with a lower one.
+        A method is only linked for as long as its object exists.
+
         """
-        self._event_handlers.setdefault(name, []).append((callback, arg))
+        links = self._event_handlers.setdefault(name, [])
+        #
+        # As in _removeLinks, links being called keep their list, so linking
+        # a callback ahead of the current one does not call it again
+        if self._dispatching:
+            links = self._event_handlers[name] = list(links)
+        index = len(links)
+        while index and links[index - 1][2] < priority:
+            index -= 1
+        links.insert(index, (_reference(callback), arg, priority))
 
     def unlinkEvent(self, name, callback=None):
         """Unlink an event from a callback
@@ -195,21 +277,49 @@ class EventAware(object):
             #
             # Look for items with the same name and callback
             try:
-                old_items, new_items = self._event_handlers[name], []
+                links = self._event_handlers[name]
             except KeyError:
                 raise EventNotLinked('No links to event "%s"' % name)
             #
-            for the_callback, arg in old_items:
-                if the_callback != callback:
-                    # This one is ok
-                    new_items.append((the_callback, arg))
-            #
-            # Were any changed?
-            if old_items == new_items:
+            found = [index for index, link in enumerate(links) if link[0]() == callback]
+            if not found:
                 raise EventNotLinked('No links for event "%s" with callback "%s"' % (name, callback))
-            #
-            # Reset events
-            self._event_handlers[name] = new_items
+            self._removeLinks(name, found)
+
+    def liveHandlers(self):
+        """Return a dictionary of the number of handlers linked to each event
+
+        Links to methods of objects that no longer exist are dropped first, and
+        events with no handlers left are not included.
+
+        """
+        counts = {}
+        for name in list(self._event_handlers):
+            self._pruneLinks(name)
+            links = self._event_handlers.get(name)
+            if links:
+                counts[name] = len(links)
+        return counts
+
+    def _pruneLinks(self, name):
+        """Drop the links to event name whose callbacks no longer exist"""
+        links = self._event_handlers.get(name, ())
+        dead = [index for index, link in enumerate(links) if link[0]() is None]
+        if dead:
+            self._removeLinks(name, dead)
+            if not self._event_handlers[name]:
+                del self._event_handlers[name]
+
+    def _removeLinks(self, name, indices):
+        """Remove the links to event name at the given (ascending) indices"""
+        links = self._event_handlers[name]
+        #
+        # Links being called keep their list, so a callback that unlinks
+        # does not make the others get skipped
+        if self._dispatching:
+            links = self._event_handlers[name] = list(links)
+        for index in reversed(indices):
+            del links[index]
 
 
 class Broadcaster(EventAware):
@@ -222,6 +332,65 @@ class Broadcaster(EventAware):
 
     """
 
-    def __init__(self):
-        """Initialise the broadcaster"""
-        self.initEvents()
\ No newline at end of file
+    def __init__(self, queued=False):
+        """Initialise the broadcaster
+
+        If queued is True then posted events wait until drain is called.
+
+        """
+        self.initEvents()
+        self.queued = queued
+        self._queue = []
+        self._pending = {}
+        self._order = count()
+
+    def __len__(self):
+        """The number of posted events waiting to be handled"""
+        return len(self._queue)
+
+    def postEvent(self, event, priority=0, coalesce=False):
+        """Post an event to be handled by the next drain
+
+        The event is as for processEvent. Events with a higher priority are handled
+        first. If coalesce is True and the same event is already waiting then the
+        event is not queued again.
+
+        When the broadcaster is not queued the event is handled immediately.
+
+        """
+        if not self.queued:
+            self.processEvent(event)
+            return
+        if coalesce:
+            if event in self._pending:
+                return
+            self._pending[event] = 1
+        heapq.heappush(self._queue, (-priority, next(self._order), event, coalesce))
+
+    def drain(self, budget=None):
+        """Handle posted events
+
+        Events posted by the handlers are handled in the same drain. If budget is
+        given then no more events are started once budget milliseconds have
+        passed, and the rest wait for the next drain (at least one event is
+        always handled, so the queue cannot stall). Returns the number handled.
+
+        """
+        queue = self._queue
+        if budget is not None:
+            end = timer() + budget / 1000.0
+        handled = 0
+        while queue:
+            if handled and budget is not None and timer() >= end:
+                break
+            priority, order, event, coalesce = heapq.heappop(queue)
+            if coalesce:
+                del self._pending[event]
+            self.processEvent(event)
+            handled += 1
+        return handled
+
+    def clearEvents(self):
+        """Drop all posted events without handling them"""
+        self._queue = []
+        self._pending = {}
\ No newline at end of file
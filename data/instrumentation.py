@@ -0,0 +1,142 @@
+"""
+Frame time instrumentation.  Control.main records how long the event,
+update, render and flip phases of every frame take, tagged with the
+active state, into a fixed size ring buffer.  Per state percentiles can be
+shown in an overlay (toggled with f6) and written to a CSV or JSON file.
+"""
+
+import csv
+import json
+import sys
+from array import array
+from math import ceil
+try:
+    from time import perf_counter as timer
+except ImportError:
+    from time import time as timer
+import pygame as pg
+
+
+PHASES = ("event", "update", "render", "flip")
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(ordered, percent):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not ordered:
+        return 0.0
+    rank = int(ceil(percent/100.0*len(ordered)))-1
+    return ordered[max(0, rank)]
+
+
+class FrameTimings(object):
+    """
+    Ring buffer of the most recent frames' phase times in milliseconds.
+    Once full the oldest frames are overwritten.
+    """
+    def __init__(self, capacity=3600):
+        self.capacity = capacity
+        self.phases = dict((phase, array("d", [0.0])*capacity)
+                           for phase in PHASES)
+        self.states = [None]*capacity
+        self.index = 0
+        self.count = 0
+        self.overlay = None
+
+    def record(self, state_name, event, update, render, flip):
+        """Add a frame; times are in seconds, as from timer()."""
+        i = self.index
+        self.phases["event"][i] = event*1000.0
+        self.phases["update"][i] = update*1000.0
+        self.phases["render"][i] = render*1000.0
+        self.phases["flip"][i] = flip*1000.0
+        self.states[i] = state_name
+        self.index = (i+1)%self.capacity
+        self.count = min(self.count+1, self.capacity)
+
+    def frames(self):
+        """Indices of recorded frames, oldest first."""
+        start = (self.index-self.count)%self.capacity
+        return [(start+i)%self.capacity for i in range(self.count)]
+
+    def total(self, i):
+        """Total time of the frame at index i."""
+        return sum(self.phases[phase][i] for phase in PHASES)
+
+    def summary(self):
+        """
+        Return a dict of state name to a dict with the number of frames
+        and the percentiles of total frame time, e.g. summary()["BINGO"]
+        ["p95"].
+        """
+        totals = {}
+        for i in self.frames():
+            totals.setdefault(self.states[i], []).append(self.total(i))
+        summary = {}
+        for state_name, times in totals.items():
+            times.sort()
+            stats = {"frames": len(times)}
+            for percent in PERCENTILES:
+                stats["p{}".format(percent)] = percentile(times, percent)
+            summary[state_name] = stats
+        return summary
+
+    def export(self, path):
+        """
+        Write every recorded frame to path; as JSON (with the summary) if
+        it ends in .json, otherwise as CSV.
+        """
+        rows = [[self.states[i]]+[self.phases[phase][i] for phase in PHASES]
+                for i in self.frames()]
+        if path.lower().endswith(".json"):
+            frames = [dict(zip(("state",)+PHASES, row)) for row in rows]
+            with open(path, "w") as f:
+                json.dump({"summary": self.summary(), "frames": frames}, f)
+        else:
+            #The csv module writes its own line endings
+            if sys.version_info[0] == 2:
+                f = open(path, "wb")
+            else:
+                f = open(path, "w", newline="")
+            with f:
+                writer = csv.writer(f)
+                writer.writerow(("state",)+PHASES)
+                writer.writerows(rows)
+
+    def draw(self, surface, frames=240, refresh=30):
+        """
+        Draw a graph of the latest frame times with the percentiles for
+        each state. The text is only rebuilt every refresh frames.
+        """
+        if self.overlay is None or not self.index%refresh:
+            self.overlay = self.make_text()
+        recent = self.frames()[-frames:]
+        graph = pg.Rect(0, 0, frames, 100)
+        graph.bottomleft = (10, surface.get_height()-10)
+        surface.fill((0, 0, 0), graph)
+        #A line at 60fps worth of milliseconds, one pixel per ms
+        target = graph.bottom-int(1000.0/60)
+        pg.draw.line(surface, (0, 160, 0), (graph.left, target),
+                     (graph.right, target))
+        for x, i in enumerate(recent):
+            top = max(graph.top, graph.bottom-int(self.total(i)))
+            pg.draw.line(surface, (230, 200, 0), (graph.left+x, graph.bottom),
+                         (graph.left+x, top))
+        text_rect = self.overlay.get_rect(bottomleft=graph.topleft)
+        surface.blit(self.overlay, text_rect)
+
+    def make_text(self):
+        """Render the per state percentiles as a table."""
+        font = pg.font.Font(None, 18)
+        rows = [("state",)+tuple("p{}".format(p) for p in PERCENTILES)]
+        for state_name, stats in sorted(self.summary().items()):
+            rows.append((str(state_name),)+tuple(
+                "{:.1f}".format(stats["p{}".format(p)]) for p in PERCENTILES))
+        height = font.get_linesize()
+        columns = (4, 124, 174, 224)
+        image = pg.Surface((270, height*len(rows)+4))
+        for j, row in enumerate(rows):
+            for x, text in zip(columns, row):
+                label = font.render(text, True, (230, 230, 230))
+                image.blit(label, (x, 2+height*j))
+        return image
@@ -9,7 +9,7 @@ and in the prepare module.
 import cProfile
 import pstats
 
-from . import prepare, tools
+from . import prepare, tools, prefetch, replay
 from .states import title_screen, lobby_screen, stats_menu
 from .states import stats_screen, blackjack, craps, bingo, keno, video_poker
 from .states import credits_screen, snake_splash, pachinko, baccarat, guts
@@ -18,27 +18,43 @@ from .components import music_handler
 
 
 def main():
+    prepare.init()
     args = (prepare.CAPTION, prepare.RENDER_SIZE, prepare.RESOLUTIONS)
     run_it = tools.Control(*args)
     run_it.show_fps = prepare.ARGS["FPS"]
     run_it.max_iterations = prepare.ARGS["iterations"]
+    run_it.headless = prepare.ARGS["headless"]
+    run_it.use_dirty_rects = prepare.ARGS["dirty_rects"]
+    run_it.time_scale = prepare.ARGS["time_scale"]
+    run_it.scaled_assets = prepare.SCALED
+    run_it.set_scale()
     run_it.music_handler = music_handler.MusicHandler()
-    state_dict = {"SNAKESPLASH"   : snake_splash.SnakeSplash(),
-                  "TITLESCREEN"   : title_screen.TitleScreen(),
-                  "LOBBYSCREEN"   : lobby_screen.LobbyScreen(),
-                  "STATSMENU"     : stats_menu.StatsMenu(),
-                  "STATSSCREEN"   : stats_screen.StatsScreen(),
-                  "CREDITSSCREEN" : credits_screen.CreditsScreen(),
-                  "BLACKJACK"     : blackjack.Blackjack(),
-                  "CRAPS"         : craps.Craps(),
-                  "BINGO"         : bingo.Bingo(),
-                  "KENO"          : keno.Keno(),
-                  "VIDEOPOKER"    : video_poker.VideoPoker(),
-                  "PACHINKO"      : pachinko.Pachinko(),
-                  "BACCARAT"      : baccarat.Baccarat(),
-                  "GUTS"          : guts.Guts(),
-                  "SLOTS"         : slots.Slots(),
-                  "ATMSCREEN"     : atm_screen.ATMScreen()
+    run_it.broadcaster = prepare.BROADCASTER
+    run_it.max_states = prepare.ARGS["live_states"]
+    managers = {"GFX": prepare.GFX, "SFX": prepare.SFX}
+    run_it.prefetcher = prefetch.Prefetcher(managers, prepare.ASSET_MANIFEST)
+    #Seeds random, so must come before any state is built.
+    if prepare.ARGS["replay"]:
+        run_it.replay = replay.Player(prepare.ARGS["replay"])
+    elif prepare.ARGS["record"]:
+        run_it.recorder = replay.Recorder(prepare.ARGS["record"])
+    #States are built the first time they are entered.
+    state_dict = {"SNAKESPLASH"   : snake_splash.SnakeSplash,
+                  "TITLESCREEN"   : title_screen.TitleScreen,
+                  "LOBBYSCREEN"   : lobby_screen.LobbyScreen,
+                  "STATSMENU"     : stats_menu.StatsMenu,
+                  "STATSSCREEN"   : stats_screen.StatsScreen,
+                  "CREDITSSCREEN" : credits_screen.CreditsScreen,
+                  "BLACKJACK"     : blackjack.Blackjack,
+                  "CRAPS"         : craps.Craps,
+                  "BINGO"         : bingo.Bingo,
+                  "KENO"          : keno.Keno,
+                  "VIDEOPOKER"    : video_poker.VideoPoker,
+                  "PACHINKO"      : pachinko.Pachinko,
+                  "BACCARAT"      : baccarat.Baccarat,
+                  "GUTS"          : guts.Guts,
+                  "SLOTS"         : slots.Slots,
+                  "ATMSCREEN"     : atm_screen.ATMScreen
     }
     if prepare.ARGS['straight']:
         run_it.setup_states(state_dict, "TITLESCREEN")
@@ -55,3 +71,14 @@ def main():
         cProfile.runctx('run_it.main()', globals(), locals(), 'profile')
         p = pstats.Stats('profile')
         print(p.sort_stats('cumulative').print_stats(100))
+    #The files asked for on the command line come first, so they are
+    #written even if the manifest can't be.
+    try:
+        if run_it.replay:
+            run_it.replay.close()
+        if run_it.recorder:
+            run_it.recorder.save()
+        if prepare.ARGS["timings"]:
+            run_it.timings.export(prepare.ARGS["timings"])
+    finally:
+        run_it.prefetcher.save_manifest()
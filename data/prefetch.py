@@ -0,0 +1,135 @@
+"""
+Background loading of the assets a state will need before it is entered.
+
+Assets are recorded per state while that state is active, and the record
+is kept in a manifest file between runs.  When a state asks for another
+one to be prefetched (by setting its prefetch attribute, as the lobby does
+while a game button is hovered) the files for that state are read and
+decoded on a worker thread.  Decoded assets are finished (converted) on
+the main thread by update.  Only assets are prefetched: the state itself
+is still built by Control.flip_state, so hovering over a game never runs
+its setup or counts against Control.max_states.
+"""
+
+import json
+import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from .components.loggable import getLogger
+
+
+logger = getLogger('prefetch')
+
+
+class Prefetcher(object):
+    """
+    Prefetches assets from a dict of named AssetManagers, for instance
+    {"GFX": prepare.GFX, "SFX": prepare.SFX}.
+    """
+    def __init__(self, managers, manifest_path=None):
+        self.managers = managers
+        self.manifest_path = manifest_path
+        self.manifest = self.load_manifest()
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.requested = set()
+        #state name: [generation, assets still to finish] for each request
+        self.pending = {}
+        self.generation = 0
+        self.worker = None
+
+    def load_manifest(self):
+        """Read the asset names recorded for each state on earlier runs."""
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (IOError, OSError, TypeError, ValueError):
+            return {}
+        return dict((state, dict((kind, set(names))
+                                 for kind, names in kinds.items()))
+                    for state, kinds in manifest.items())
+
+    def save_manifest(self):
+        """
+        Write the recorded asset names so later runs can prefetch them.
+        Returns False if the file couldn't be written.
+        """
+        if self.manifest_path is None:
+            return True
+        manifest = dict((state, dict((kind, sorted(names))
+                                     for kind, names in kinds.items()))
+                        for state, kinds in self.manifest.items())
+        try:
+            with open(self.manifest_path, "w") as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+        except (IOError, OSError) as error:
+            logger.error("Could not save the asset manifest: {}".format(error))
+            return False
+        return True
+
+    def record(self, state_name):
+        """
+        Record the assets used from now on as belonging to state_name.
+        Called by Control when state_name is entered, after which it may
+        be prefetched again.
+        """
+        self.requested.discard(state_name)
+        kinds = self.manifest.setdefault(state_name, {})
+        for kind, manager in self.managers.items():
+            manager.recording = kinds.setdefault(kind, set())
+
+    def request(self, state_name):
+        """Start prefetching for state_name unless that was already done."""
+        if state_name in self.requested:
+            return
+        self.requested.add(state_name)
+        names = []
+        for kind, recorded in self.manifest.get(state_name, {}).items():
+            manager = self.managers[kind]
+            sheets = set(manager.sheet(name) for name in recorded
+                         if name in manager)
+            names.extend((kind, sheet) for sheet in sorted(sheets)
+                         if sheet not in manager.assets)
+        if not names:
+            self.pending.pop(state_name, None)
+            return
+        #Results of an earlier request for state_name no longer count.
+        self.generation += 1
+        self.pending[state_name] = [self.generation, len(names)]
+        for kind, name in names:
+            self.requests.put((state_name, self.generation, kind, name))
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.work)
+            self.worker.daemon = True
+            self.worker.start()
+
+    def work(self):
+        """Worker thread: decode requested assets off the main thread."""
+        while True:
+            state_name, generation, kind, name = self.requests.get()
+            try:
+                decoded = self.managers[kind].decode(name)
+            except Exception:
+                decoded = None  #Left to load normally on first use
+            self.results.put((state_name, generation, kind, name, decoded))
+
+    def update(self):
+        """Finish any decoded assets on the main thread."""
+        while True:
+            try:
+                state_name, generation, kind, name, decoded = self.results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self.managers[kind].finish(name, decoded)
+            except Exception:
+                #Left to load normally on first use
+                logger.exception("Could not prefetch {} {}".format(kind, name))
+            pending = self.pending.get(state_name)
+            if pending is not None and pending[0] == generation:
+                pending[1] -= 1
+                if not pending[1]:
+                    del self.pending[state_name]
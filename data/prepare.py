@@ -1,10 +1,15 @@
 """
-This module initializes the display and creates dictionaries of resources.
+This module holds the game's settings and, once they are created, the
+display and dictionaries of resources.  Importing it has no side effects;
+call init to apply the command line arguments, open the display and start
+the music.  The resource dictionaries (FONTS, MUSIC, SFX, GFX and SCALED)
+are created by init, or on first access if init was told not to.
 """
 import os
 import pygame as pg
 from . import tools
 from . import events
+from . import asset_bundle
 
 
 CAPTION = "Py Rollers Casino"
@@ -15,58 +20,105 @@ CARD_SIZE = (125, 181)
 CHIP_SIZE = (32, 19)
 WIN_POS = (0,0)
 MONEY = 1000
-ARGS = tools.get_cli_args(CAPTION, WIN_POS, START_SIZE, MONEY)
-#adjust settings based on args
-START_SIZE = int(ARGS['size'][0]), int(ARGS['size'][1])
-MONEY = int(ARGS['money'])
-DEBUG = bool(ARGS['debug'])
+_DEFAULTS = (WIN_POS, START_SIZE, MONEY)
+#Default settings until init parses the real command line
+ARGS = tools.get_cli_args(CAPTION, WIN_POS, START_SIZE, MONEY, [])
+DEBUG = False
+#Budget in bytes for each of GFX and SFX; None keeps everything once loaded
+ASSET_BUDGET = None
+#Built by running "python -m data.asset_bundle"
+BUNDLE_DIR = os.path.join("resources", "bundle")
+#Assets used by each state, recorded so later runs can prefetch them
+ASSET_MANIFEST = os.path.join("resources", "asset_manifest.json")
+#Hold advice worked out for video poker hands on earlier runs
+HOLD_CACHE = os.path.join("resources", "hold_cache.json")
 
 BACKGROUND_BASE = (5, 5, 15) #Pure Black is too severe.
 FELT_GREEN = (0, 153, 51) #Use this if making a standard table-style game.
 
-#Pre-initialize the mixer for less delay before a sound plays
-pg.mixer.pre_init(44100, -16, 1, 512)
 
-#Initialization
-pg.init()
-if ARGS['center']:
-    os.environ['SDL_VIDEO_CENTERED'] = "True"
-else:
-    os.environ['SDL_VIDEO_WINDOW_POS'] = '{},{}'.format(*ARGS['winpos'])
-pg.display.set_caption(CAPTION)
-if ARGS['fullscreen']:
-    pg.display.set_mode(START_SIZE, pg.FULLSCREEN)
-else:
-    pg.display.set_mode(START_SIZE, pg.RESIZABLE)
-    pg.event.clear(pg.VIDEORESIZE)
+def init(display=True, audio=True, assets=True, args=None):
+    """
+    Apply the command line arguments (sys.argv, or the list args), then
+    initialize pygame.  With display or audio False (or the headless
+    argument) SDL's dummy drivers are used, so no window or sound device
+    is needed, and the music stays off.  With assets False resources are
+    only set up when first accessed.
+    """
+    global ARGS, START_SIZE, MONEY, DEBUG, ASSET_BUDGET
+    ARGS = tools.get_cli_args(CAPTION, *_DEFAULTS, argv=args)
+    #adjust settings based on args
+    START_SIZE = int(ARGS['size'][0]), int(ARGS['size'][1])
+    MONEY = int(ARGS['money'])
+    DEBUG = bool(ARGS['debug'])
+    if ARGS['asset_budget'] is not None:
+        ASSET_BUDGET = int(ARGS['asset_budget']*1024*1024)
+    if ARGS['headless']:
+        display = audio = False
+    if not display:
+        os.environ['SDL_VIDEODRIVER'] = "dummy"
+    if not audio:
+        os.environ['SDL_AUDIODRIVER'] = "dummy"
+        ARGS['music_off'] = True
+
+    #Pre-initialize the mixer for less delay before a sound plays
+    pg.mixer.pre_init(44100, -16, 1, 512)
+
+    #Initialization
+    pg.init()
+    if ARGS['center']:
+        os.environ['SDL_VIDEO_CENTERED'] = "True"
+    else:
+        os.environ['SDL_VIDEO_WINDOW_POS'] = '{},{}'.format(*ARGS['winpos'])
+    #Without a window there is no title bar, so leave the caption alone
+    if display:
+        pg.display.set_caption(CAPTION)
+    if ARGS['fullscreen']:
+        pg.display.set_mode(START_SIZE, pg.FULLSCREEN)
+    else:
+        pg.display.set_mode(START_SIZE, pg.RESIZABLE)
+        pg.event.clear(pg.VIDEORESIZE)
+
+    if assets:
+        for name in RESOURCES:
+            _resource(name)
+
+    #It's time to start the music, it's time to light the lights
+    pg.mixer.music.load(_resource("MUSIC")["main_stem"])
+    pg.mixer.music.set_volume(.2)
+    if not ARGS["music_off"]:
+        pg.mixer.music.play()
 
 
 def _load_graphics():
     """
-    Load all graphics into a dictionary; then cut up the card sprite sheet
-    so each card can be accessed individually. Also strips buttons from
-    button sheet.
+    Register all graphics with an AssetManager, from the asset bundle if it
+    is up to date; then register each card of the card sprite sheet so it
+    can be accessed individually. Also strips buttons from button sheet.
+    Nothing is loaded until it is first used.
     """
-    gfx = tools.load_all_gfx(os.path.join("resources", "graphics"))
+    directory = os.path.join("resources", "graphics")
+    gfx = asset_bundle.load_gfx(BUNDLE_DIR, directory, budget=ASSET_BUDGET)
+    if gfx is None:
+        gfx = tools.lazy_gfx(directory, budget=ASSET_BUDGET)
     _get_cards(gfx)
     _get_neon_buttons(gfx)
     return gfx
 
 
 def _get_cards(gfx):
-    """Cut cards into subsurfaces."""
+    """Register cards as subsurfaces of the card sheet."""
     c_width, c_height = CARD_SIZE
-    sheet = gfx["cardsheet"]
     card_names = ["ace", 2, 3, 4, 5, 6, 7, 8, 9, 10, "jack", "queen", "king"]
     for j,suit in enumerate(["clubs", "hearts", "diamonds", "spades"]):
         for i,name in enumerate(card_names):
             rect = pg.Rect(i*c_width, j*c_height, c_width, c_height)
             key = "{}_of_{}".format(name, suit)
-            gfx[key] = sheet.subsurface(rect)
+            gfx.register_piece(key, "cardsheet", rect)
 
 
 def _get_neon_buttons(gfx):
-    """Cut neon button sheets into subsurfaces."""
+    """Register neon buttons as subsurfaces of their sheets."""
     b_width = 318
     b_height = 101
     b_texts = {"games"    : ["Bingo", "Blackjack", "Craps", "Keno",
@@ -78,29 +130,48 @@ def _get_neon_buttons(gfx):
                              "Double", "Roll", "Ride", "Change",
                              "Tutorial", "Stay", "Pass", "Ante Up"]}
     for category in b_texts:
-        sheet = gfx["neon_button_{}".format(category)]
+        sheet = "neon_button_{}".format(category)
         for i,text in enumerate(b_texts[category]):
             off_rect = pg.Rect(0, i*b_height, b_width, b_height)
             on_rect = off_rect.move(b_width, 0)
             off_key = "neon_button_off_{}".format(text.lower())
             on_key = "neon_button_on_{}".format(text.lower())
-            gfx[off_key] = sheet.subsurface(off_rect)
-            gfx[on_key] = sheet.subsurface(on_rect)
+            gfx.register_piece(off_key, sheet, off_rect)
+            gfx.register_piece(on_key, sheet, on_rect)
+
+
+def _load_sounds():
+    """Register all sounds, from the asset bundle if it is up to date."""
+    directory = os.path.join("resources", "sound")
+    sfx = asset_bundle.load_sfx(BUNDLE_DIR, directory, budget=ASSET_BUDGET)
+    if sfx is None:
+        sfx = tools.lazy_sfx(directory, budget=ASSET_BUDGET)
+    return sfx
+
+
+#Resource loading (Fonts and music just contain path names; graphics and
+#sounds are loaded when first used).
+RESOURCES = {"FONTS" : lambda: tools.load_all_fonts(os.path.join("resources", "fonts")),
+             "MUSIC" : lambda: tools.load_all_music(os.path.join("resources", "music")),
+             "SFX"   : _load_sounds,
+             "GFX"   : _load_graphics,
+             "SCALED": lambda: tools.ScaledAssets(_resource("GFX"))}
+
 
+def _resource(name):
+    """Return the resource dictionary called name, creating it if needed."""
+    if name not in globals():
+        globals()[name] = RESOURCES[name]()
+    return globals()[name]
 
-#Resource loading (Fonts and music just contain path names).
-FONTS = tools.load_all_fonts(os.path.join("resources", "fonts"))
-MUSIC = tools.load_all_music(os.path.join("resources", "music"))
-SFX   = tools.load_all_sfx(os.path.join("resources", "sound"))
-GFX   = _load_graphics()
 
+def __getattr__(name):
+    """Create resource dictionaries the first time they are used."""
+    if name in RESOURCES:
+        return _resource(name)
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
 
-#It's time to start the music, it's time to light the lights
-pg.mixer.music.load(MUSIC["main_stem"])
-pg.mixer.music.set_volume(.2)
-if not ARGS["music_off"]:
-    pg.mixer.music.play()
-    
 
-# Singleton to broadcast events throughout the game
-BROADCASTER = events.Broadcaster()
+# Singleton to broadcast events throughout the game; events posted to it
+# are handled once a frame by Control
+BROADCASTER = events.Broadcaster(queued=True)
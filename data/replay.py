@@ -0,0 +1,152 @@
+"""
+Recording and replaying of input.  A Recorder saves the seed given to the
+random module, then every frame's dt, clock, mouse position, pressed keys
+and events to a gzipped JSON file.  A Player feeds such a file back to
+Control, which runs headless and as fast as it can, so the same session
+can be replayed as a fixed benchmark workload.
+
+While either is active the input sources in tools (get_mouse_pos,
+get_pressed and get_ticks) are replaced with values sampled once per
+frame, so the game reads exactly the same input when recording as when
+replaying.  Replays also depend on the rest of the setup being the same:
+use the same command line options and save game.
+"""
+
+import gzip
+import json
+import random
+import pygame as pg
+from . import tools
+
+
+REPLAY_VERSION = 1
+#Event attribute values that can be saved; anything else is dropped.
+SIMPLE_TYPES = (int, float, str, bool, type(None))
+#The real input sources, put back when recording or replaying stops.
+SOURCES = (tools.get_mouse_pos, tools.get_pressed, tools.get_ticks)
+
+
+class PressedKeys(object):
+    """Stand-in for pg.key.get_pressed() built from a list of keys."""
+    def __init__(self, keys=()):
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+def _encode(value):
+    if isinstance(value, (tuple, list)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value):
+    if isinstance(value, list):
+        return tuple(_decode(item) for item in value)
+    return value
+
+
+def _saveable(value):
+    if isinstance(value, (tuple, list)):
+        return all(_saveable(item) for item in value)
+    return isinstance(value, SIMPLE_TYPES)
+
+
+def encode_event(event):
+    """Return event as a [type, attributes] list that json can save."""
+    attributes = dict((name, _encode(value))
+                      for name, value in event.dict.items()
+                      if _saveable(value))
+    return [event.type, attributes]
+
+
+def decode_event(data):
+    """Rebuild an event saved by encode_event."""
+    event_type, attributes = data
+    attributes = dict((name, _decode(value))
+                      for name, value in attributes.items())
+    return pg.event.Event(event_type, attributes)
+
+
+def _use_sources(mouse, pressed, ticks):
+    tools.get_mouse_pos = mouse
+    tools.get_pressed = pressed
+    tools.get_ticks = ticks
+
+
+def _restore_sources():
+    _use_sources(*SOURCES)
+
+
+class Recorder(object):
+    """Records every frame Control runs to path; call save when done."""
+    def __init__(self, path, seed=None):
+        self.path = path
+        self.seed = random.randrange(2**31) if seed is None else seed
+        random.seed(self.seed)
+        self.frames = []
+        self.mouse = pg.mouse.get_pos()
+        self.keys = pg.key.get_pressed()
+        self.now = pg.time.get_ticks()
+        self.dt = 0
+        _use_sources(lambda: self.mouse, lambda: self.keys, lambda: self.now)
+
+    def sample(self, dt, now=None):
+        """
+        Read the real input sources for this frame. Headless runs pass
+        their simulated time as now.
+        """
+        self.dt = dt
+        self.mouse = pg.mouse.get_pos()
+        self.keys = pg.key.get_pressed()
+        self.now = pg.time.get_ticks() if now is None else now
+
+    def record(self, events):
+        """Add a frame with the events event_loop handled."""
+        pressed = [key for key in range(len(self.keys)) if self.keys[key]]
+        self.frames.append([self.dt, self.now, list(self.mouse), pressed,
+                            [encode_event(event) for event in events]])
+
+    def save(self):
+        """Write the replay file and stop substituting input."""
+        _restore_sources()
+        replay = {"version": REPLAY_VERSION, "seed": self.seed,
+                  "frames": self.frames}
+        with gzip.open(self.path, "wt") as f:
+            json.dump(replay, f, separators=(",", ":"))
+
+
+class Player(object):
+    """Plays back a replay file recorded by Recorder."""
+    def __init__(self, path):
+        with gzip.open(path, "rt") as f:
+            replay = json.load(f)
+        if replay.get("version") != REPLAY_VERSION:
+            raise ValueError("{} is not a version {} replay".format(
+                path, REPLAY_VERSION))
+        random.seed(replay["seed"])
+        self.frames = replay["frames"]
+        self.index = 0
+        self.events = []
+        self.mouse = (0, 0)
+        self.keys = PressedKeys()
+        self.now = 0
+        _use_sources(lambda: self.mouse, lambda: self.keys, lambda: self.now)
+
+    @property
+    def finished(self):
+        return self.index >= len(self.frames)
+
+    def next_frame(self):
+        """Load the next frame's input and return its dt."""
+        dt, self.now, mouse, pressed, events = self.frames[self.index]
+        self.index += 1
+        self.mouse = tuple(mouse)
+        self.keys = PressedKeys(pressed)
+        self.events = [decode_event(event) for event in events]
+        return dt
+
+    def close(self):
+        """Stop substituting input."""
+        _restore_sources()
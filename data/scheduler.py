@@ -0,0 +1,93 @@
+"""
+Timelines for delayed and repeating callbacks.  A Scheduler keeps the
+Tasks (see components.animation) added to it in a heap ordered by when
+they are next due, so advancing it each frame only looks at the Tasks
+that are due; a frame in which none are costs one comparison, however
+many are waiting.  Adding a Task costs O(log n) and cancelling one O(1)
+(its heap entry is only marked, and dropped when it reaches the top).
+
+Every State has a Scheduler, advanced by Control while the State is
+active, and AnimationGroups keep the Tasks added to them in one, advanced
+when the group is updated.  Tasks keep their old behaviour: each fires at
+most once per advance, Tasks due in the same advance fire in the order
+they were added, and one that has finished adds the Tasks chained to it.
+"""
+
+import heapq
+from itertools import count
+
+
+class Scheduler(object):
+    """A timeline of Tasks, advanced in milliseconds."""
+    def __init__(self):
+        self.now = 0.0
+        self.heap = []
+        self.counter = count()
+
+    def __len__(self):
+        return sum(1 for entry in self.heap if entry[2] is not None)
+
+    def add(self, task):
+        """
+        Schedule task to fire once its interval (less any time it has
+        already waited) has passed.
+        """
+        self.cancel(task)
+        due = self.now + task.interval - task._timer
+        self._push(due, next(self.counter), task)
+
+    def cancel(self, task):
+        """Unschedule task, keeping the time it has waited in task._timer."""
+        entry = task._entry
+        if entry is not None and entry[2] is task:
+            #The entry may be on another timeline (when task is moved)
+            owner = task._scheduler
+            if owner is None:
+                owner = self
+            entry[2] = None
+            task._timer = task.interval - (entry[0] - owner.now)
+        task._entry = None
+        task._scheduler = None
+
+    def next_due(self):
+        """Milliseconds until the next Task is due, or None if there is none."""
+        heap = self.heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - self.now)
+
+    def advance(self, dt):
+        """Move the timeline on by dt and fire the Tasks that are due."""
+        self.now += dt
+        heap = self.heap
+        if not heap or heap[0][0] > self.now:
+            return
+        due = []
+        while heap and heap[0][0] <= self.now:
+            entry = heapq.heappop(heap)
+            if entry[2] is not None:
+                due.append(entry)
+        due.sort(key=lambda entry: entry[1])
+        for entry in due:
+            task = entry[2]
+            if task is None:
+                continue
+            task._timer = 0.0
+            task._fire()
+            if entry[2] is task:
+                self._push(entry[0] + task.interval, entry[1], task)
+
+    def clear(self):
+        """Unschedule every Task."""
+        for entry in self.heap:
+            if entry[2] is not None:
+                self.cancel(entry[2])
+        self.heap = []
+
+    def _push(self, due, order, task):
+        entry = [due, order, task]
+        task._entry = entry
+        task._scheduler = self
+        heapq.heappush(self.heap, entry)
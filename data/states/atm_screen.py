@@ -42,6 +42,8 @@ class ATMScreen(tools._State):
     def update(self, surface, keys, current, dt, scale):
         self.player.account.update(current)
         self.cash_icon.update(self.player.cash)
+        #Only the cursor blinks; run at full rate while changing screens
+        self.idle = True
         if self.state.quit:
             self.state.quit = False
             self.done = True
@@ -53,6 +55,7 @@ class ATMScreen(tools._State):
             self.state_name = next_state
             self.state = self.states[self.state_name]
             self.state.startup(persistent)
+            self.idle = False
         else:
             self.state.update(surface, keys, current, dt, scale, self.player)
         
@@ -12,6 +12,7 @@ from .ui import *
 from .chips import *
 from .table import TableGame
 from ... import prepare
+from ...components import card_core
 from ...components.animation import Task, Animation
 from ...components.angles import get_midpoint
 from ...prepare import BROADCASTER as B
@@ -27,7 +28,7 @@ def count_card(value):
 
 
 def count_deck(deck):
-    return divmod(sum(count_card(card.value) for card in deck), 10)[1]
+    return card_core.baccarat_points(card.code for card in deck)
 
 
 def bankers_deal_rule(banker_count, last_player_card):
@@ -1,4 +1,3 @@
-import random
 from functools import partial
 from math import pi, cos
 
@@ -7,6 +6,7 @@ from pygame.transform import smoothscale
 
 from .ui import Stacker, Sprite
 from ... import prepare
+from ...components import card_core
 from ...components.animation import Animation
 
 
@@ -16,23 +16,12 @@ two_pi = pi * 2
 
 
 def make_cards(decks, card_size, shuffle=False):
-    """Return a list of Cards
+    """Return a list of Cards, in the order of a card_core.Shoe
     """
-
-    def build_decks():
-        suits = ("Clubs", "Hearts", "Diamonds", "Spades")
-        rect = ((0, 0), card_size)
-        for deck in range(decks):
-            for suit in suits:
-                for value in range(1, 14):
-                    yield Card(value, suit, rect)
-
-    cards = list(c for c in build_decks())
-
-    if shuffle:
-        random.shuffle(cards)
-
-    return cards
+    shoe = card_core.Shoe(decks, shuffled=shuffle, vectorized=False)
+    rect = ((0, 0), card_size)
+    return [Card(card_core.value(code), card_core.suit_name(code), rect)
+            for code in shoe.remaining()]
 
 
 class Card(Sprite):
@@ -60,6 +49,7 @@ class Card(Sprite):
         super(Card, self).__init__()
         self.value = value
         self.suit = suit
+        self.code = card_core.make_card(value, suit)
         self.rect = pygame.Rect(rect)
         if self.face_cache is None:
             self.initialize_cache(self.rect.size)
@@ -100,10 +100,13 @@ class Chip(Sprite):
                    5: 'red',
                    1: 'white'}
 
-    images, flat_images = get_chip_images()
+    _all_images = tools.lazy_attribute(get_chip_images)
+    images = tools.lazy_attribute(lambda: Chip._all_images[0])
+    flat_images = tools.lazy_attribute(lambda: Chip._all_images[1])
     thicknesses = {19: 5, 30: 7}
     chip_size = prepare.CHIP_SIZE
-    shadow = make_shadow_surface(images[chip_size]['white'])
+    shadow = tools.lazy_attribute(
+        lambda: make_shadow_surface(Chip.images[Chip.chip_size]['white']))
 
     def __init__(self, value, chip_size=None):
         super(Chip, self).__init__()
@@ -140,8 +143,8 @@ class Chip(Sprite):
 class ChipPile(Stacker):
     """Represents a pile of chips
     """
-    chip_sounds = [prepare.SFX[name] for name in
-                   ["chipsstack{}".format(x) for x in (3, 5, 6)]]
+    chip_sounds = tools.lazy_attribute(
+        lambda: [prepare.SFX["chipsstack{}".format(x)] for x in (3, 5, 6)])
 
     __current_stack = None
     _initial_snapping = 45
@@ -171,9 +174,6 @@ class ChipPile(Stacker):
         if value:
             self.add(*cash_to_chips(value))
 
-    def __del__(self):
-        B.unlinkEvent('DO_DROP_STACK', self.return_stack)
-
     def draw(self, surface):
         dirty0 = self._shadows.draw(surface)
         dirty1 = super(ChipPile, self).draw(surface)
@@ -194,11 +194,11 @@ class ChipPile(Stacker):
             self._shadows.remove(shadow)
         except KeyError:
             pass
-        B.processEvent(('CHIPS_VALUE_CHANGE', self))
+        B.postEvent(('CHIPS_VALUE_CHANGE', self), coalesce=True)
 
     def add_internal(self, *args, **kwargs):
         super(ChipPile, self).add_internal(*args, **kwargs)
-        B.processEvent(('CHIPS_VALUE_CHANGE', self))
+        B.postEvent(('CHIPS_VALUE_CHANGE', self), coalesce=True)
 
     # def update(self, *args):
     #     super(ChipPile, self).update(*args)
@@ -9,7 +9,7 @@ from .ui import *
 from .chips import *
 from ... import tools, prepare
 from ...components.advisor import Advisor
-from ...components.animation import Task, Animation
+from ...components.animation import Animation, AnimationGroup
 from ...prepare import BROADCASTER as B
 
 
@@ -82,7 +82,8 @@ class TableGame(tools._State):
         self.bets = MetaGroup()
         self.metagroup = MetaGroup()
         self.metagroup.add(self.bets)
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
+        self.scheduler.clear()
 
         self._advisor = Advisor(self.hud, self.animations)
         self._advisor.queue_text('Welcome to Baccarat', 3000)
@@ -386,19 +387,6 @@ class TableGame(tools._State):
             for bet in self.bets.groups():
                 bet.get_event(event, scale)
 
-    def delay(self, amount, callback, args=None, kwargs=None):
-        """Convenience function to delay a function call
-
-        :param amount: milliseconds to wait until callback is called
-        :param callback: function to call
-        :param args: arguments to pass to callback
-        :param kwargs: keywords to pass to callback
-        :return: Task instance
-        """
-        task = Task(callback, amount, 1, args, kwargs)
-        self.animations.add(task)
-        return task
-
     def deal_card(self, hand):
         """Shortcut to draw card from shoe and add to a hand
 
@@ -505,12 +493,14 @@ class TableGame(tools._State):
         self._background = None
 
     def update(self, surface, keys, current_time, dt, scale):
-        if self._background is None:
+        redrawn = self._background is None
+        if redrawn:
             image = self.render_background(surface.get_size())
             surface.blit(image, (0, 0))
             self._background = image
 
         self.animations.update(dt)
         self.metagroup.update(dt)
-        self.metagroup.clear(surface, self._background)
-        self.metagroup.draw(surface)
+        cleared = self.metagroup.clear(surface, self._background)
+        dirty = self.metagroup.draw(surface)
+        self.dirty_rects = None if redrawn else cleared + dirty
@@ -21,6 +21,7 @@ from itertools import product, groupby
 import pygame
 
 from ... import prepare
+from ...components import text_cache
 from ...components.animation import *
 
 
@@ -123,7 +124,7 @@ class SpriteGroup(pygame.sprite.LayeredUpdates):
         self._spritelist = []
         pygame.sprite.AbstractGroup.__init__(self)
         self._default_layer = kwargs.get('default_layer', 0)
-        self._animations = pygame.sprite.Group()
+        self._animations = AnimationGroup()
 
     def extend(self, sprites, **kwargs):
         """A a sequence of sprites to the SpriteGroup
@@ -273,7 +274,10 @@ class MetaGroup(object):
             group.update(*args)
 
     def clear(self, surface, background):
+        """clear the areas drawn last time and return the rects cleared
+        """
         [surface.blit(background, rect, rect) for rect in self._dirty]
+        return list(self._dirty)
 
     def draw(self, surface):
         """draw all sprites in the right order onto the given surface
@@ -482,10 +486,14 @@ class TextSprite(Sprite):
             surface.blit(image, rect)
         return image
 
+    def render(self):
+        """Return the image to show, shared through the text cache."""
+        return text_cache.render(self._font, self._text, True, self._fg,
+                                 self._bg)
+
     def update_image(self):
-        image = self.draw()
-        self.image = image.convert_alpha()
-        self.rect = image.get_rect(topleft=self.rect.topleft)
+        self.image = self.render()
+        self.rect = self.image.get_rect(topleft=self.rect.topleft)
         self.dirty = 1
 
     @property
@@ -518,6 +526,9 @@ class OutlineTextSprite(TextSprite):
         image.blit(inner, (cx, cy))
         return image
 
+    def render(self):
+        return self.draw().convert_alpha()
+
 
 class NeonButton(EventButton):
     """Button class that responds to mouse events"""
@@ -131,7 +131,7 @@ class Bingo(statemachine.StateMachine):
 
     def drawUI(self, surface, scale):
         """Update the main surface once per frame"""
-        mouse_pos = tools.scaled_mouse_pos(scale, pg.mouse.get_pos())
+        mouse_pos = tools.scaled_mouse_pos(scale)
         self.lobby_button.update(mouse_pos)
         self.new_game_button.update(mouse_pos)
         #
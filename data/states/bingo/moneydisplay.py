@@ -1,6 +1,6 @@
 """Classes to display the total amount of money that the player has"""
 
-from ...components import common, loggable
+from ...components import common, loggable, labels
 from .settings import SETTINGS as S
 
 
@@ -57,7 +57,7 @@ class MoneyDigit(common.DrawableGroup, loggable.Loggable):
             'digit-background', position, 'bingo-money-display',
         )
         self.text = common.getLabel(
-            'money-digit', position, value, S
+            'money-digit', position, value, S, labels.GlyphLabel
         )
         #
         self.append(self.background)
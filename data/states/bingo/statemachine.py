@@ -118,7 +118,6 @@ import collections
 import pygame as pg
 
 from ... import tools
-import pygame
 from . import loggable
 
 
@@ -138,14 +137,11 @@ class StateExecutor(loggable.Loggable):
         self.done = False
         self.verbose = False
         self.paused = False
-        #
-        self.state_clock = pygame.time.Clock()
 
     def update(self, dt):
         """Update the state"""
-        self.state_clock.tick(dt)
         if not self.paused:
-            self.delay -= self.state_clock.get_time()
+            self.delay -= dt
             if not self.done and self.delay < 0:
                 if self.verbose:
                     self.log.debug('{0} {1} doing action'.format(self.name, id(self)))
@@ -195,7 +191,6 @@ class StateMachine(tools._State, loggable.Loggable):
         #
         self.addLogger()
         self.generators = []
-        self.state_clock = pygame.time.Clock()
         self.delay = 0.0
         self.verbose = True
         #
@@ -213,8 +208,7 @@ class StateMachine(tools._State, loggable.Loggable):
     def update(self, surface, keys, now, dt, scale):
         """Update the game state"""
         self.dt = dt
-        self.state_clock.tick(dt)
-        self.delay -= self.state_clock.get_time()
+        self.delay -= dt
         #
         # Process all states
         for executor in list(self.generators):
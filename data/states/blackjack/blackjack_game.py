@@ -1,9 +1,10 @@
 import pygame as pg
-from ... import prepare
+from ... import prepare, tools
 from ...components.labels import Button
 from ...components.cards import Deck
 from ...components.chips import ChipStack, ChipRack, cash_to_chips, chips_to_cash
 from ...components.advisor import Advisor
+from ...components.animation import AnimationGroup
 from ...components.labels import Label
 from .blackjack_dealer import Dealer
 from .blackjack_player import Player
@@ -13,17 +14,19 @@ from .blackjack_hand import Hand
 class BlackjackGame(object):
     """Represents a single game of blackjack."""
     draw_group = pg.sprite.Group()
-    move_animations = pg.sprite.Group()
+    move_animations = AnimationGroup()
     advisor = Advisor(draw_group, move_animations)
     advisor.active = True
-    advisor_back = prepare.GFX["advisor_back"]
-    advisor_front = prepare.GFX["advisor_front"]
-    advisor_back_dim = prepare.GFX["advisor_back_dim"]
-    advisor_front_dim = prepare.GFX["advisor_front_dim"]
+    advisor_back = tools.lazy_attribute(lambda: prepare.GFX["advisor_back"])
+    advisor_front = tools.lazy_attribute(lambda: prepare.GFX["advisor_front"])
+    advisor_back_dim = tools.lazy_attribute(lambda: prepare.GFX["advisor_back_dim"])
+    advisor_front_dim = tools.lazy_attribute(lambda: prepare.GFX["advisor_front_dim"])
     font = prepare.FONTS["Saniretro"]
     result_font = prepare.FONTS["Saniretro"]
-    deal_sounds = [prepare.SFX[name] for name in ["cardplace{}".format(x) for x in (2, 3, 4)]]
-    chip_sounds = [prepare.SFX[name] for name in ["chipsstack{}".format(x) for x in (3, 5, 6)]]
+    deal_sounds = tools.lazy_attribute(lambda: [prepare.SFX["cardplace{}".format(x)]
+                                                for x in (2, 3, 4)])
+    chip_sounds = tools.lazy_attribute(lambda: [prepare.SFX["chipsstack{}".format(x)]
+                                                for x in (3, 5, 6)])
     chip_size = (48, 30)
     screen_rect = pg.Rect((0, 0), prepare.RENDER_SIZE)
     advisor_active = True
@@ -55,7 +58,7 @@ class BlackjackGame(object):
         labels = []
         for info in labels_info:
             label = Label(self.font, info[1], info[0], info[2], info[4], bg=prepare.FELT_GREEN)
-            label.image.set_alpha(info[3])
+            label.set_alpha(info[3])
             labels.append(label)
         return labels
         
@@ -1,3 +1,4 @@
+from ...components import card_core
 from ...components.chips import BetPile
 
 class Hand(object):
@@ -19,20 +20,7 @@ class Hand(object):
         self.bet_amount = 0
         
     def get_scores(self):
-        scores = []
-        scores.append([])
-        cards = self.cards
-        for card in cards:
-            if card.value == 1:
-                new_scores = []
-                for score in scores:
-                    new_scores.append(score + [1])
-                    new_scores.append(score + [11])
-                    scores = new_scores
-            else:
-                for score in scores:
-                    score.append(self.card_values[card.value])
-        return [sum(score) for score in scores]
+        return card_core.blackjack_scores(card.code for card in self.cards)
         
     def best_score(self):
         scores = self.get_scores()
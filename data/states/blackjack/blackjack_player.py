@@ -35,7 +35,7 @@ class Player(object):
             label = Label(self.font, 36, "Bet: ${}".format(amount),
                                 "antiquewhite", {"bottomleft": (hand.tl[0], hand.tl[1] - 3)},
                                 bg=prepare.FELT_GREEN)
-            label.image.set_alpha(160)
+            label.set_alpha(160)
             label.draw(surface)
             
     def move_hands(self, offset):
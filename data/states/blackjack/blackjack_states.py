@@ -4,7 +4,7 @@ from ... import tools, prepare
 from ...components.labels import NeonButton, ButtonGroup
 from ...components.labels import Label, Blinker, MultiLineLabel
 from ...components.angles import get_distance
-from ...components.animation import Animation, Task
+from ...components.animation import Animation, AnimationGroup, Task
 from ...components.chips import BetPile, cash_to_chips
 from ...components.warning_window import WarningWindow
 from .blackjack_hand import Hand
@@ -17,7 +17,7 @@ class BlackjackState(object):
         self.done = False
         self.quit = False
         self.next = None
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         self.window = None
 
     def leave_state(self):
@@ -113,7 +113,7 @@ class Betting(BlackjackState):
             pos = tools.scaled_mouse_pos(scale, event.pos)
             if not self.game.moving_stacks and event.button == 1:
                 new_movers = self.game.player.chip_pile.grab_chips(pos)
-                self.last_click = pg.time.get_ticks()
+                self.last_click = tools.get_ticks()
                 if new_movers:
                     self.play_chip_sound()
                     self.game.moving_stacks.append(new_movers)
@@ -124,7 +124,7 @@ class Betting(BlackjackState):
                         self.game.player.chip_pile.add_chips(unbet_stack.chips)
 
         elif event.type == pg.MOUSEBUTTONUP:
-            now = pg.time.get_ticks()
+            now = tools.get_ticks()
             span = now - self.last_click
             pos = tools.scaled_mouse_pos(scale, event.pos)
             if self.game.moving_stacks and event.button == 1:
@@ -147,7 +147,7 @@ class Betting(BlackjackState):
             self.deal_button.get_event(event)
 
     def update(self, surface, keys, current_time, dt, scale):
-        mouse_pos = tools.scaled_mouse_pos(pg.mouse.get_pos(), scale)
+        mouse_pos = tools.scaled_mouse_pos(scale)
         self.game.update(dt, mouse_pos)
         bets = [x.bet.get_chip_total() for x in self.game.player.hands]
         self.deal_button.visible = any(bets) and not self.game.moving_stacks
@@ -199,7 +199,7 @@ class Dealing(BlackjackState):
 
     def make_card_animations(self):
         g = self.game
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         deal_delay = 0
         for i in range(2):
             card = g.deck.draw_card()
@@ -243,7 +243,7 @@ class Dealing(BlackjackState):
             self.lobby_button.get_event(event)
 
     def update(self, surface, keys, current_time, dt, scale):
-        mouse_pos = tools.scaled_mouse_pos(pg.mouse.get_pos(), scale)
+        mouse_pos = tools.scaled_mouse_pos(scale)
         self.game.update(dt, mouse_pos)
         if self.window:
             self.window.update(mouse_pos)
@@ -384,10 +384,10 @@ class PlayerTurn(BlackjackState):
 
     def startup(self, game):
         self.game = game
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
 
     def get_event(self, event, scale):
-        now = pg.time.get_ticks()
+        now = tools.get_ticks()
         span = now - self.last_click
         if event.type == pg.QUIT:
             self.back_to_lobby()
@@ -401,7 +401,7 @@ class PlayerTurn(BlackjackState):
                 self.buttons.get_event(event)
 
     def update(self, surface, keys, current_time, dt, scale):
-        mouse_pos = tools.scaled_mouse_pos(pg.mouse.get_pos(), scale)
+        mouse_pos = tools.scaled_mouse_pos(scale)
         g = self.game
         g.update(dt, mouse_pos)
 
@@ -528,7 +528,7 @@ class DealerTurn(BlackjackState):
             self.lobby_button.get_event(event)
 
     def update(self, surface, keys, current_time, dt, scale):
-        mouse_pos = tools.scaled_mouse_pos(pg.mouse.get_pos(), scale)
+        mouse_pos = tools.scaled_mouse_pos(scale)
         self.game.update(dt, mouse_pos)
         if self.window:
             self.window.update(mouse_pos)
@@ -674,13 +674,13 @@ class ShowResults(BlackjackState):
             self.lobby_button.get_event(event)
 
     def update(self, surface, keys, current_time, dt, scale):
-        mouse_pos = tools.scaled_mouse_pos(pg.mouse.get_pos(), scale)
+        mouse_pos = tools.scaled_mouse_pos(scale)
         self.game.update(dt, mouse_pos)
         for blinker in self.game.result_labels:
             blinker.update(dt)
         self.animations.update(dt)
         for fader in self.fade_labels:
-            fader.image.set_alpha(self.alpha)
+            fader.set_alpha(self.alpha)
         if self.window:
             self.window.update(mouse_pos)
             if self.window.done:
@@ -764,7 +764,7 @@ class EndRound(BlackjackState):
 
 
     def update(self, surface, keys, current_time, dt, scale):
-        mouse_pos = tools.scaled_mouse_pos(pg.mouse.get_pos(), scale)
+        mouse_pos = tools.scaled_mouse_pos(scale)
         self.game.update(dt, mouse_pos)
         for label in self.game.result_labels:
             label.update(dt)
@@ -2,7 +2,7 @@
 from collections import OrderedDict
 import pygame as pg
 from ... import tools, prepare
-from ...components.labels import NeonButton, Label, ButtonGroup, TextBox
+from ...components.labels import NeonButton, Label, GlyphLabel, ButtonGroup, TextBox
 from . import data, dice, point_chip
 import random
 
@@ -16,11 +16,12 @@ class Craps(tools._State):
         self.table_orig = prepare.GFX['craps_table']
         self.table_color = (0, 153, 51)
         self.set_table()
-        self.bets = data.BETS
+        self.bets = data.make_bets()
 
         self.dice = [dice.Die(self.screen_rect), dice.Die(self.screen_rect, 50)]
         self.dice_total = 0
-        self.update_total_label()
+        self.dice_total_label = GlyphLabel(self.font, self.font_size, "0", "gold3",
+                                           {"center": (1165, 245)})
         self.history = [] #[(1,1),(5,4)]
         self.dice_sounds = [
             prepare.SFX['dice_sound1'],
@@ -113,7 +114,7 @@ class Craps(tools._State):
         self.casino_player.stats["cash"] = self.player.get_chip_total()
 
     def update_total_label(self):
-        self.dice_total_label = Label(self.font, self.font_size, str(self.dice_total), "gold3", {"center": (1165, 245)})
+        self.dice_total_label.set_text(str(self.dice_total))
 
     def update_history(self):
         dice = []
@@ -1,6 +1,6 @@
 from random import randint, choice
 import pygame as pg
-from ... import prepare
+from ... import prepare, tools
 from ...components.labels import Label
 
 STAY_PERCENTS = {
@@ -40,8 +40,10 @@ STAY_PERCENTS = {
             }
 
 class AIPlayer(object):
-    fold_sounds = [prepare.SFX[x] for x in ["cardslide{}".format(num) for num in (2, 3, 4)]]
-    stay_sounds = [prepare.SFX[x] for x in ["knock{}".format(num) for num in range(1, 7)]]
+    fold_sounds = tools.lazy_attribute(lambda: [prepare.SFX["cardslide{}".format(num)]
+                                                for num in (2, 3, 4)])
+    stay_sounds = tools.lazy_attribute(lambda: [prepare.SFX["knock{}".format(num)]
+                                                for num in range(1, 7)])
     def __init__(self, name, orientation, hand_topleft):
         self.name = name
         self.orientation = orientation
@@ -66,13 +68,13 @@ class AIPlayer(object):
             self.card_slots = [slot_rect, slot_rect.move(60, 0)]
         
         self.name_label = Label(font, 48, self.name, "antiquewhite", {"center": name_pos}, bg=prepare.FELT_GREEN)
-        self.name_label.image.set_alpha(100)
+        self.name_label.set_alpha(100)
         center = self.name_label.rect.midbottom
         label_center = center[0], center[1] + 20
         self.stay_label = Label(font, 48, "Stayed in", "gold3", {"center": label_center}, bg=prepare.FELT_GREEN)
-        self.stay_label.image.set_alpha(200)
+        self.stay_label.set_alpha(200)
         self.pass_label = Label(font, 48, "Passed", "darkred", {"center": label_center}, bg=prepare.FELT_GREEN)
-        self.pass_label.image.set_alpha(200)
+        self.pass_label.set_alpha(200)
         self.label = None
         self.dealer_button_topleft = db_pos
         self.guts = randint(-10, 20)
@@ -98,11 +100,8 @@ class AIPlayer(object):
     def fold(self):
         choice(self.fold_sounds).play()
         for card in self.cards:
-            center = card.rect.center
             card.face_up = False
-            card.image = pg.transform.rotate(card.image, -90)
-            card.back_image = pg.transform.rotate(card.back_image, -90)
-            card.rect = card.image.get_rect(center=center)    
+            card.rotate(-90)
         self.cards[1].rect = self.cards[0].rect
         
     def play_hand(self, game):
@@ -153,14 +152,8 @@ class AIPlayer(object):
         
     def align_cards(self):
         for card in self.cards:
-            center = card.rect.center
             if self.orientation == "left":
-                card.rect = pg.Rect(0,0,card.rect.height, card.rect.width)
-                card.image = pg.transform.rotate(card.image, -90)
-                card.back_image = pg.transform.rotate(card.back_image, -90)
+                card.rotate(-90)
             elif self.orientation == "right":
-                card.rect = pg.Rect(0,0,card.rect.height, card.rect.width)
-                card.image = pg.transform.rotate(card.image, 90)
-                card.back_image = pg.transform.rotate(card.back_image, 90)
-            card.rect.center = center
+                card.rotate(90)
             
\ No newline at end of file
@@ -1,7 +1,9 @@
 from random import randint
+import pygame as pg
 from ... import prepare
+from ...components import poker_eval
 from ...components.cards import Deck
-from ...components.labels import Label
+from ...components.labels import GlyphLabel
 from .guts_helpers import DealerButton
 
 class GutsGame(object):
@@ -18,6 +20,8 @@ class GutsGame(object):
         self.deal_queue = self.make_deal_queue()
         self.deck = Deck((640,400))
         self.font = prepare.FONTS["Saniretro"]
+        self.pot_label = GlyphLabel(self.font, 48, "", "antiquewhite",
+                                    {"midleft": (650, 610)}) #{"center": (700, 610)})
         self.make_labels()
         self.free_ride = free_ride
         self.game_over = False
@@ -32,48 +36,14 @@ class GutsGame(object):
     
     def make_labels(self):
         color= "antiquewhite" if self.pot != 420 else "darkgreen"
-        self.pot_label = Label(self.font, 48, "Pot: ${}".format(self.pot), color, 
-                                       {"midleft": (650, 610)}) #{"center": (700, 610)})
+        self.pot_label.color = pg.Color(color)
+        self.pot_label.set_text("Pot: ${}".format(self.pot))
         
-    def compare_hands(self, player1, player2):
-        h1 = []
-        h2 = []
-        for player, vals in [(player1, h1), (player2, h2)]:
-            for card in player.cards:
-                val = card.value if card.value != 1 else 14
-                vals.append(val)
-        h1.sort(reverse=True)
-        h2.sort(reverse=True)
-        if h1 == h2:
-            return [player1, player2]
-        elif h2[0] == h2[1]:
-            if h1[0] == h1[1] and h1[0] > h2[0]:
-                return [player1]                
-            else:
-                return [player2]
-        else:
-            if h1[0] > h2[0] or h1[0] == h1[1]:
-                return [player1]            
-            elif h1[0] == h2[0]:
-                if h1[1] > h2[1]:
-                    return [player1]
-                else:
-                    return [player2]
-            else:
-                return [player2]
-
     def get_winners(self):
+        """Return the players who stayed in with the best hand."""
         stayed = [x for x in self.players if x.stayed]
-        best = []
-        for stayer in stayed:
-            if not best:
-                best.append(stayer)
-            else:
-                new_best = []
-                for b in best:
-                    new_best.extend(self.compare_hands(b, stayer))
-                best = new_best
-        return best
+        hands = [[card.code for card in player.cards] for player in stayed]
+        return [stayed[i] for i in poker_eval.best(hands)]
                 
             
     def draw(self, surface):
@@ -1,13 +1,15 @@
 from random import choice
 import pygame as pg
-from ... import prepare
+from ... import prepare, tools
 from ...components.chips import ChipPile
 from ...components.labels import Label
 
 
 class GutsPlayer(object):
-    fold_sounds = [prepare.SFX[x] for x in ["cardslide{}".format(num) for num in (2, 3, 4)]]
-    stay_sounds = [prepare.SFX[x] for x in ["knock{}".format(num) for num in range(1, 7)]]
+    fold_sounds = tools.lazy_attribute(lambda: [prepare.SFX["cardslide{}".format(num)]
+                                                for num in (2, 3, 4)])
+    stay_sounds = tools.lazy_attribute(lambda: [prepare.SFX["knock{}".format(num)]
+                                                for num in range(1, 7)])
     def __init__(self, cash=0, chips=None):
         self.name = "YOU"
         self.cards = []
@@ -21,7 +23,7 @@ class GutsPlayer(object):
         self.pass_label = Label(font, 48, "Passed", "darkred", {"center": label_center}, bg=prepare.FELT_GREEN)
         self.name_label = Label(font, 48, self.name, "gold3", {"center": (label_center[0], label_center[1] + 60)})
         for label in [self.stay_label, self.pass_label, self.name_label]:
-            label.image.set_alpha(200)
+            label.set_alpha(200)
         self.label = None
         self.dealer_button_topleft = label_center[0] - 40, label_center[1] - 100
         slot_rect = pg.Rect((645, 860), prepare.CARD_SIZE)
@@ -65,11 +67,8 @@ class GutsPlayer(object):
         
     def fold(self):
         for card in self.cards:
-            center = card.rect.center
             card.face_up = False
-            card.image = pg.transform.rotate(card.image, -90)
-            card.back_image = pg.transform.rotate(card.back_image, -90)
-            card.rect = card.image.get_rect(center=center)    
+            card.rotate(-90)
         self.cards[1].rect = self.cards[0].rect        
         
     def bet(self, amount):
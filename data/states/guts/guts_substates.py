@@ -3,26 +3,29 @@ import pygame as pg
 from ... import prepare, tools
 from ...components.labels import Label, NeonButton, ButtonGroup, MoneyIcon, Button, Blinker
 from ...components.labels import MultiLineLabel
-from ...components.animation import Animation, Task
+from ...components.animation import Animation, AnimationGroup, Task
 from ...components.advisor import Advisor
 from ...components.warning_window import WarningWindow, NoticeWindow
 
 
 class GutsState(object):
     font = prepare.FONTS["Saniretro"]
-    deal_sounds = [prepare.SFX["cardshove{}".format(x)] for x in (1,3,4)]
-    flip_sounds = [prepare.SFX["cardplace{}".format(x)] for x in (2,3,4)]
-    cha_ching = prepare.SFX["coins"]
+    deal_sounds = tools.lazy_attribute(lambda: [prepare.SFX["cardshove{}".format(x)]
+                                                for x in (1,3,4)])
+    flip_sounds = tools.lazy_attribute(lambda: [prepare.SFX["cardplace{}".format(x)]
+                                                for x in (2,3,4)])
+    cha_ching = tools.lazy_attribute(lambda: prepare.SFX["coins"])
     screen_rect = pg.Rect((0,0), prepare.RENDER_SIZE)
-    money_icon = MoneyIcon((0, screen_rect.bottom - 75))
+    money_icon = tools.lazy_attribute(
+        lambda: MoneyIcon((0, GutsState.screen_rect.bottom - 75)))
     draw_group = pg.sprite.Group()
-    move_animations = pg.sprite.Group()
+    move_animations = AnimationGroup()
     advisor = Advisor(draw_group, move_animations)
     advisor.active = True
-    advisor_back = prepare.GFX["advisor_back"]
-    advisor_front = prepare.GFX["advisor_front"]
-    advisor_back_dim = prepare.GFX["advisor_back_dim"]
-    advisor_front_dim = prepare.GFX["advisor_front_dim"]
+    advisor_back = tools.lazy_attribute(lambda: prepare.GFX["advisor_back"])
+    advisor_front = tools.lazy_attribute(lambda: prepare.GFX["advisor_front"])
+    advisor_back_dim = tools.lazy_attribute(lambda: prepare.GFX["advisor_back_dim"])
+    advisor_front_dim = tools.lazy_attribute(lambda: prepare.GFX["advisor_front_dim"])
     advisor_active = True
     window = None
     def __init__(self):
@@ -35,7 +38,7 @@ class GutsState(object):
         pos = (self.screen_rect.right-(NeonButton.width+10),
                self.screen_rect.bottom-(NeonButton.height+10))
         lobby_button = NeonButton(pos, "Lobby", self.back_to_lobby, None, self.buttons, bindings=[pg.K_ESCAPE])
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         
     def warn(self, *args):
         warning = "Exiting the game will abandon the current pot!"
@@ -118,7 +121,7 @@ class Tutorial(GutsState):
 
 
     def make_labels(self):
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         rules = [
                 "Players place their ante in the pot",
                 "Two cards are dealt to each player",
@@ -170,7 +173,7 @@ class Tutorial(GutsState):
         self.general_update(dt, mouse_pos)
         if not self.window:
             if self.label:
-                self.label.image.set_alpha(self.label.alpha)
+                self.label.set_alpha(self.label.alpha)
                 if self.label.alpha <= 0:
                     self.next_label()
             else:
@@ -221,11 +224,11 @@ class StartGame(GutsState):
         title = Label(self.font, 128, "Two-Card Guts", "gold3",
                           {"midtop": (sr.centerx, 5)},
                           bg=prepare.FELT_GREEN)
-        title.image.set_alpha(160)
+        title.set_alpha(160)
         title2 = Label(self.font, 96, "${} Ante".format(self.game.bet), "darkred",
                             {"midtop": (sr.centerx, title.rect.bottom)},
                             bg=prepare.FELT_GREEN)
-        title2.image.set_alpha(140)
+        title2.set_alpha(140)
         self.titles = [title, title2]
         self.player_buttons = ButtonGroup()
         w, h = NeonButton.width, NeonButton.height
@@ -291,11 +294,11 @@ class Betting(GutsState):
         self.labels = []
         self.alpha = 255
         self.big_alpha = 255
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         text = "Free Ride" if self.game.free_ride else "Ante Up"     
         self.big_label = Label(self.font, 320, text, "gold3",
                            {"center": sr.center}, bg=prepare.FELT_GREEN)
-        self.big_label.image.set_colorkey(prepare.FELT_GREEN)
+        self.big_label.set_colorkey(prepare.FELT_GREEN)
         left, top = self.big_label.rect.topleft
         ani = Animation(x=left, y=top-500, duration=2000, round_values=True)
         fade = Animation(alpha=0, duration=2000, round_values=True)
@@ -310,7 +313,7 @@ class Betting(GutsState):
                 pos = p.name_label.rect.center
                 label = Label(self.font, 96, "${}".format(self.game.bet), "darkred",
                                     {"center": pos}, bg=prepare.FELT_GREEN)
-                label.image.set_colorkey(prepare.FELT_GREEN)
+                label.set_colorkey(prepare.FELT_GREEN)
                 left, top = label.rect.topleft
                 self.labels.append(label)
                 ani = Animation(centerx=dest[0], centery=dest[1], duration=2000, delay=50,
@@ -351,8 +354,8 @@ class Betting(GutsState):
             self.done = True
             self.next = "Dealing"
         for label in self.labels:
-            label.image.set_alpha(self.alpha)
-        self.big_label.image.set_alpha(self.big_alpha)
+            label.set_alpha(self.alpha)
+        self.big_label.set_alpha(self.big_alpha)
         
     def draw(self, surface):
         if not self.done:
@@ -386,7 +389,7 @@ class Dealing(GutsState):
             self.buttons.get_event(event)
 
     def make_dealing_animations(self):
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         delay_time = 100
         for player in self.game.deal_queue:
             toggle = 0
@@ -439,7 +442,7 @@ class PlayerTurn(GutsState):
         self.game = game
         self.current_player = self.game.deal_queue[self.game.current_player_index]
         self.player_buttons = ButtonGroup()
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         self.timer  = 0
         self.time_limit = 600
 
@@ -549,8 +552,8 @@ class ShowCards(GutsState):
         self.label = Label(self.font, self.showdown_font_size, "Showdown!", "gold3",
                                 {"center": pos}, 
                                 bg=prepare.FELT_GREEN)
-        self.label.image.set_colorkey(prepare.FELT_GREEN)
-        self.label.image.set_alpha(self.alpha)
+        self.label.set_colorkey(prepare.FELT_GREEN)
+        self.label.set_alpha(self.alpha)
         
     def get_event(self, event):
         if self.window:
@@ -623,7 +626,7 @@ class ShowResults(GutsState):
         self.labels = []
         self.blinkers = []
         self.calculated = False
-        self.animations = pg.sprite.Group()
+        self.animations = AnimationGroup()
         
         stayers = [x for x in self.game.players if x.stayed]
         winners = self.game.get_winners()
@@ -668,7 +671,7 @@ class ShowResults(GutsState):
                 self.animations.add(Task(self.blinkers.append, ani_duration, args=[win_label]))
             label = Label(self.font, 128, text, color,
                     {"center": pos}, bg=prepare.FELT_GREEN)
-            label.image.set_colorkey(prepare.FELT_GREEN)
+            label.set_colorkey(prepare.FELT_GREEN)
             self.labels.append(label)
             move = Animation(centerx=dest[0], centery=dest[1], duration=ani_duration,
                                         round_values=True, transition="in_quart")
@@ -690,7 +693,7 @@ class ShowResults(GutsState):
 
     def fade_labels(self):
         for label in self.labels:
-            label.image.set_alpha(self.alpha)
+            label.set_alpha(self.alpha)
 
     def update(self, dt, scale):
         mouse_pos = tools.scaled_mouse_pos(scale)
@@ -3,7 +3,7 @@ import random
 import pygame as pg
 from ...components.loggable import getLogger
 from ...components.warning_window import NoticeWindow
-from ...components.labels import Label, MultiLineLabel, NeonButton, ButtonGroup
+from ...components.labels import Label, GlyphLabel, MultiLineLabel, NeonButton, ButtonGroup
 from ... import tools, prepare
 from .model import Wallet, Pot, InsufficientFundsException
 
@@ -361,12 +361,16 @@ class Keno(tools._State):
             'play_max'      : self.playing_max,
             'pay_table'     : self.pay_table,
             'round_history' : self.round_history,
-            'balance'       : None,
+            'balance'       : GlyphLabel(self.font, 48, "", "gold3",
+                                         {"topleft": (24, 760)}),
             'bet_action'    : None,
             'clear'         : None,
-            'bet'           : None,
-            'won'           : None,
-            'spot'          : None,
+            'bet'           : GlyphLabel(self.font, 48, "", "gold3",
+                                         {"topleft": (24, 760+48)}),
+            'won'           : GlyphLabel(self.font, 48, "", "gold3",
+                                         {"topleft": (24, 760+48+48)}),
+            'spot'          : GlyphLabel(self.font, 48, "", "gold3",
+                                         {"topleft": (1036, 760)}),
         }
 
     def activate_quick_pick(self):
@@ -573,22 +577,17 @@ class Keno(tools._State):
             self.play_game()
 
         total_text = "Balance:  ${}".format(self.wallet.balance)
-
-        self.gui_widgets['balance'] = Label(self.font, 48, total_text, "gold3",
-                               {"topleft": (24, 760)})
+        self.gui_widgets['balance'].set_text(total_text)
 
         bet_text = "Bet: ${}".format(self.pot._balance)
-        self.gui_widgets['bet'] = Label(self.font, 48, bet_text, "gold3",
-                               {"topleft": (24, 760+48)})
+        self.gui_widgets['bet'].set_text(bet_text)
 
         won_text = "Won: ${}".format(self.pot.won)
-        self.gui_widgets['won'] = Label(self.font, 48, won_text, "gold3",
-                               {"topleft": (24, 760+48+48)})
+        self.gui_widgets['won'].set_text(won_text)
 
         spot_count = self.keno_card.spot_count
         spot_text = "Spot: {}".format(spot_count)
-        self.gui_widgets['spot'] = Label(self.font, 48, spot_text, "gold3",
-                               {"topleft": (1036, 760)})
+        self.gui_widgets['spot'].set_text(spot_text)
 
         mouse_pos = tools.scaled_mouse_pos(scale)
         self.buttons.update(mouse_pos)
@@ -139,6 +139,8 @@ class LobbyScreen(tools._State):
         self.chip_curtain.update(dt)
         self.buttons.update(mouse_pos)
         self.game_buttons.update(mouse_pos)
+        hovered = [game.args for game in self.game_buttons if game.hover]
+        self.prefetch = hovered[0] if hovered else None
         self.animations.update(dt)
         self.draw(surface)
 
@@ -190,13 +190,18 @@ class Pachinko(tools._State):
                 self._clicked_sprite = None
 
     def update(self, surface, keys, current_time, dt, scale):
-        if self._needs_clear:
+        redrawn = self._needs_clear
+        if redrawn:
             surface.fill(prepare.BACKGROUND_BASE)
             self._needs_clear = False
 
-        self.playfield.update(surface, dt)
+        dirty = self.playfield.update(surface, dt)
         self.hud.clear(surface, self._clear_surface)
-        self.hud.draw(surface)
+        hud_dirty = self.hud.draw(surface)
+        if redrawn or dirty is None:
+            self.dirty_rects = None
+        else:
+            self.dirty_rects = dirty + hud_dirty
 
     @staticmethod
     def _clear_surface(surface, rect):
@@ -18,6 +18,7 @@ import pygame.draw
 from pygame.transform import rotozoom, smoothscale
 from .rect import *
 from ... import prepare
+from ...components.animation import AnimationGroup, Task
 from ...prepare import BROADCASTER as B
 
 __all__ = ['Playfield']
@@ -119,30 +120,6 @@ def load_json(space, filename):
                 yield i
 
 
-class Task(pygame.sprite.Sprite):
-    def __init__(self, callback, interval=0, loops=1, args=None, kwargs=None):
-        assert (callable(callback))
-        assert (loops >= -1)
-        super(Task, self).__init__()
-        self.interval = interval
-        self.loops = loops
-        self.callback = callback
-        self._timer = 0
-        self._args = args if args else list()
-        self._kwargs = kwargs if kwargs else dict()
-        self._loops = loops
-
-    def update(self, delta):
-        self._timer += delta
-        if self._timer >= self.interval:
-            self._timer -= self.interval
-            self.callback(*self._args, **self._kwargs)
-            if not self._loops == -1:
-                self._loops -= 1
-                if self._loops <= 0:
-                    self.kill()
-
-
 class PhysicsSprite(pygame.sprite.DirtySprite):
     def __init__(self):
         super(PhysicsSprite, self).__init__()
@@ -355,7 +332,7 @@ class Playfield(pygame.sprite.LayeredDirty):
         self.background = None
         self.step_amount = 1 / 30. / 10
         self.step_times = 10
-        self.timers = pygame.sprite.Group()
+        self.timers = AnimationGroup()
 
         for item in load_json(self._space, 'default.json'):
             self.add(item)
@@ -367,21 +344,21 @@ class Playfield(pygame.sprite.LayeredDirty):
             ball, pocket = arbiter.shapes
             ball.needs_remove = True
             self.ball_tray += self.jackpot_amount + 1
-            B.processEvent(('pachinko_jackpot', self))
-            B.processEvent(('pachinko_tray', self))
+            B.postEvent(('pachinko_jackpot', self))
+            B.postEvent(('pachinko_tray', self), coalesce=True)
             return True
 
         def on_ball_return(space, arbiter):
             ball, pocket = arbiter.shapes
             ball.needs_remove = True
             self.ball_tray += 1
-            B.processEvent(('pachinko_tray', self))
+            B.postEvent(('pachinko_tray', self), coalesce=True)
             return True
 
         def on_ball_fail(space, arbiter):
             ball, pocket = arbiter.shapes
             ball.needs_remove = True
-            B.processEvent(('pachinko_gutter', self))
+            B.postEvent(('pachinko_gutter', self))
             return True
 
         f = self._space.add_collision_handler
@@ -400,7 +377,7 @@ class Playfield(pygame.sprite.LayeredDirty):
         if not self._plunger.chute_counter and self.ball_tray:
             self.add(Ball(space, self._plunger.ball_chute))
             self.ball_tray -= 1
-            B.processEvent(('pachinko_tray', self))
+            B.postEvent(('pachinko_tray', self), coalesce=True)
 
     def add(self, *items):
         for item in items:
@@ -435,7 +412,8 @@ class Playfield(pygame.sprite.LayeredDirty):
         for i in xrange(self.step_times):
             step(dt)
 
-        if self.background is None:
+        redrawn = self.background is None
+        if redrawn:
             self.background = pygame.Surface(surface.get_size())
             self.background.fill(prepare.BACKGROUND_BASE)
             image = pygame.image.load(
@@ -446,7 +424,8 @@ class Playfield(pygame.sprite.LayeredDirty):
 
         super(Playfield, self).update(dt)
         self.clear(surface, self.background)
-        self.draw(surface)
+        dirty = self.draw(surface)
+        return None if redrawn else dirty
 
     def depress_plunger(self):
         self._plunger.spring.damping = 100
@@ -1,5 +1,6 @@
 import pygame
 from ... import prepare
+from ...components import text_cache
 
 __all__ = ['TextSprite', 'Button', 'NeonButton']
 
@@ -26,10 +27,14 @@ class TextSprite(pygame.sprite.DirtySprite):
             surface.blit(image, rect)
         return image
 
+    def render(self):
+        """Return the image to show, shared through the text cache."""
+        return text_cache.render(self._font, self._text, True, self._fg,
+                                 self._bg)
+
     def update_image(self):
-        image = self.draw()
-        self.image = image.convert_alpha()
-        self.rect = image.get_rect(topleft=self.rect.topleft)
+        self.image = self.render()
+        self.rect = self.image.get_rect(topleft=self.rect.topleft)
         self.dirty = 1
 
     @property
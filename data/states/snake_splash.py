@@ -13,6 +13,7 @@ class SnakeSplash(tools._State):
         self.on = False
         self.duration = 3000
         self.use_music_handler = False
+        self.native_resolution = prepare.ARGS["native"]
 
     def startup(self, current_time, persistent):
         """This method will be called each time the state resumes."""
@@ -33,7 +34,11 @@ class SnakeSplash(tools._State):
         """This method handles drawing/blitting the state each frame."""
         surface.fill(prepare.BACKGROUND_BASE)
         if self.on:
-            surface.blit(self.image, (175, 0))
+            if self.native_resolution:
+                image = prepare.SCALED.image("snakesign")
+                surface.blit(image, prepare.SCALED.pos((175, 0)))
+            else:
+                surface.blit(self.image, (175, 0))
 
     def update(self, surface, keys, current_time, dt, scale):
         """
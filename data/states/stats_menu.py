@@ -21,6 +21,7 @@ class StatsMenu(tools._State):
         self.labels = []
         self.lines = []
         self.use_music_handler = False
+        self.idle = True
 
     def make_labels(self):
         self.labels = []
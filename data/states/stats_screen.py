@@ -1,5 +1,6 @@
 import pygame as pg
 from .. import tools, prepare
+from ..components import text_cache
 from ..components.labels import Label, GroupLabel, NeonButton, ButtonGroup
 
 
@@ -13,6 +14,8 @@ class StatsScreen(tools._State):
         self.buttons = self.make_buttons(screen_rect)
         self.labels = []
         self.use_music_handler = False
+        self.native_resolution = prepare.ARGS["native"]
+        self.idle = True
 
     def make_buttons(self, screen_rect):
         buttons = ButtonGroup()
@@ -56,11 +59,26 @@ class StatsScreen(tools._State):
 
     def draw(self, surface):
         surface.fill(prepare.BACKGROUND_BASE)
-        for label in self.labels:
-            label.draw(surface)
-        self.buttons.draw(surface)
+        if self.native_resolution:
+            scaled = prepare.SCALED
+            for label in self.labels:
+                #Render the text at window size rather than scaling it
+                font = scaled.font(label.path, label.size)
+                image = text_cache.render(font, label.text, True,
+                                          label.color, label.bg or None)
+                anchor = {name: scaled.pos(pos)
+                          for name, pos in label.rect_attr.items()}
+                surface.blit(image, image.get_rect(**anchor))
+            for button in self.buttons:
+                image = scaled.surface(button.image)
+                surface.blit(image, scaled.pos(button.rect.topleft))
+        else:
+            for label in self.labels:
+                label.draw(surface)
+            self.buttons.draw(surface)
 
     def update(self, surface, keys, current_time, dt, scale):
         mouse_pos = tools.scaled_mouse_pos(scale)
         self.buttons.update(mouse_pos)
-        self.draw(surface)
\ No newline at end of file
+        self.draw(surface)
+        self.dirty_rects = [button.rect for button in self.buttons]
\ No newline at end of file
@@ -2,6 +2,7 @@ import pygame as pg
 from ... import tools, prepare
 from ...components.labels import NeonButton
 from .video_poker_machine import Machine
+from .video_poker_advisor import HoldAdvisor
 
 
 class VideoPoker(tools._State):
@@ -11,11 +12,15 @@ class VideoPoker(tools._State):
         w, h = prepare.RENDER_SIZE
         self.screen_rect = pg.Rect((0, 0), (w, h))
         self.machine = Machine((0, 0), (w - 300, h))
+        if prepare.ARGS["hold_advice"]:
+            self.machine.advisor = HoldAdvisor(prepare.HOLD_CACHE)
         pos = (self.screen_rect.right-330, self.screen_rect.bottom-120)
         self.lobby_button = NeonButton(pos, "lobby", self.back_to_lobby)
         self.casino_player = None
 
     def back_to_lobby(self, *args):
+        if self.machine.advisor is not None:
+            self.machine.advisor.save()
         self.done = True
         self.next = "LOBBYSCREEN"
 
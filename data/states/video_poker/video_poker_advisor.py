@@ -0,0 +1,267 @@
+"""
+Hold advice for Jacks or Better.
+
+For a dealt hand of five card_core ints, count_holds works out, for each
+of the 32 ways of holding its cards, how many of the possible draws end in
+each paying hand.  Holds are numbered by bit mask: bit i is set if card i
+is held, so 0 draws five new cards and 31 stands pat.
+
+Rather than evaluating every draw (about 1.5 million for one hand), draws
+are counted by the values they bring: a draw of values {Q, Q, 7} can be
+made in C(3, 2) * C(4, 1) ways if three Queens and four Sevens are left,
+and without flushes its hand only depends on the values.  The ways of
+drawing each set of values are worked out once per hand and shared by all
+32 holds, and flushes are then corrected for by going through the few
+draws that stay in the held suit.
+
+The counts only depend on the cards up to a change of suits, so
+HoldAdvisor caches them by the hand with its suits renamed into a
+canonical order, keeping the most recently seen hands, and can keep the
+cache in a file between runs.  The expected pay of each hold is then a
+dot product with a row of PAYTABLE.
+"""
+
+import json
+from collections import OrderedDict
+from itertools import combinations, combinations_with_replacement, permutations
+
+from ...components import card_core, poker_eval
+from ...components.loggable import getLogger
+from .video_poker_dealer import video_poker_rank
+from .video_poker_data import HAND_RANKS, NO_HAND, PAYTABLE
+
+
+HAND_SIZE = 5
+NUM_HOLDS = 1 << HAND_SIZE
+#Counts are kept for each paying hand (by HAND_RANKS) then for NO_HAND.
+NOTHING = len(HAND_RANKS)
+DECK_LEFT = card_core.DECK_SIZE - HAND_SIZE
+#COMBINATIONS[n][k] is n choose k (0 if k > n).
+COMBINATIONS = [[1] + [0]*card_core.DECK_SIZE]
+for _n in range(card_core.DECK_SIZE):
+    _row = COMBINATIONS[-1]
+    COMBINATIONS.append([1] + [_row[k - 1] + _row[k]
+                               for k in range(1, card_core.DECK_SIZE + 1)])
+SUIT_PERMUTATIONS = tuple(permutations(range(len(card_core.SUITS))))
+#Hands a HoldAdvisor remembers by default (about 1KB each when saved).
+MAX_HANDS = 2000
+
+logger = getLogger('video_poker')
+
+_tables = None
+
+
+def _hand_index(rank):
+    index = video_poker_rank(rank)
+    return NOTHING if index == NO_HAND else index
+
+
+def _build_tables():
+    """
+    The paying hand of every set of five values without a flush (by the
+    product of their primes), of every flush (by its bit pattern), and the
+    product and (value, count) pairs of every set of up to five values.
+    """
+    flushes, unique5, products, pairs2 = poker_eval.tables()
+    by_product = {}
+    for product, rank in products.items():
+        by_product[product] = _hand_index(rank)
+    for bits, rank in enumerate(unique5):
+        if rank:
+            product = 1
+            for value in range(13):
+                if bits >> value & 1:
+                    product *= poker_eval.PRIMES[value]
+            by_product[product] = _hand_index(rank)
+    by_flush = [_hand_index(rank) if rank else NOTHING for rank in flushes]
+    draws = []
+    for size in range(HAND_SIZE + 1):
+        sets = []
+        for values in combinations_with_replacement(range(13), size):
+            product = 1
+            for value in values:
+                product *= poker_eval.PRIMES[value]
+            counts = tuple((value, values.count(value)) for value in sorted(set(values)))
+            sets.append((product, counts))
+        draws.append(sets)
+    return by_product, by_flush, draws
+
+
+def tables():
+    """The lookup tables: (by_product, by_flush, draws)."""
+    global _tables
+    if _tables is None:
+        _tables = _build_tables()
+    return _tables
+
+
+def count_holds(cards):
+    """
+    Count the draws for each hold of the five cards. Returns a list,
+    indexed by hold mask, of lists of how many draws end in each paying
+    hand (indexed by HAND_RANKS), followed by how many pay nothing.
+    """
+    by_product, by_flush, draws = tables()
+    values = [poker_eval.CARD_RANKS[card] for card in cards]
+    suits = [poker_eval.CARD_SUITS[card] for card in cards]
+    left = [4] * 13
+    for value in values:
+        left[value] -= 1
+    #The values still in the deck for each suit.
+    suit_left = [[value for value in range(13)
+                  if suit*13 + (value + 1) % 13 not in cards]
+                 for suit in range(len(card_core.SUITS))]
+
+    #The ways of drawing each set of values, shared by all the holds.
+    ways = []
+    for sets in draws:
+        found = []
+        for product, counts in sets:
+            total = 1
+            for value, count in counts:
+                total *= COMBINATIONS[left[value]][count]
+                if not total:
+                    break
+            else:
+                found.append((product, total))
+        ways.append(found)
+
+    results = []
+    for hold in range(NUM_HOLDS):
+        held = [index for index in range(HAND_SIZE) if hold >> index & 1]
+        held_product = 1
+        held_bits = 0
+        for index in held:
+            held_product *= poker_eval.PRIMES[values[index]]
+            held_bits |= 1 << values[index]
+        counts = [0] * (NOTHING + 1)
+        for product, total in ways[HAND_SIZE - len(held)]:
+            counts[by_product[held_product * product]] += total
+
+        #Draws all in the held suit were counted above as if they weren't.
+        held_suits = set(suits[index] for index in held)
+        if len(held_suits) < 2:
+            for suit in held_suits or range(len(card_core.SUITS)):
+                for drawn in combinations(suit_left[suit], HAND_SIZE - len(held)):
+                    product = held_product
+                    bits = held_bits
+                    for value in drawn:
+                        product *= poker_eval.PRIMES[value]
+                        bits |= 1 << value
+                    counts[by_product[product]] -= 1
+                    counts[by_flush[bits]] += 1
+        results.append(counts)
+    return results
+
+
+def hold_values(counts, bet=1):
+    """
+    The expected pay in credits of each hold, from the counts of
+    count_holds, for a bet of 1 to 5 credits.
+    """
+    pays = PAYTABLE[bet - 1] + (0,)
+    values = []
+    for hold, hands in enumerate(counts):
+        draws = COMBINATIONS[DECK_LEFT][HAND_SIZE - bin(hold).count("1")]
+        values.append(sum(pay*count for pay, count in zip(pays, hands)) / float(draws))
+    return values
+
+
+def held_cards(hold):
+    """The indices of the cards held by a hold mask."""
+    return [index for index in range(HAND_SIZE) if hold >> index & 1]
+
+
+def canonical(cards):
+    """
+    Return the cards, sorted, with their suits renamed so that every hand
+    the same up to a change of suits gives the same tuple, and the
+    position in it of each of the cards.
+    """
+    best = None
+    for order in SUIT_PERMUTATIONS:
+        renamed = [order[card // 13]*13 + card % 13 for card in cards]
+        key = tuple(sorted(renamed))
+        if best is None or key < best[0]:
+            best = key, renamed
+    key, renamed = best
+    return key, [key.index(card) for card in renamed]
+
+
+class HoldAdvisor(object):
+    """
+    Works out the best hold of a hand, remembering the counts of the
+    max_hands hands it has seen most recently by their canonical form. If
+    path is given the cache is read from that file now and written back by
+    save.
+    """
+    def __init__(self, path=None, max_hands=MAX_HANDS):
+        self.path = path
+        self.max_hands = max_hands
+        self.cache = OrderedDict()
+        #True while the cache has hands that aren't saved
+        self.changed = False
+        if path is not None:
+            self.load()
+
+    def load(self):
+        """Read the cache saved by an earlier run, if there is one."""
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (IOError, OSError, ValueError):
+            return
+        #Saved least recently seen first.
+        for key, counts in saved.items():
+            self.cache[tuple(int(card) for card in key.split())] = counts
+        self._shrink()
+
+    def save(self):
+        """
+        Write the cache to path if it has new hands. Returns False if the
+        file couldn't be written, in which case the cache is kept to try
+        again later.
+        """
+        if self.path is None or not self.changed:
+            return True
+        saved = OrderedDict((" ".join(str(card) for card in key), counts)
+                            for key, counts in self.cache.items())
+        try:
+            with open(self.path, "w") as f:
+                json.dump(saved, f, separators=(",", ":"))
+        except (IOError, OSError) as error:
+            logger.error("Could not save hold advice: {}".format(error))
+            return False
+        self.changed = False
+        return True
+
+    def _shrink(self):
+        while len(self.cache) > self.max_hands:
+            self.cache.popitem(last=False)
+
+    def counts(self, cards):
+        """count_holds for cards, from the cache if the hand was seen before."""
+        key, positions = canonical(cards)
+        try:
+            counts = self.cache.pop(key)
+        except KeyError:
+            counts = count_holds(key)
+            self.changed = True
+        self.cache[key] = counts
+        self._shrink()
+        #Renumber the holds from the canonical order to the order of cards.
+        result = []
+        for hold in range(NUM_HOLDS):
+            result.append(counts[sum(1 << positions[index]
+                                     for index in held_cards(hold))])
+        return result
+
+    def values(self, cards, bet=1):
+        """The expected pay of each hold of cards (see hold_values)."""
+        return hold_values(self.counts(cards), bet)
+
+    def best_hold(self, cards, bet=1):
+        """The hold mask with the highest expected pay, and that pay."""
+        values = self.values(cards, bet)
+        hold = max(range(NUM_HOLDS), key=values.__getitem__)
+        return hold, values[hold]
@@ -1,10 +1,35 @@
 import pygame as pg
 from ... import prepare
 from ...components.labels import Blinker, Label
+from ...components import poker_eval
 from ...components.cards import Deck
 from .video_poker_data import *
 
 
+#The paying hand (see HAND_RANKS) of each poker_eval.category.
+CATEGORY_RANKS = {"Straight Flush"  : HAND_RANKS['STR_FLUSH'],
+                  "Four of a Kind"  : HAND_RANKS['4_OF_A_KIND'],
+                  "Full House"      : HAND_RANKS['FULL_HOUSE'],
+                  "Flush"           : HAND_RANKS['FLUSH'],
+                  "Straight"        : HAND_RANKS['STRAIGHT'],
+                  "Three of a Kind" : HAND_RANKS['THREE_OF_A_KIND'],
+                  "Two Pair"        : HAND_RANKS['TWO_PAIR']}
+#Values of the pairs that pay as Jacks or Better (1 is the Ace).
+HIGH_PAIRS = (1, 11, 12, 13)
+
+
+def video_poker_rank(rank):
+    """Return the HAND_RANKS entry (or NO_HAND) of a poker_eval rank."""
+    if rank == 1:
+        return HAND_RANKS['ROYAL_FLUSH']
+    kind = poker_eval.category(rank)
+    if kind in CATEGORY_RANKS:
+        return CATEGORY_RANKS[kind]
+    if poker_eval.pair_value(rank) in HIGH_PAIRS:
+        return HAND_RANKS['JACKS_OR_BETTER']
+    return NO_HAND
+
+
 class Dealer:
     def __init__(self, topleft, size):
         self.rect = pg.Rect(topleft, size)
@@ -126,91 +151,8 @@ class Dealer:
             return not val1 > val2
 
     def evaluate_hand(self):
-        values = []
-        suits = []
-        for card in self.hand:
-            values.append(card.value)
-            suits.append(card.suit)
-
-        values.sort()
-        suits.sort()
-
-        # if don't match any rank
-        rank = NO_HAND
-
-        pairs = []
-        are_three = False
-        for val in values:
-            matches = values.count(val)
-            if matches == 2:
-                if val not in pairs:
-                    pairs.append(val)
-            elif matches == 3:
-                if not are_three:
-                    are_three = True
-
-        pairs_len = len(pairs)
-        if pairs_len == 1 and are_three:
-            """Full house"""
-            rank = HAND_RANKS['FULL_HOUSE']
-
-        elif pairs_len == 1:
-            """ Jacks or betters"""
-            if 1 in pairs or 11 in pairs or 12 in pairs or 13 in pairs:
-                rank = HAND_RANKS['JACKS_OR_BETTER']
-
-        elif pairs_len == 2:
-            """Two pair"""
-            rank = HAND_RANKS['TWO_PAIR']
-
-        elif are_three:
-            """Three of a kind"""
-            rank = HAND_RANKS['THREE_OF_A_KIND']
-
-        """Straight, if is an Ace in the hand, Check if other 4 cards are
-            K, Q, J, 10 or  2, 3, 4, 5
-            else Check if 5 cards are continuous in rank"""
-        if 1 in values:
-            a = values[1] == 2 and values[2] == 3 \
-                and values[3] == 4 and values[4] == 5
-            b = values[1] == 10 and values[2] == 11 \
-                and values[3] == 12 and values[4] == 13
-            is_straight = a or b
-        else:
-            test_value = values[0] + 1
-            is_straight = True
-            for i in range(1, 5):
-                if values[i] != test_value:
-                    is_straight = False
-                test_value += 1
-
-        highest = max(values)
-
-        """Flush, previously we sort it, so the array must look like this:
-        ['Clubs', 'Diamonds', 'Diamonds', 'Hearts', 'Hearts'],
-        so if the first and the last element are the same means that all
-        the suits are the same"""
-        if suits[0] == suits[4]:
-            if is_straight:
-                if highest == 13 and 1 in values:
-                    rank = HAND_RANKS['ROYAL_FLUSH']
-                else:
-                    rank = HAND_RANKS['STR_FLUSH']
-            else:
-                rank = HAND_RANKS['FLUSH']
-        elif is_straight:
-            rank = HAND_RANKS['STRAIGHT']
-        else:
-            """4 of a kind, Check for: 4 cards of the same value
-            + higher value unmatched card, and Check for: lower ranked unmatched
-            card + 4 cards of the same rank"""
-            a = values[0] == values[1] == values[2] == values[3]
-            b = values[1] == values[2] == values[3] == values[4]
-            if a or b:
-                rank = HAND_RANKS['4_OF_A_KIND']
-
-        # and finally return the current rank
-        return rank
+        return video_poker_rank(
+            poker_eval.evaluate5(*[card.code for card in self.hand]))
 
     def get_event(self, mouse_pos):
         if self.playing:
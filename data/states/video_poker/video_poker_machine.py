@@ -2,6 +2,7 @@ import pygame as pg
 from ... import tools, prepare
 from ...components.labels import Blinker, Label, Button, MultiLineLabel
 from .video_poker_dealer import Dealer
+from .video_poker_advisor import held_cards
 from .video_poker_data import *
 
 
@@ -138,6 +139,9 @@ class Machine:
         self.player = None
         self.pay_board = None
         self.dealer = None
+        # optional HoldAdvisor showing the best hold of each dealt hand
+        self.advisor = None
+        self.advice = None
 
     def startup(self, player):
         self.state = "GAME OVER"
@@ -300,6 +304,11 @@ class Machine:
                                   self.text_color,
                                   {"centerx": rect.centerx, "top": y})
                     labels.append(label)
+            elif self.state == "PLAYING" and self.advice:
+                label = Label(self.font, self.text_size, self.advice,
+                              self.text_color,
+                              {"centerx": rect.centerx, "top": y})
+                labels.append(label)
 
             text = 'Credits {}'.format(self.credits)
             label = Label(self.font, self.text_size, text, self.text_color,
@@ -394,6 +403,7 @@ class Machine:
                 self.dealer.draw_cards()
                 rank = self.dealer.evaluate_hand()
                 self.pay_board.update_rank_rect(rank)
+        self.advise()
 
         for button in self.main_buttons:
             button.active = True
@@ -401,6 +411,7 @@ class Machine:
         self.toggle_buttons((self.main_buttons[0], self.main_buttons[1]), False)
 
     def evaluate_final_hand(self):
+        self.advice = None
         self.dealer.draw_cards()
         rank = self.dealer.evaluate_hand()
         self.pay_board.update_rank_rect(rank)
@@ -431,6 +442,7 @@ class Machine:
         index = int(args[0])
         if self.state == "PLAYING":
             self.dealer.toggle_held(index)
+            self.advise()
         elif self.state == "DOUBLE UP":
             if index > 0:  # if is not the first card
                 win = self.dealer.select_card(index)
@@ -444,6 +456,22 @@ class Machine:
                     self.state = "GAME OVER"
                     self.start_waiting()
 
+    def advise(self):
+        """Update the advice with the best hold and the current hold's pay."""
+        if self.advisor is None or self.state != "PLAYING":
+            return
+        cards = [card.code for card in self.dealer.hand]
+        values = self.advisor.values(cards, max(self.current_bet, 1))
+        best = max(range(len(values)), key=values.__getitem__)
+        held = sum(1 << index for index in self.dealer.held_cards)
+        if best:
+            hold = "hold {}".format(" ".join(str(index + 1)
+                                             for index in held_cards(best)))
+        else:
+            hold = "draw all"
+        self.advice = "hint: {} for {:.2f} (yours {:.2f})".format(
+            hold, values[best], values[held])
+
     def check_double_up(self, *args):
         double_up = args[0][0]
         if double_up:
@@ -6,7 +6,22 @@ for States.  Also contained here are resource loading functions.
 import os
 import copy
 import argparse
+import weakref
+from math import ceil
+from collections import OrderedDict
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
 import pygame as pg
+from . import instrumentation
+from .scheduler import Scheduler
+
+
+#A Control.time_scale that finishes whatever is waiting every frame, by
+#making each frame take INSTANT_STEP milliseconds of game time.
+INSTANT = float("inf")
+INSTANT_STEP = 60000.0
 
 
 class Control(object):
@@ -21,56 +36,216 @@ class Control(object):
         self.render_size = render_size
         self.render_surf = pg.Surface(self.render_size).convert()
         self.resolutions = resolutions
+        self.scaled_assets = None
         self.set_scale()
         self.caption = caption
         self.done = False
         self.clock = pg.time.Clock()
         self.fps = 60.0
         self.show_fps = False
+        self.timings = instrumentation.FrameTimings()
+        self.show_timings = False
+        #Longest time to sleep between frames while the State is idle.
+        self.idle_timeout = 250
+        #How many times faster than real time the game runs; see game_time.
+        self.time_scale = 1.0
         self.now = 0.0
-        self.keys = pg.key.get_pressed()
+        self.keys = get_pressed()
         self.state_dict = {}
+        self.state_factories = {}
+        self.state_history = []
+        self.max_states = None
         self.state_name = None
         self.state = None
         self.music_handler = None
+        self.prefetcher = None
+        #Broadcaster whose posted events are handled each frame, spending
+        #no more than event_budget milliseconds on them.
+        self.broadcaster = None
+        self.event_budget = 4.0
+        self.recorder = None
+        self.replay = None
         self.max_iterations = None
         self.iterations = 0
+        self.headless = False
+        self.use_dirty_rects = False
+        self.full_redraw = True
 
     def setup_states(self, state_dict, start_state):
         """
         Given a dictionary of States and a State to start in,
-        builds the self.state_dict.
+        builds the self.state_dict. Values may also be factories (any
+        callable returning a State, usually the State class itself); these
+        are only called the first time their State is entered.
         """
         self.state_dict = state_dict
+        self.state_factories = {}
+        self.state_history = []
         self.state_name = start_state
-        self.state = self.state_dict[self.state_name]
+        if self.prefetcher:
+            self.prefetcher.record(self.state_name)
+        self.state = self.get_state(self.state_name)
+        self.full_redraw = True
+
+    def get_state(self, name):
+        """
+        Return the State called name, building it from its factory if it
+        has not been built yet (or was evicted).
+        """
+        state = self.state_dict[name]
+        if not isinstance(state, _State):
+            self.state_factories[name] = state
+            state = self.state_dict[name] = state()
+        if name in self.state_history:
+            self.state_history.remove(name)
+        self.state_history.append(name)
+        return state
+
+    def evict_states(self):
+        """
+        If max_states is set, drop the least recently visited States that
+        were built from factories until no more than max_states of them are
+        alive. Evicted States are rebuilt by their factory when next entered.
+        """
+        if self.max_states is None:
+            return
+        built = [name for name in self.state_history
+                 if name in self.state_factories and
+                 isinstance(self.state_dict[name], _State)]
+        for name in built[:max(0, len(built)-self.max_states)]:
+            if name != self.state_name:
+                self.state_dict[name] = self.state_factories[name]
+                self.state_history.remove(name)
+
+    def game_time(self, dt):
+        """
+        Return the game time that passes in dt milliseconds of real time.
+        States, and through them Animations, Tasks and everything else
+        that counts time in dt, are given game time, so with time_scale
+        above 1 (or INSTANT) they play out faster with the same results.
+        """
+        if self.time_scale == 1:
+            return dt
+        if self.time_scale == INSTANT:
+            return INSTANT_STEP
+        return dt*self.time_scale
 
     def update(self, dt):
         """
         Checks if a state is done or has called for a game quit.
         State is flipped if neccessary and State.update is called.
+        dt is real time, and is converted to game time here.
         """
         self.screen = pg.display.get_surface()
-        self.now = pg.time.get_ticks()
+        dt = self.game_time(dt)
+        if self.time_scale != 1 or (self.headless and not self.replay):
+            self.now += dt
+        else:
+            self.now = get_ticks()
         if self.state.quit:
             self.done = True
         elif self.state.done:
             self.flip_state()
-        self.state.update(self.render_surf,self.keys,self.now,dt,self.scale)
+        if self.state.native_resolution:
+            surface = self.screen
+        else:
+            surface = self.render_surf
+        self.drain_events()
+        self.state.scheduler.advance(dt)
+        self.state.update(surface, self.keys, self.now, dt, self.scale)
+        if self.prefetcher:
+            if self.state.prefetch:
+                self.prefetcher.request(self.state.prefetch)
+            self.prefetcher.update()
         if self.music_handler and self.state.use_music_handler:
             self.music_handler.update(self.scale)
-            self.music_handler.draw(self.render_surf)
+            if not self.state.native_resolution:
+                self.music_handler.draw(self.render_surf)
+
+    def drain_events(self):
+        """
+        Handle the events posted to the broadcaster since the last frame.
+        Recordings and replays handle them all, so that each is handled in
+        the same frame however long the handlers take.
+        """
+        if self.broadcaster is None:
+            return
+        if self.recorder or self.replay:
+            self.broadcaster.drain()
+        else:
+            self.broadcaster.drain(self.event_budget)
 
     def render(self):
         """
         Scale the render surface if not the same size as the display surface.
         The render surface is then drawn to the screen.
+
+        Returns a list of display rects that were drawn, or None if the
+        whole display was drawn and needs updating.
         """
-        if self.render_size != self.screen_rect.size:
-            scale_args = (self.render_surf, self.screen_rect.size, self.screen)
-            pg.transform.smoothscale(*scale_args)
-        else:
-            self.screen.blit(self.render_surf, (0, 0))
+        dirty = self.get_dirty_rects()
+        if self.state is not None and self.state.native_resolution:
+            #The state drew straight to the display; nothing to scale.
+            self.full_redraw = False
+            if dirty is None:
+                return None
+            return [to_screen_rect(self.scale, rect) for rect in dirty]
+        if dirty is None:
+            if self.render_size != self.screen_rect.size:
+                scale_args = (self.render_surf, self.screen_rect.size, self.screen)
+                pg.transform.smoothscale(*scale_args)
+            else:
+                self.screen.blit(self.render_surf, (0, 0))
+            self.full_redraw = False
+            return None
+        updated = []
+        for rect in dirty:
+            screen_rect = self.present_rect(rect)
+            if screen_rect:
+                updated.append(screen_rect)
+        return updated
+
+    def get_dirty_rects(self):
+        """
+        Return the render_surf rects that changed this frame, or None if the
+        whole frame must be presented. States opt in by setting dirty_rects
+        in their update; this is only honoured if use_dirty_rects is set.
+        """
+        if not self.use_dirty_rects or self.full_redraw or self.state is None:
+            return None
+        dirty = self.state.dirty_rects
+        if dirty is None:
+            return None
+        dirty = list(dirty)
+        if self.music_handler and self.state.use_music_handler:
+            dirty.append(self.music_handler.rect)
+        area = sum(pg.Rect(rect).w*pg.Rect(rect).h for rect in dirty)
+        if area >= self.render_size[0]*self.render_size[1]//2:
+            return None
+        return dirty
+
+    def present_rect(self, rect):
+        """
+        Scale a single region of the render surface onto the display and
+        return the display rect it covers. The region is widened to whole
+        display pixels so neighbouring regions line up.
+        """
+        rect = pg.Rect(rect).clip(self.render_surf.get_rect())
+        if self.render_size == self.screen_rect.size:
+            self.screen.blit(self.render_surf, rect, rect)
+            return rect
+        w_ratio, h_ratio = self.scale
+        screen_rect = to_screen_rect(self.scale, rect).clip(self.screen_rect)
+        source = pg.Rect(int(screen_rect.x*w_ratio), int(screen_rect.y*h_ratio),
+                         int(ceil(screen_rect.w*w_ratio)),
+                         int(ceil(screen_rect.h*h_ratio)))
+        source = source.clip(self.render_surf.get_rect())
+        if not (screen_rect and source):
+            return None
+        region = self.render_surf.subsurface(source)
+        scaled = pg.transform.smoothscale(region, screen_rect.size)
+        self.screen.blit(scaled, screen_rect)
+        return screen_rect
 
     def flip_state(self):
         """
@@ -79,24 +254,39 @@ class Control(object):
         """
         previous,self.state_name = self.state_name, self.state.next
         persist = self.state.cleanup()
-        self.state = self.state_dict[self.state_name]
+        if self.prefetcher:
+            self.prefetcher.record(self.state_name)
+        self.state = self.get_state(self.state_name)
+        self.evict_states()
         self.state.startup(self.now, persist)
         self.state.previous = previous
+        self.full_redraw = True
 
     def event_loop(self):
         """
         Process all events and pass them down to current State.
         The f5 key globally turns on/off the display of FPS in the caption
+        and f6 the frame timings overlay.
         """
-        for event in pg.event.get():
+        if self.replay:
+            events = self.replay.events
+        else:
+            events = pg.event.get()
+        if self.recorder:
+            self.recorder.record(events)
+        for event in events:
             if event.type == pg.KEYDOWN:
-                self.keys = pg.key.get_pressed()
+                self.keys = get_pressed()
                 self.toggle_show_fps(event.key)
+                self.toggle_show_timings(event.key)
                 if event.key == pg.K_PRINT:
                     #Print screen for full render-sized screencaps.
-                    pg.image.save(self.render_surf, "screenshot.png")
+                    if self.state.native_resolution:
+                        pg.image.save(self.screen, "screenshot.png")
+                    else:
+                        pg.image.save(self.render_surf, "screenshot.png")
             elif event.type == pg.KEYUP:
-                self.keys = pg.key.get_pressed()
+                self.keys = get_pressed()
             elif event.type == pg.VIDEORESIZE:
                 self.on_resize(event.size)
                 pg.event.clear(pg.VIDEORESIZE)
@@ -120,6 +310,7 @@ class Control(object):
         self.screen = pg.display.set_mode(new_size, pg.RESIZABLE)
         self.screen_rect.size = new_size
         self.set_scale()
+        self.full_redraw = True
 
     def set_scale(self):
         """
@@ -129,6 +320,8 @@ class Control(object):
         w_ratio = self.render_size[0]/float(self.screen_rect.w)
         h_ratio = self.render_size[1]/float(self.screen_rect.h)
         self.scale = (w_ratio, h_ratio)
+        if self.scaled_assets is not None:
+            self.scaled_assets.set_scale(self.scale)
 
     def toggle_show_fps(self, key):
         """Press f5 to turn on/off displaying the framerate in the caption."""
@@ -137,23 +330,83 @@ class Control(object):
             if not self.show_fps:
                 pg.display.set_caption(self.caption)
 
+    def toggle_show_timings(self, key):
+        """Press f6 to turn on/off the frame timings overlay."""
+        if key == pg.K_F6:
+            self.show_timings = not self.show_timings
+            self.full_redraw = True
+
+    def tick(self):
+        """
+        Return the number of milliseconds to advance this frame by.
+        When headless the clock is not waited on; a fixed timestep of
+        1000/fps is returned so states step as fast as the CPU allows.
+        While the State is idle, wait for input (or idle_timeout) first.
+        Replays return the recorded time instead.
+        """
+        if self.replay:
+            return self.replay.next_frame()
+        if self.headless:
+            dt = 1000.0/self.fps
+        else:
+            if self.state.idle:
+                self.wait_for_event()
+            dt = self.clock.tick(self.fps)
+        if self.recorder:
+            self.recorder.sample(dt, self.now+dt if self.headless else None)
+        return dt
+
+    def wait_for_event(self):
+        """
+        Sleep until an event arrives, idle_timeout milliseconds pass or
+        a Task of the State is due, leaving any event in the queue for
+        event_loop.
+        """
+        if not pg.event.peek():
+            timeout = self.idle_timeout
+            due = self.state.scheduler.next_due()
+            if due is not None:
+                timeout = min(timeout, int(ceil(due/self.time_scale)))
+            if timeout <= 0:
+                return
+            event = pg.event.wait(timeout)
+            if event.type != pg.NOEVENT:
+                pg.event.post(event)
+
     def main(self):
         """Main loop for entire program."""
         self.iterations = 0
+        timer = instrumentation.timer
         while not self.is_complete():
-            time_delta = self.clock.tick(self.fps)
+            time_delta = self.tick()
+            start = timer()
             self.event_loop()
+            events = timer()
             self.update(time_delta)
-            self.render()
-            pg.display.update()
-            if self.show_fps:
-                fps = self.clock.get_fps()
-                with_fps = "{} - {:.2f} FPS".format(self.caption, fps)
-                pg.display.set_caption(with_fps)
+            updated = rendered = timer()
+            if not self.headless:
+                dirty = self.render()
+                if self.show_timings:
+                    self.timings.draw(self.screen)
+                    dirty = None
+                rendered = timer()
+                if dirty is None:
+                    pg.display.update()
+                else:
+                    pg.display.update(dirty)
+                if self.show_fps:
+                    fps = self.clock.get_fps()
+                    with_fps = "{} - {:.2f} FPS".format(self.caption, fps)
+                    pg.display.set_caption(with_fps)
+            flipped = timer()
+            self.timings.record(self.state_name, events-start, updated-events,
+                                rendered-updated, flipped-rendered)
             self.iterations += 1
 
     def is_complete(self):
         """Return True if the control is complete and should stop running"""
+        if self.replay and self.replay.finished:
+            return True
         if self.max_iterations is None:
             return self.done
         else:
@@ -176,6 +429,22 @@ class _State(object):
         self.previous = None
         self.persist = persistant
         self.use_music_handler = True
+        #Render-space rects changed by the last update, or None if the
+        #whole frame changed. Only used when Control.use_dirty_rects is set.
+        self.dirty_rects = None
+        #States that draw straight to the display at window size (using
+        #Control.scaled_assets) instead of to the render surface.
+        self.native_resolution = False
+        #Name of a state whose assets to load in the background before it
+        #is entered, e.g. while the button leading to it is hovered (see
+        #Prefetcher).
+        self.prefetch = None
+        #True while nothing changes on screen without input; Control then
+        #sleeps until an event arrives instead of running at full rate.
+        self.idle = False
+        #Timeline for delayed callbacks (see delay); advanced by Control
+        #while this State is active.
+        self.scheduler = Scheduler()
 
     def get_event(self, event, scale=(1,1)):
         """
@@ -204,6 +473,18 @@ class _State(object):
         """Update function for state.  Must be overloaded in children."""
         pass
 
+    def delay(self, amount, callback, args=None, kwargs=None):
+        """
+        Call callback with args and kwargs once amount milliseconds of this
+        State being active have passed. Returns the scheduled Task, which
+        can be chained or killed.
+        """
+        #Imported here as animation imports prepare, which imports tools.
+        from .components.animation import Task
+        task = Task(callback, amount, 1, args, kwargs)
+        self.scheduler.add(task)
+        return task
+
     def render_font(self, font, msg, color, center):
         """Return the rendered font surface and its rect centered on center."""
         msg = font.render(msg, 1, color)
@@ -236,16 +517,132 @@ class _KwargMixin(object):
             setattr(self, setting, settings[setting])
 
 
+class lazy_attribute(object):
+    """
+    A class attribute whose value is made by calling loader the first time
+    it is accessed. Lets classes keep resources such as prepare.GFX images
+    as class attributes without loading them at import, before
+    prepare.init has opened the display.
+    """
+    def __init__(self, loader):
+        self.loader = loader
+        self.loaded = False
+        self.value = None
+
+    def __get__(self, instance, owner):
+        if not self.loaded:
+            self.value = self.loader()
+            self.loaded = True
+        return self.value
+
+
+### Input sources.  Read the mouse, keyboard and clock through these so
+### that replay.Recorder and replay.Player can substitute their own.
+def get_mouse_pos():
+    return pg.mouse.get_pos()
+
+
+def get_pressed():
+    return pg.key.get_pressed()
+
+
+def get_ticks():
+    return pg.time.get_ticks()
+
+
 ### Mouse position functions
 def scaled_mouse_pos(scale, pos=None):
     """
     Return the mouse position adjusted for screen size if no pos argument is
     passed and returns pos adjusted for screen size if pos is passed.
     """
-    x,y = pg.mouse.get_pos() if pos is None else pos
+    x,y = get_mouse_pos() if pos is None else pos
     return (int(x*scale[0]), int(y*scale[1]))
 
 
+def to_screen_pos(scale, pos):
+    """Convert a render-space position to a display position."""
+    return (int(pos[0]/scale[0]), int(pos[1]/scale[1]))
+
+
+def to_screen_rect(scale, rect):
+    """
+    Convert a render-space rect to the display rect covering it. The rect
+    is grown to whole display pixels so adjacent rects don't leave gaps.
+    """
+    rect = pg.Rect(rect)
+    left, top = to_screen_pos(scale, rect.topleft)
+    right = int(ceil(rect.right/scale[0]))
+    bottom = int(ceil(rect.bottom/scale[1]))
+    return pg.Rect(left, top, right-left, bottom-top)
+
+
+class ScaledAssets(object):
+    """
+    Cache of images and fonts pre-scaled to the current window size, for
+    States that set native_resolution and draw straight to the display.
+    Caches are emptied whenever the scale changes and each asset is scaled
+    once, on first use at the new size. Layout stays in render space;
+    use pos and rect to place things, so tools.scaled_mouse_pos keeps
+    working unchanged.
+    """
+    def __init__(self, gfx, scale=(1,1)):
+        self.gfx = gfx
+        self.scale = None
+        self.images = {}
+        self.surfaces = weakref.WeakKeyDictionary()
+        self.fonts = {}
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        """Drop all scaled assets if the scale has changed."""
+        if scale != self.scale:
+            self.scale = scale
+            self.images = {}
+            self.surfaces = weakref.WeakKeyDictionary()
+            self.fonts = {}
+
+    def _scaled(self, surface):
+        w, h = surface.get_size()
+        size = (max(1, int(round(w/self.scale[0]))),
+                max(1, int(round(h/self.scale[1]))))
+        if size == (w, h):
+            return surface
+        return pg.transform.smoothscale(surface, size)
+
+    def image(self, name):
+        """Return the graphic called name scaled to the window."""
+        if name not in self.images:
+            self.images[name] = self._scaled(self.gfx[name])
+        return self.images[name]
+
+    def surface(self, surface):
+        """
+        Return any render-space surface (labels, buttons, cards) scaled to
+        the window. Results are kept only as long as the source surface.
+        """
+        try:
+            return self.surfaces[surface]
+        except KeyError:
+            scaled = self.surfaces[surface] = self._scaled(surface)
+            return scaled
+
+    def font(self, path, size):
+        """Return a font whose point size is scaled to the window."""
+        size = max(1, int(round(size/self.scale[1])))
+        if (path, size) not in self.fonts:
+            self.fonts[(path, size)] = pg.font.Font(path, size)
+        return self.fonts[(path, size)]
+
+    def pos(self, pos):
+        """Convert a render-space position to the window."""
+        return to_screen_pos(self.scale, pos)
+
+    def rect(self, rect):
+        """Convert a render-space rect to the window."""
+        return to_screen_rect(self.scale, rect)
+
+
 ### Resource loading functions.
 def load_all_gfx(directory,colorkey=(0,0,0),accept=(".png",".jpg",".bmp")):
     """
@@ -258,16 +655,30 @@ def load_all_gfx(directory,colorkey=(0,0,0),accept=(".png",".jpg",".bmp")):
     for pic in os.listdir(directory):
         name,ext = os.path.splitext(pic)
         if ext.lower() in accept:
-            img = pg.image.load(os.path.join(directory, pic))
-            if img.get_alpha():
-                img = img.convert_alpha()
-            else:
-                img = img.convert()
-                img.set_colorkey(colorkey)
-            graphics[name]=img
+            graphics[name] = load_image(os.path.join(directory, pic), colorkey)
     return graphics
 
 
+def load_image(path, colorkey=(0,0,0)):
+    """
+    Load a single image, converted as described in load_all_gfx.  Images
+    are only converted if a display mode has been set; before that they
+    are returned as loaded.
+    """
+    return convert_image(pg.image.load(path), colorkey)
+
+
+def convert_image(img, colorkey=(0,0,0)):
+    """Convert a loaded image as described in load_image."""
+    if pg.display.get_surface() is None:
+        return img
+    if img.get_alpha():
+        return img.convert_alpha()
+    img = img.convert()
+    img.set_colorkey(colorkey)
+    return img
+
+
 def load_all_music(directory, accept=(".wav", ".mp3", ".ogg", ".mdi")):
     """
     Create a dictionary of paths to music files in given directory
@@ -311,6 +722,243 @@ def load_all_sfx(directory, accept=(".wav", ".mp3", ".ogg", ".mdi")):
     return effects
 
 
+def lazy_gfx(directory, colorkey=(0,0,0), accept=(".png",".jpg",".bmp"),
+             budget=None):
+    """
+    Like load_all_gfx, but return an AssetManager that only loads each
+    graphic the first time it is looked up.
+    """
+    graphics = AssetManager(budget, surface_bytes)
+    for pic in os.listdir(directory):
+        name,ext = os.path.splitext(pic)
+        if ext.lower() in accept:
+            path = os.path.join(directory, pic)
+            graphics.register(name, lambda img: convert_image(img, colorkey),
+                              lambda path=path: pg.image.load(path))
+    return graphics
+
+
+def lazy_sfx(directory, accept=(".wav", ".mp3", ".ogg", ".mdi"), budget=None):
+    """
+    Like load_all_sfx, but return an AssetManager that only decodes each
+    sound the first time it is looked up.
+    """
+    effects = AssetManager(budget, sound_bytes)
+    for fx in os.listdir(directory):
+        name,ext = os.path.splitext(fx)
+        if ext.lower() in accept:
+            path = os.path.join(directory, fx)
+            effects.register(name, lambda sound: sound,
+                             lambda path=path: pg.mixer.Sound(path))
+    return effects
+
+
+def surface_bytes(surface):
+    """Pixel memory used by a surface. Subsurfaces share their parent's."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch()*surface.get_height()
+
+
+def sound_bytes(sound):
+    """Approximate memory used by a decoded sound."""
+    mixer = pg.mixer.get_init()
+    if not mixer:
+        return 0
+    frequency, size, channels = mixer
+    return int(sound.get_length()*frequency*channels*abs(size)//8)
+
+
+class AssetManager(MutableMapping):
+    """
+    Dictionary of assets that are loaded on first access. Names are
+    registered with a loader (a function taking no arguments) or, for
+    pieces of sprite sheets, with the sheet's name and a rect.  Loading
+    may be split in two by also giving a decoder: the slow part (reading
+    and decoding a file) that is safe to run on another thread, whose
+    result is passed to the loader on the main thread.  See decode and
+    finish.
+
+    Memory used by loaded assets is tracked with sizer.  If a budget (in
+    bytes) is given, least recently used assets are dropped whenever the
+    total goes over it.  A dropped asset's memory is only freed once
+    nothing else (a sprite or a State, say) still refers to it; until then
+    the manager keeps a weak reference and hands the same object back the
+    next time it's needed, so it is never loaded twice.  Assets that have
+    really gone are loaded again.  Sheets are dropped along with the
+    pieces cut from them, since those keep the sheet's pixels alive.
+    Assets that are assigned directly rather than registered can't be
+    reloaded and are never dropped.
+    """
+    def __init__(self, budget=None, sizer=surface_bytes):
+        self.budget = budget
+        self.sizer = sizer
+        self.loaders = {}
+        self.pieces = {}
+        self.assets = OrderedDict()
+        #Dropped assets that may still be in use elsewhere
+        self.dropped = weakref.WeakValueDictionary()
+        self.sizes = {}
+        self.used = 0
+        self.decoders = {}
+        #Set to a set to collect the names of all assets looked up
+        self.recording = None
+
+    def register(self, name, loader, decoder=None):
+        """
+        Register a function that loads the asset called name. If a decoder
+        is given the loader is called with its result.
+        """
+        self.discard(name)
+        self.dropped.pop(name, None)
+        self.loaders[name] = loader
+        self.decoders.pop(name, None)
+        if decoder is not None:
+            self.decoders[name] = decoder
+
+    def sheet(self, name):
+        """Return the name of the asset that name is ultimately cut from."""
+        while name in self.pieces:
+            name = self.pieces[name]
+        return name
+
+    def decode(self, name):
+        """
+        Run the decoder for name, which is safe to do from any thread, and
+        return the result to pass to finish. Returns None if name has no
+        decoder or is already loaded.
+        """
+        decoder = self.decoders.get(name)
+        if decoder is None or name in self.assets or name in self.dropped:
+            return None
+        return decoder()
+
+    def finish(self, name, decoded):
+        """Finish loading name on the main thread from decode's result."""
+        if name in self.assets or self._revive(name) is not None:
+            return
+        if decoded is not None:
+            self._store(name, self.loaders[name](decoded))
+
+    def register_piece(self, name, sheet, rect):
+        """Register name as the subsurface rect of the asset called sheet."""
+        def loader():
+            return self[sheet].subsurface(rect)
+        self.register(name, loader)
+        self.pieces[name] = sheet
+
+    def discard(self, name):
+        """
+        Drop name if it is loaded; it is reused while still referred to
+        elsewhere, and reloaded otherwise.
+        """
+        if name in self.assets:
+            asset = self.assets.pop(name)
+            self.used -= self.sizes.pop(name)
+            if name in self.loaders:
+                try:
+                    self.dropped[name] = asset
+                except TypeError:
+                    pass  #Can't be weakly referred to, so is just reloaded
+            for piece, sheet in list(self.pieces.items()):
+                if sheet == name:
+                    self.discard(piece)
+
+    def _revive(self, name):
+        """Take back name if it was dropped but is still alive."""
+        asset = self.dropped.pop(name, None)
+        if asset is not None:
+            if name in self.pieces:
+                self[self.pieces[name]]
+            self._store(name, asset)
+        return asset
+
+    def clear_cache(self):
+        """Drop every asset that can be reloaded."""
+        for name in list(self.assets):
+            if name in self.loaders:
+                self.discard(name)
+
+    def _touch(self, name):
+        try:
+            self.assets.move_to_end(name)
+        except AttributeError:
+            self.assets[name] = self.assets.pop(name)
+        if name in self.pieces:
+            self._touch(self.pieces[name])
+
+    def _shrink(self, name):
+        #Oldest first; keep name and the sheets it was cut from. Pieces
+        #free nothing by themselves and go when their sheet goes.
+        keep = set()
+        while name is not None:
+            keep.add(name)
+            name = self.pieces.get(name)
+        for name in list(self.assets):
+            if self.used <= self.budget:
+                break
+            if (name in self.loaders and name not in self.pieces
+                    and name not in keep):
+                self.discard(name)
+
+    def __getitem__(self, name):
+        if self.recording is not None:
+            self.recording.add(name)
+        if name in self.assets:
+            self._touch(name)
+            return self.assets[name]
+        asset = self._revive(name)
+        if asset is not None:
+            return asset
+        if name in self.decoders:
+            asset = self.loaders[name](self.decoders[name]())
+        else:
+            asset = self.loaders[name]()
+        self._store(name, asset)
+        return asset
+
+    def _store(self, name, asset):
+        self.assets[name] = asset
+        self.sizes[name] = self.sizer(asset)
+        self.used += self.sizes[name]
+        if name in self.pieces:
+            self._touch(self.pieces[name])
+        if self.budget is not None and self.used > self.budget:
+            self._shrink(name)
+
+    def __setitem__(self, name, asset):
+        self.discard(name)
+        self.dropped.pop(name, None)
+        self.loaders.pop(name, None)
+        self.decoders.pop(name, None)
+        self.pieces.pop(name, None)
+        self.assets[name] = asset
+        self.sizes[name] = self.sizer(asset)
+        self.used += self.sizes[name]
+
+    def __delitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+        self.discard(name)
+        self.dropped.pop(name, None)
+        self.loaders.pop(name, None)
+        self.decoders.pop(name, None)
+        self.pieces.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self.loaders or name in self.assets
+
+    def __iter__(self):
+        for name in self.loaders:
+            yield name
+        for name in self.assets:
+            if name not in self.loaders:
+                yield name
+
+    def __len__(self):
+        return len(set(self.loaders).union(self.assets))
+
+
 def strip_from_sheet(sheet, start, size, columns, rows=1):
     """
     Strips individual frames from a sprite sheet given a start location,
@@ -357,10 +1005,25 @@ def cursor_from_image(image):
     return icon_string
 
 
-def get_cli_args(caption, win_pos, start_size, money):
+def parse_time_scale(value):
+    """Convert a -t argument, a positive number or 'instant', to a time scale."""
+    if value == "instant":
+        return INSTANT
+    try:
+        scale = float(value)
+    except ValueError:
+        scale = 0
+    if not scale > 0:
+        raise argparse.ArgumentTypeError(
+            "time scale must be a positive number or 'instant'")
+    return scale
+
+
+def get_cli_args(caption, win_pos, start_size, money, argv=None):
     """
     Modify prepare module globals based on command line arguments,
-    quickly force settings for debugging.
+    quickly force settings for debugging. Parses sys.argv unless a list
+    of arguments is given.
     """
     parser = argparse.ArgumentParser(description='{} Arguments'.format(caption))
     parser.add_argument('-c','--center', action='store_false',
@@ -387,7 +1050,28 @@ def get_cli_args(caption, win_pos, start_size, money):
         help='enable test bots')
     parser.add_argument('-N', '--iterations', action='store', type=int,
         help='maximum number of iterations to run for (useful with profiling option')
-    args = vars(parser.parse_args())
+    parser.add_argument('-H', '--headless', action='store_true',
+        help='run without a window or sound at a fixed timestep, as fast as possible')
+    parser.add_argument('-D', '--dirty_rects', action='store_true',
+        help='only scale and update screen regions that states report as changed')
+    parser.add_argument('-n', '--native', action='store_true',
+        help='let states that support it draw at window size with pre-scaled assets')
+    parser.add_argument('-L', '--live_states', action='store', type=int,
+        help='maximum number of game states kept in memory; the least recently visited are rebuilt on demand')
+    parser.add_argument('-A', '--asset_budget', action='store', type=float, metavar='MB',
+        help='memory in MB for loaded images (and separately sounds); the least recently used are reloaded on demand')
+    parser.add_argument('-R', '--record', action='store', metavar='FILE',
+        help='record input, frame times and the random seed to FILE')
+    parser.add_argument('-Y', '--replay', action='store', metavar='FILE',
+        help='replay a recording headless, as fast as possible')
+    parser.add_argument('-T', '--timings', action='store', metavar='FILE',
+        help='write per-frame timings to FILE (.csv or .json) on exit; f6 shows them on screen')
+    parser.add_argument('-t', '--time_scale', action='store', type=parse_time_scale,
+        default=1.0, metavar='FACTOR',
+        help="run animations, delays and other game timers FACTOR times as fast, or 'instant' to finish them every frame")
+    parser.add_argument('-a', '--hold_advice', action='store_true',
+        help='show the best hold and its expected pay in video poker')
+    args = vars(parser.parse_args(argv))
     #check each condition
     if not args['center'] or (args['winpos'] != win_pos): #if -c or -w options
         args['center'] = False
@@ -396,4 +1080,9 @@ def get_cli_args(caption, win_pos, start_size, money):
     if args['fullscreen']:
         args['center'] = False
         args['resizable'] = False
+    if args['replay']:
+        args['headless'] = True
+    if args['headless']:
+        args['fullscreen'] = False
+        args['music_off'] = True
     return args
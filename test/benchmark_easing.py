@@ -0,0 +1,61 @@
+"""
+Compare the EasingTables of the animation transitions with the transitions
+themselves: the largest error over random progress values, and the time
+per value when called one at a time and when evaluated for a whole array
+at once (as AnimationGroup does).
+
+Run from the test directory:  python benchmark_easing.py [count]
+"""
+
+import sys
+import timeit
+from random import Random
+
+# Make the benchmark work from the test directory
+sys.path.append('..')
+try:
+    from data.components import animation
+    from data.components.animation import AnimationTransition, easing_table
+except ImportError:
+    print('\n** ERROR ** Benchmarks must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+def per_value(function, repeat=5):
+    """Best time in nanoseconds for function divided by its number of values"""
+    times = timeit.repeat(function, number=1, repeat=repeat)
+    return min(times) * 1e9
+
+
+def main(count=10000):
+    numpy = animation.numpy
+    random = Random(0)
+    points = [random.random() for i in range(count)]
+    array = numpy.array(points) if numpy is not None else None
+    names = sorted(name for name in dir(AnimationTransition)
+                   if not name.startswith('_'))
+
+    header = "{:<16}{:>11}{:>12}{:>12}".format("transition", "max error",
+                                               "call ns", "lookup ns")
+    if numpy is not None:
+        header += "{:>12}{:>12}".format("list ns", "array ns")
+    print(header)
+    for name in names:
+        transition = getattr(AnimationTransition, name)
+        table = easing_table(name)
+        lookup = table.lookup
+        error = max(abs(lookup(p) - transition(p)) for p in points)
+        called = per_value(lambda: [transition(p) for p in points]) / count
+        looked_up = per_value(lambda: [lookup(p) for p in points]) / count
+        line = "{:<16}{:>11.1e}{:>12.0f}{:>12.0f}".format(name, error, called,
+                                                          looked_up)
+        if numpy is not None:
+            listed = per_value(lambda: numpy.array(
+                [transition(p) for p in array.tolist()])) / count
+            evaluated = per_value(lambda: table.evaluate(array)) / count
+            line += "{:>12.0f}{:>12.1f}".format(listed, evaluated)
+        print(line)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
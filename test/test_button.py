@@ -10,12 +10,17 @@ import unittest
 import sys
 sys.path.append('..')
 try:
+    from data import prepare
     from data.components import labels
 except ImportError:
     print('\n** ERROR ** Tests must be run from the test directory\n\n')
     sys.exit(1)
 
 
+def setUpModule():
+    prepare.init(display=False, audio=False, args=[])
+
+
 class TestUI(unittest.TestCase):
 
     def test_new_from_rect_like(self):
@@ -0,0 +1,161 @@
+"""Tests for Animations and AnimationGroup"""
+
+import unittest
+from functools import partial
+from random import Random
+
+import pygame as pg
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import animation
+    from data.components.animation import Animation, AnimationGroup, Task
+    from data.components.animation import AnimationTransition, easing_table
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class Target(object):
+    """An object with a plain and a callable attribute"""
+    def __init__(self):
+        self.value = 0.
+        self.written = []
+
+    def write(self, value):
+        self.written.append(value)
+
+
+def make_animations(log):
+    """A mix of Animations and Tasks, with targets to check"""
+    rects = [pg.Rect(0, 0, 10, 10), pg.Rect(50, 20, 10, 10)]
+    targets = [Target(), Target(), Target()]
+    sprites = [
+        Animation(x=100, y=37, duration=250, round_values=True),
+        Animation(x=-30, duration=100, delay=120, transition='out_bounce',
+                  round_values=True),
+        Animation(value=10., duration=300, transition='in_out_quad'),
+        Animation(value=-4., duration=90, delay=40, transition='out_elastic'),
+        Animation(write=5., duration=200, initial=1.),
+        Task(lambda: log.append('task'), 50, 3)]
+    for ani, target in zip(sprites, rects+targets):
+        ani.start(target)
+        ani.callback = lambda ani=ani: log.append(('done', sprites.index(ani)))
+    sprites[2].update_callback = lambda: log.append(targets[0].value)
+    return sprites, rects, targets
+
+
+class TestAnimationGroup(unittest.TestCase):
+    """Tests for the AnimationGroup"""
+
+    def run_group(self, group_class):
+        log = []
+        sprites, rects, targets = make_animations(log)
+        group = group_class(*sprites)
+        for frame in range(25):
+            group.update(17)
+        return ([tuple(rect) for rect in rects],
+                [(target.value, target.written) for target in targets], log,
+                len(group))
+
+    def testSameResultsAsPlainGroup(self):
+        """Animations end up where they would in a plain group"""
+        expected = self.run_group(pg.sprite.Group)
+        self.assertEqual(self.run_group(AnimationGroup), expected)
+        self.assertEqual(expected[3], 0)
+
+    def testTabledGroup(self):
+        """Looking transitions up in tables gives the same final values"""
+        expected = self.run_group(pg.sprite.Group)
+        tabled = partial(AnimationGroup, tabled=True)
+        rects, targets, log, remaining = self.run_group(tabled)
+        self.assertEqual(rects, expected[0])
+        self.assertEqual(len(log), len(expected[2]))
+        for entry, expected_entry in zip(log, expected[2]):
+            if isinstance(entry, float):
+                self.assertAlmostEqual(entry, expected_entry, places=3)
+            else:
+                self.assertEqual(entry, expected_entry)
+
+    def testWithoutNumpy(self):
+        """Without numpy every sprite is updated on its own"""
+        numpy = animation.numpy
+        animation.numpy = None
+        try:
+            result = self.run_group(AnimationGroup)
+        finally:
+            animation.numpy = numpy
+        self.assertEqual(result, self.run_group(pg.sprite.Group))
+
+    def testRestartAndMoveBetweenGroups(self):
+        """Time passed carries over when the group changes"""
+        rect = pg.Rect(0, 0, 10, 10)
+        ani = Animation(x=100, duration=100, delay=20, round_values=True)
+        ani.start(rect)
+        group = AnimationGroup(ani)
+        group.update(70)
+        self.assertEqual(rect.x, 50)
+        other = AnimationGroup()
+        ani.remove(group)
+        ani.add(other)
+        other.update(10)
+        self.assertEqual(rect.x, 60)
+        ani.start(pg.Rect(0, 0, 10, 10))
+        other.update(10)
+        self.assertEqual(rect.x, 60)
+        self.assertEqual(ani.targets[0][0].x, 70)
+
+    def testKilledAnimationsStop(self):
+        """Killing an Animation stops it"""
+        rect = pg.Rect(0, 0, 10, 10)
+        ani = Animation(x=100, duration=100, round_values=True)
+        ani.start(rect)
+        group = AnimationGroup(ani)
+        group.update(10)
+        ani.kill()
+        group.update(10)
+        self.assertEqual(rect.x, 10)
+
+
+class TestEasingTables(unittest.TestCase):
+    """Tests for the transitions' EasingTables"""
+
+    def testAccuracy(self):
+        """Tables match the transitions they sample"""
+        random = Random(0)
+        points = [random.random() for i in range(2000)]
+        names = [name for name in dir(AnimationTransition)
+                 if not name.startswith('_')]
+        self.assertGreater(len(names), 25)
+        for name in names:
+            transition = getattr(AnimationTransition, name)
+            table = easing_table(name)
+            self.assertIs(easing_table(transition), table)
+            self.assertEqual(table.lookup(0.), transition(0.))
+            self.assertEqual(table.lookup(1.), transition(1.))
+            error = max(abs(table.lookup(p) - transition(p)) for p in points)
+            self.assertLess(error, 1e-4, name)
+            if animation.numpy is not None:
+                array = animation.numpy.array(points)
+                looked_up = table.evaluate(array).tolist()
+                for p, value in zip(points, looked_up):
+                    self.assertAlmostEqual(value, table.lookup(p))
+
+    def testTabledAnimation(self):
+        """Animations can look their transition up"""
+        rect = pg.Rect(0, 0, 10, 10)
+        ani = Animation(x=1000, duration=100, transition='in_out_elastic',
+                        tabled=True, round_values=True)
+        ani.start(rect)
+        ani.update(37)
+        expected = int(round(1000 * AnimationTransition.in_out_elastic(.37)))
+        self.assertAlmostEqual(rect.x, expected, delta=1)
+        self.assertNotIn('tabled', ani.props)
+        ani.update(63)
+        self.assertEqual(rect.x, 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Tests for the asset bundle"""
+
+import unittest
+import tempfile
+import shutil
+import os
+
+import pygame as pg
+pg.init()
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import asset_bundle
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestAssetBundle(unittest.TestCase):
+    """Tests for building and loading asset bundles"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.source = tempfile.mkdtemp()
+        self.bundle = tempfile.mkdtemp()
+        self.images = {
+            'glow': pg.Surface((30, 20), pg.SRCALPHA),
+            'felt': pg.Surface((40, 10)),
+            'chip': pg.Surface((10, 10), pg.SRCALPHA),
+        }
+        self.images['glow'].fill((255, 0, 0, 128))
+        self.images['felt'].fill((0, 255, 0))
+        self.images['chip'].fill((0, 0, 255, 255))
+        for name, image in self.images.items():
+            pg.image.save(image, os.path.join(self.source, name + '.png'))
+
+    def tearDown(self):
+        """Tear down the tests"""
+        shutil.rmtree(self.source)
+        shutil.rmtree(self.bundle)
+
+    def testPackFitsEverything(self):
+        """packed rects should be on a page and not overlap"""
+        sizes = dict(('r{0}'.format(i), (10 + i*7 % 50, 5 + i*13 % 40))
+                     for i in range(40))
+        pages, places = asset_bundle.pack(sizes, 128)
+        rects = {}
+        for name, (page, x, y) in places.items():
+            rect = pg.Rect((x, y), sizes[name])
+            self.assertTrue(pg.Rect((0, 0), pages[page]).contains(rect))
+            for other in rects.get(page, []):
+                self.assertFalse(rect.colliderect(other))
+            rects.setdefault(page, []).append(rect)
+        #
+        # Oversized rects get a page of their own
+        pages, places = asset_bundle.pack({'big': (300, 20)}, 128)
+        self.assertEqual([(300, 20)], pages)
+
+    def testLoadsSamePixels(self):
+        """graphics from the bundle should match the source files"""
+        asset_bundle.build_graphics(self.source, self.bundle)
+        gfx = asset_bundle.load_gfx(self.bundle, self.source)
+        self.assertNotEqual(None, gfx)
+        for name, image in self.images.items():
+            loaded = gfx[name]
+            self.assertEqual(image.get_size(), loaded.get_size())
+            self.assertEqual(image.get_at((5, 5)), loaded.get_at((5, 5)))
+
+    def testStaleBundleIsIgnored(self):
+        """changing a source file should make the bundle stale"""
+        self.assertEqual(None, asset_bundle.load_gfx(self.bundle, self.source))
+        asset_bundle.build_graphics(self.source, self.bundle)
+        pg.image.save(pg.Surface((5, 5)), os.path.join(self.source, 'felt.png'))
+        os.utime(os.path.join(self.source, 'felt.png'), (0, 0))
+        self.assertEqual(None, asset_bundle.load_gfx(self.bundle, self.source))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+"""Tests for the asset manager"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import time
+
+import pygame as pg
+pg.init()
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import tools, prefetch
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestAssetManager(unittest.TestCase):
+    """Tests for the AssetManager"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.loads = []
+        self.assets = tools.AssetManager()
+        for name in ('a', 'b', 'c'):
+            self.assets.register(name, self._loader(name, (10, 10)))
+
+    def _loader(self, name, size):
+        """Return a loader that records when it is called"""
+        def loader():
+            self.loads.append(name)
+            return pg.Surface(size, pg.SRCALPHA)
+        return loader
+
+    def testLoadsOnFirstAccess(self):
+        """assets should only be loaded when first looked up"""
+        self.assertEqual([], self.loads)
+        self.assertTrue('a' in self.assets)
+        self.assertEqual(['a', 'b', 'c'], sorted(self.assets))
+        self.assertEqual([], self.loads)
+        #
+        image = self.assets['a']
+        self.assertEqual(image, self.assets['a'])
+        self.assertEqual(['a'], self.loads)
+        self.assertEqual(400, self.assets.used)
+        self.assertRaises(KeyError, lambda: self.assets['NOT-THERE'])
+        self.assertEqual(None, self.assets.get('NOT-THERE'))
+
+    def testPiecesShareTheirSheet(self):
+        """pieces should be cut from their sheet without extra memory"""
+        self.assets.register('sheet', self._loader('sheet', (20, 10)))
+        self.assets.register_piece('left', 'sheet', (0, 0, 10, 10))
+        self.assets.register_piece('right', 'sheet', (10, 0, 10, 10))
+        #
+        self.assertEqual((10, 10), self.assets['right'].get_size())
+        self.assertEqual((10, 10), self.assets['left'].get_size())
+        self.assertEqual(['sheet'], self.loads)
+        self.assertEqual(800, self.assets.used)
+
+    def testEvictsLeastRecentlyUsed(self):
+        """going over the budget should drop the least recently used"""
+        self.assets.budget = 800
+        self.assets['a']
+        self.assets['b']
+        self.assets['a']
+        self.assets['c']
+        self.assertEqual(['a', 'c'], sorted(self.assets.assets))
+        self.assertEqual(800, self.assets.used)
+        #
+        # Dropped assets are reloaded on demand
+        self.assets['b']
+        self.assertEqual(['a', 'b', 'c', 'b'], self.loads)
+        self.assertEqual(['b', 'c'], sorted(self.assets.assets))
+
+    def testEvictsSheetsWithTheirPieces(self):
+        """pieces should go when their sheet is dropped"""
+        self.assets.budget = 800
+        self.assets.register('sheet', self._loader('sheet', (20, 10)))
+        self.assets.register_piece('left', 'sheet', (0, 0, 10, 10))
+        self.assets['left']
+        self.assets['a']
+        self.assets['b']
+        self.assertFalse('left' in self.assets.assets)
+        self.assertFalse('sheet' in self.assets.assets)
+        self.assertEqual(800, self.assets.used)
+
+    def testDroppedAssetsInUseAreReused(self):
+        """dropped assets still referred to should come back, not be reloaded"""
+        self.assets.budget = 800
+        self.assets.register('sheet', self._loader('sheet', (20, 10)))
+        self.assets.register_piece('left', 'sheet', (0, 0, 10, 10))
+        image = self.assets['a']
+        piece = self.assets['left']
+        self.assets['b']
+        self.assets['c']
+        self.assertFalse('a' in self.assets.assets)
+        self.assertFalse('sheet' in self.assets.assets)
+        #
+        self.assertTrue(self.assets['a'] is image)
+        self.assertTrue(self.assets['left'] is piece)
+        self.assertTrue('sheet' in self.assets.assets)
+        self.assertEqual(['a', 'sheet', 'b', 'c'], self.loads)
+        #
+        # Assets registered again are loaded afresh
+        self.assets.register('a', self._loader('a', (10, 10)))
+        self.assertFalse(self.assets['a'] is image)
+
+    def testAssignedAssetsAreKept(self):
+        """assets set directly can't be reloaded so should never be dropped"""
+        self.assets.budget = 400
+        self.assets['d'] = pg.Surface((10, 10), pg.SRCALPHA)
+        self.assets['a']
+        self.assets['b']
+        self.assertEqual(['b', 'd'], sorted(self.assets.assets))
+        self.assertEqual(4, len(self.assets))
+        #
+        del self.assets['d']
+        self.assertFalse('d' in self.assets)
+        self.assertEqual(400, self.assets.used)
+
+    def testDecodeAndFinish(self):
+        """loading can be split into a decode step and a finish step"""
+        self.assets.register('d', lambda size: pg.Surface(size),
+                             lambda: (20, 10))
+        self.assertEqual(None, self.assets.decode('a'))
+        decoded = self.assets.decode('d')
+        self.assertFalse('d' in self.assets.assets)
+        self.assets.finish('d', decoded)
+        self.assertEqual((20, 10), self.assets['d'].get_size())
+        self.assertEqual(None, self.assets.decode('d'))
+
+
+class TestPrefetcher(unittest.TestCase):
+    """Tests for the Prefetcher"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.assets = tools.AssetManager()
+        for name in ('a', 'b'):
+            self.assets.register(name, lambda size: pg.Surface(size),
+                                 lambda: (10, 10))
+        self.prefetcher = prefetch.Prefetcher({'GFX': self.assets})
+
+    def _update(self):
+        """Update the prefetcher until it has nothing pending"""
+        for _ in range(1000):
+            self.prefetcher.update()
+            if not self.prefetcher.pending:
+                return
+            time.sleep(0.001)
+
+    def testRecordsAndPrefetches(self):
+        """assets recorded for a state should be loaded when it is requested"""
+        self.prefetcher.record('game')
+        self.assets['a']
+        self.prefetcher.record('lobby')
+        self.assets.clear_cache()
+        #
+        self.prefetcher.request('game')
+        self._update()
+        self.assertTrue('a' in self.assets.assets)
+        self.assertFalse('b' in self.assets.assets)
+        self.assertEqual(set(['a']), self.prefetcher.manifest['game']['GFX'])
+        self.assertEqual(set(), self.prefetcher.manifest['lobby']['GFX'])
+        #
+        # Only prefetched once until the state is entered
+        self.assets.clear_cache()
+        self.prefetcher.request('game')
+        self._update()
+        self.assertFalse('a' in self.assets.assets)
+
+    def testSaveManifest(self):
+        """the manifest is kept between runs, and failing to save is not fatal"""
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'manifest.json')
+            self.prefetcher.manifest_path = path
+            self.prefetcher.record('game')
+            self.assets['a']
+            self.assertTrue(self.prefetcher.save_manifest())
+            loaded = prefetch.Prefetcher({'GFX': self.assets}, path)
+            self.assertEqual({'game': {'GFX': set(['a'])}}, loaded.manifest)
+            self.prefetcher.manifest_path = os.path.join(directory, 'missing',
+                                                         'manifest.json')
+            self.assertFalse(self.prefetcher.save_manifest())
+        finally:
+            shutil.rmtree(directory)
+
+    def testStaleResultsAreIgnored(self):
+        """results of an earlier request don't count for a new one"""
+        self.prefetcher.record('game')
+        self.assets['a']
+        self.assets['b']
+        self.prefetcher.record('lobby')
+        self.assets.clear_cache()
+        #
+        # The state is entered and left before the first request is done
+        self.prefetcher.request('game')
+        self.prefetcher.record('game')
+        self.prefetcher.record('lobby')
+        self.prefetcher.request('game')
+        generation = self.prefetcher.pending['game'][0]
+        self._update()
+        self.assertEqual({}, self.prefetcher.pending)
+        self.assertTrue('a' in self.assets.assets and 'b' in self.assets.assets)
+        #
+        # Late results for a state that is no longer pending are dropped
+        self.prefetcher.results.put(('game', generation, 'GFX', 'a', None))
+        self.prefetcher.update()
+        self.assertEqual({}, self.prefetcher.pending)
+
+
+if __name__ == '__main__':
+    unittest.main()
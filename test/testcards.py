@@ -0,0 +1,196 @@
+"""Tests for the playing cards"""
+
+import unittest
+import random
+from array import array
+from itertools import product
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import prepare
+    from data.components import cards, card_core
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+def setUpModule():
+    prepare.init(display=False, audio=False, args=[])
+
+
+class TestCardImages(unittest.TestCase):
+    """Tests for the shared card images"""
+
+    def testDecksShareImages(self):
+        """Cards of the same name and size share their images"""
+        first = cards.Deck((0, 0), default_shuffle=False).make_hand(52)
+        second = cards.Deck((0, 0), card_size=(50, 70),
+                            default_shuffle=False).make_hand(52)
+        third = cards.Deck((0, 0), default_shuffle=False).make_hand(52)
+        for card, other, same in zip(first, second, third):
+            self.assertIs(card.image, same.image)
+            self.assertIs(card.back_image, first[0].back_image)
+            self.assertIsNot(card.image, other.image)
+            self.assertEqual(other.image.get_size(), (50, 70))
+        names = set(image[0] for image in cards.CARD_IMAGES)
+        self.assertIn("ace_of_spades", names)
+        self.assertIn("back", names)
+
+    def testRotate(self):
+        """Rotated cards use shared rotated images and keep their center"""
+        card = cards.Deck((0, 0), card_size=(50, 70)).draw_card()
+        same = cards.Card.from_code(card.code, (50, 70), 0)
+        card.rect.center = (100, 100)
+        upright = card.image
+        card.rotate(-90)
+        same.rotate(270)
+        self.assertEqual(card.rect.size, (70, 50))
+        self.assertEqual(card.rect.center, (100, 100))
+        self.assertEqual(card.back_image.get_size(), (70, 50))
+        self.assertIs(card.image, same.image)
+        card.rotate(90)
+        self.assertIs(card.image, upright)
+        self.assertEqual(card.angle, 0)
+
+
+class TestCardCore(unittest.TestCase):
+    """Tests for cards as ints"""
+
+    def testEncoding(self):
+        """Cards are numbered by suit then value"""
+        self.assertEqual(card_core.new_deck(2), array('B', list(range(52))*2))
+        for card in range(52):
+            value, suit = card_core.value(card), card_core.suit_name(card)
+            self.assertEqual(card_core.make_card(value, suit), card)
+            self.assertEqual(card_core.make_card(value, suit.lower()), card)
+            self.assertEqual(card_core.make_card(value, card_core.suit(card)),
+                             card)
+        self.assertEqual(card_core.make_card(1, "Clubs"), 0)
+        self.assertEqual(card_core.make_card(13, "Spades"), 51)
+        ace = card_core.make_card(1, "Spades")
+        self.assertEqual(card_core.name(ace), "Ace of Spades")
+        self.assertEqual(card_core.short_name(ace), "AS")
+        ten = card_core.make_card(10, "Hearts")
+        self.assertEqual(card_core.name(ten), "10 of Hearts")
+        self.assertEqual(card_core.long_name(ten), "Ten of Hearts")
+        self.assertEqual(card_core.short_name(ten), "10H")
+
+    def testBlackjackScores(self):
+        """Every way of counting Aces is listed"""
+        ace, king, five = 0, 12, 4
+        self.assertEqual(card_core.blackjack_scores([king, five]), [15])
+        self.assertEqual(card_core.blackjack_scores([ace, king]), [11, 21])
+        self.assertEqual(card_core.blackjack_scores([ace, five, ace]),
+                         [7, 17, 17, 27])
+        self.assertEqual(card_core.blackjack_scores([]), [0])
+
+    def testBaccaratPoints(self):
+        """Baccarat points count face cards and tens as 0"""
+        for cards_ in product(range(52), repeat=2):
+            values = [card_core.value(card) for card in cards_]
+            expected = sum(v for v in values if v < 10) % 10
+            self.assertEqual(card_core.baccarat_points(cards_), expected)
+
+
+class TestDeck(unittest.TestCase):
+    """Tests for Decks of card codes"""
+
+    def testDrawCardMakesSprites(self):
+        """Cards only become sprites when drawn"""
+        deck = cards.Deck((10, 20), default_shuffle=False, reuse_discards=False)
+        self.assertIsInstance(deck.shoe.cards, array)
+        card = deck.draw_card()
+        self.assertIsInstance(card, cards.Card)
+        self.assertEqual((card.code, card.name), (51, "King of Spades"))
+        self.assertFalse(card.face_up)
+        self.assertEqual(card.rect.topleft, (10 + 2*12, 20 - 12))
+        self.assertEqual(len(deck.make_hand(51)), 51)
+        self.assertIsNone(deck.draw_card())
+
+    def testReuseDiscards(self):
+        """Discarded cards go back into the deck"""
+        deck = cards.Deck((0, 0), default_shuffle=False)
+        hand = deck.make_hand(52)
+        for card in hand:
+            card.face_up = True
+            deck.discard(card)
+        card = deck.draw_card()
+        self.assertEqual(card.code, hand[-1].code)
+        self.assertFalse(card.face_up)
+        self.assertEqual(len(deck), 51)
+
+    def testInfinite(self):
+        """Infinite decks make a new deck when exhausted"""
+        deck = cards.Deck((0, 0), reuse_discards=False, infinite=True)
+        codes = sorted(card.code for card in deck.make_hand(52))
+        self.assertEqual(codes, list(range(52)))
+        self.assertIsNotNone(deck.draw_card())
+        self.assertEqual(len(deck), 51)
+
+    def testPenetration(self):
+        """Decks are exhausted at the cut card"""
+        deck = cards.Deck((0, 0), reuse_discards=False, num_decks=2,
+                          penetration=.5)
+        hand = deck.make_hand(52)
+        self.assertEqual(len(deck), 52)
+        self.assertIsNone(deck.draw_card())
+        for card in hand:
+            deck.discard(card)
+        deck.reuse_discards = True
+        self.assertIsNotNone(deck.draw_card())
+        self.assertEqual(len(deck), 103)
+        self.assertEqual(sum(deck.shoe.counts), 103)
+
+
+class TestShoe(unittest.TestCase):
+    """Tests for the Shoe"""
+
+    def check_shoe(self, vectorized):
+        shoe = card_core.Shoe(6, penetration=.75, rng=random.Random(3),
+                              vectorized=vectorized)
+        self.assertEqual(len(shoe), 312)
+        self.assertEqual(list(shoe.counts), [6]*52)
+        first = shoe.draw()
+        dealt = [first] + list(shoe.deal(100))
+        self.assertEqual(len(shoe), 211)
+        self.assertEqual(shoe.value_counts()[0] + sum(
+            1 for card in dealt if card_core.value(card) == 1), 24)
+        for card in range(52):
+            self.assertEqual(shoe.counts[card] + dealt.count(card), 6)
+        dealt.extend(shoe.deal(1000))
+        self.assertEqual(len(dealt), 234)
+        self.assertTrue(shoe.needs_shuffle)
+        self.assertIsNone(shoe.draw())
+        self.assertEqual(len(shoe.deal(5)), 0)
+        self.assertEqual(sorted(dealt + list(shoe.remaining())),
+                         sorted(list(range(52))*6))
+        shoe.reset()
+        self.assertEqual(len(shoe), 312)
+        self.assertFalse(shoe.needs_shuffle)
+        return dealt
+
+    def testShoe(self):
+        """Shoes deal each card once, up to the cut card"""
+        self.check_shoe(False)
+        self.assertEqual(self.check_shoe(False), self.check_shoe(False))
+
+    @unittest.skipIf(card_core.numpy is None, "needs NumPy")
+    def testVectorizedShoe(self):
+        """NumPy shoes deal the same way, and are seeded by rng"""
+        self.assertEqual(self.check_shoe(True), self.check_shoe(True))
+
+    def testDealOrder(self):
+        """Cards are dealt from the end of the buffer, like popping a list"""
+        shoe = card_core.Shoe(shuffled=False, vectorized=False)
+        self.assertEqual(shoe.draw(), 51)
+        self.assertEqual(list(shoe.deal(3)), [50, 49, 48])
+        cards = list(range(52))
+        random.Random(7).shuffle(cards)
+        shoe = card_core.Shoe(rng=random.Random(7), vectorized=False)
+        self.assertEqual(list(shoe.remaining()), cards)
+
+
+if __name__ == '__main__':
+    unittest.main()
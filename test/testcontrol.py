@@ -26,7 +26,7 @@ pg.display.set_mode(RESOLUTION)
 import sys
 sys.path.append('..')
 try:
-    from data import tools
+    from data import tools, events
 except ImportError:
     print('\n** ERROR ** Tests must be run from the test directory\n\n')
     sys.exit(1)
@@ -241,6 +241,126 @@ class TestControl(unittest.TestCase):
                       (RESOLUTION[0] - 1 - dx, RESOLUTION[1] - 1 - dy)):
             self._checkPoint((0, 255, 0), self.c.screen, point, 'green', 5, False)
 
+    def testRenderDirtyRects(self):
+        """render should only present the rects reported by the state when asked to"""
+        #
+        # By default the whole frame is presented
+        self.c.state.dirty_rects = [pg.Rect(0, 0, 2, 2)]
+        self.assertEqual(None, self.c.render())
+        #
+        # Once opted in only the dirty rects should be presented
+        self.c.use_dirty_rects = True
+        updated = self.c.render()
+        self.assertEqual([pg.Rect(0, 0, 2, 2)], updated)
+        #
+        # A state that reports no rects wants a full update
+        self.c.state.dirty_rects = None
+        self.assertEqual(None, self.c.render())
+
+    def testRenderDirtyRectsScaled(self):
+        """dirty rects should be scaled to the display resolution"""
+        #
+        w, h = RESOLUTION[0] * 2, RESOLUTION[1] * 2
+        self.c = SimpleControl('control', (w, h), [])
+        self.c.setup_states(self.states, 'one')
+        self.c.use_dirty_rects = True
+        self.c.render()
+        #
+        self.c.render_surf.fill((0, 255, 0), (0, 0, 4, 4))
+        self.c.state.dirty_rects = [pg.Rect(0, 0, 4, 4)]
+        self.assertEqual([pg.Rect(0, 0, 2, 2)], self.c.render())
+        self._checkPoint((0, 255, 0), self.c.screen, (0, 0), 'green', 5, False)
+
+    def testFlipStateForcesFullRender(self):
+        """the first frame of a new state should always be presented in full"""
+        #
+        self.c.use_dirty_rects = True
+        self.c.render()
+        self.states['one'].next = 'two'
+        self.states['two'].dirty_rects = [pg.Rect(0, 0, 1, 1)]
+        self.c.flip_state()
+        self.assertEqual(None, self.c.render())
+        self.assertEqual([pg.Rect(0, 0, 1, 1)], self.c.render())
+
+    def testNativeResolutionStateDrawsToScreen(self):
+        """states at native resolution should be given the display to draw on"""
+        #
+        self.c.state.update = self._catchCall('update')
+        self.c.update(10)
+        self.assertTrue(self.call_arguments['update'][0][0] is self.c.render_surf)
+        #
+        self.c.state.native_resolution = True
+        self.c.update(10)
+        self.assertTrue(self.call_arguments['update'][0][0] is self.c.screen)
+        self.assertEqual(None, self.c.render())
+
+    def testScaledAssetsFollowControlScale(self):
+        """scaled assets should be rebuilt when the control scale changes"""
+        #
+        image = pg.Surface((20, 40))
+        assets = tools.ScaledAssets({'image': image})
+        self.c = SimpleControl('control', (RESOLUTION[0] * 2, RESOLUTION[1] * 2), RESOLUTIONS)
+        self.c.scaled_assets = assets
+        self.c.set_scale()
+        #
+        scaled = assets.image('image')
+        self.assertEqual((10, 20), scaled.get_size())
+        self.assertTrue(scaled is assets.image('image'))
+        self.assertEqual(pg.Rect(5, 5, 10, 20), assets.rect((10, 10, 20, 40)))
+        font = assets.font(None, 36)
+        self.assertEqual(pg.font.Font(None, 18).get_height(), font.get_height())
+        self.assertTrue(font is assets.font(None, 36))
+        #
+        # Resizing should drop the old sizes
+        self.c.on_resize(RESOLUTIONS[DEFAULT_RESOLUTION_INDEX + 1])
+        self.assertFalse(scaled is assets.image('image'))
+
+    def testStateFactoriesAreBuiltOnFirstEntry(self):
+        """states given as factories should only be built when entered"""
+        #
+        built = []
+        def factory(name):
+            def make():
+                built.append(name)
+                return SimpleState(name)
+            return make
+        #
+        self.c.setup_states({'one': factory('one'), 'two': factory('two')}, 'one')
+        self.assertEqual(['one'], built)
+        self.assertEqual('one', self.c.state._name)
+        #
+        self.c.state.next = 'two'
+        self.c.flip_state()
+        self.assertEqual(['one', 'two'], built)
+        self.assertEqual('two', self.c.state._name)
+        #
+        # Going back should reuse the already built state
+        self.c.state.next = 'one'
+        self.c.flip_state()
+        self.assertEqual(['one', 'two'], built)
+
+    def testStateEviction(self):
+        """least recently visited states should be evicted when over the limit"""
+        #
+        factories = dict((name, lambda name=name: SimpleState(name))
+                         for name in ('a', 'b', 'c'))
+        self.c.setup_states(factories, 'a')
+        self.c.max_states = 2
+        for name in ('b', 'c'):
+            self.c.state.next = name
+            self.c.flip_state()
+        #
+        # 'a' was least recently visited so should be back to a factory
+        self.assertFalse(isinstance(self.c.state_dict['a'], tools._State))
+        self.assertTrue(isinstance(self.c.state_dict['b'], tools._State))
+        self.assertTrue(self.c.state_dict['c'] is self.c.state)
+        #
+        # And it is rebuilt when entered again
+        self.c.state.next = 'a'
+        self.c.flip_state()
+        self.assertTrue(isinstance(self.c.state_dict['a'], tools._State))
+        self.assertEqual('c', self.c.state.previous)
+
     def testFlipState(self):
         """should be able to flip back to previous state"""
         #
@@ -517,6 +637,127 @@ class TestControl(unittest.TestCase):
         #
         self.assertEqual(5, self.call_times['pgupdate-2'])
 
+    def testHeadlessUsesFixedTimestep(self):
+        """headless main loop should step with a fixed delta and simulated time"""
+        #
+        self.c.update = self._catchCall('update')
+        self.c.headless = True
+        self.c.fps = 20
+        self.c.max_iterations = 3
+        self.c.main()
+        #
+        # Should have run for exactly the number of iterations with a 50ms step
+        self.assertEqual(3, self.call_times['update'])
+        self.assertEqual(50.0, self.call_arguments['update'][0][0])
+
+    def testIdleStateWaitsForEvents(self):
+        """tick should sleep while the state is idle until an event arrives"""
+        #
+        self.c.idle_timeout = 100
+        self.c.tick()
+        self.c.state.idle = True
+        pg.event.clear()
+        #
+        # With no events the tick waits for the timeout
+        self.assertTrue(self.c.tick() >= 90)
+        #
+        # Events wake it straight away and are left for the event loop
+        pg.event.post(pg.event.Event(pg.USEREVENT))
+        self.assertTrue(self.c.tick() < 90)
+        self.assertEqual(1, len(pg.event.get(pg.USEREVENT)))
+
+    def testIdleStateWakesForDueTasks(self):
+        """tick should only sleep until the state's next delayed call"""
+        #
+        self.c.idle_timeout = 1000
+        self.c.tick()
+        self.c.state.idle = True
+        self.c.state.delay(30, self._catchCall('delayed'))
+        pg.event.clear()
+        self.assertTrue(self.c.tick() < 500)
+
+    def testUpdateAdvancesStateScheduler(self):
+        """update should fire the active state's delayed calls when due"""
+        #
+        self.c.state.delay(150, self._catchCall('delayed'), args=(1,))
+        self.states['two'].delay(50, self._catchCall('other'))
+        self.c.update(100)
+        self.assertFalse(self.called.get('delayed', False))
+        self.c.update(100)
+        self.assertEqual(1, self.call_times['delayed'])
+        self.assertEqual((1,), self.call_arguments['delayed'][0])
+        self.assertFalse(self.called.get('other', False))
+
+    def testUpdateDrainsBroadcaster(self):
+        """update should handle events posted to the broadcaster"""
+        #
+        broadcaster = events.Broadcaster(queued=True)
+        broadcaster.linkEvent('posted', self._catchCall('posted'))
+        self.c.broadcaster = broadcaster
+        broadcaster.postEvent(('posted', 1), coalesce=True)
+        broadcaster.postEvent(('posted', 1), coalesce=True)
+        self.assertFalse(self.called.get('posted', False))
+        self.c.update(100)
+        self.assertEqual(1, self.call_times['posted'])
+        self.assertEqual(0, len(broadcaster))
+
+    def testTimeScaleSpeedsUpGameTime(self):
+        """update should give states and their timers scaled game time"""
+        #
+        self.c.state.update = self._catchCall('update')
+        self.c.state.delay(300, self._catchCall('delayed'))
+        self.c.time_scale = 4
+        self.c.now = 0.0
+        self.c.update(50)
+        self.assertEqual(200.0, self.call_arguments['update'][0][3])
+        self.assertEqual(200.0, self.c.now)
+        self.assertFalse(self.called['delayed'])
+        self.c.update(25)
+        self.assertTrue(self.called['delayed'])
+        #
+        # Instant steps are long enough to finish anything waiting
+        self.c.time_scale = tools.INSTANT
+        self.c.update(16)
+        self.assertEqual(tools.INSTANT_STEP, self.call_arguments['update'][0][3])
+
+    def testTimeScaleArgument(self):
+        """-t should accept positive factors and 'instant'"""
+        #
+        args = ('Test', (0, 0), (10, 10), 100)
+        self.assertEqual(1.0, tools.get_cli_args(*args, argv=[])['time_scale'])
+        self.assertEqual(2.5, tools.get_cli_args(*args, argv=['-t', '2.5'])['time_scale'])
+        instant = tools.get_cli_args(*args, argv=['-t', 'instant'])
+        self.assertEqual(tools.INSTANT, instant['time_scale'])
+        with open(os.devnull, 'w') as devnull:
+            stderr, sys.stderr = sys.stderr, devnull
+            try:
+                self.assertRaises(SystemExit, tools.get_cli_args, *args,
+                                  argv=['-t', '0'])
+            finally:
+                sys.stderr = stderr
+
+    def testHeadlessSimulatesNow(self):
+        """headless update should advance now by the delta rather than the real clock"""
+        #
+        self.c.headless = True
+        self.c.now = 0.0
+        self.c.update(100)
+        self.c.update(100)
+        self.assertEqual(200.0, self.c.now)
+
+    def testHeadlessSkipsRendering(self):
+        """headless main loop should not render or update the display"""
+        #
+        self.c.render = self._catchCall('render')
+        self.c.headless = True
+        self.c.max_iterations = 5
+        with controllable_main_loop(self, 'pgupdate', 10):
+            self.c.main()
+        #
+        self.assertFalse(self.called['render'])
+        self.assertFalse(self.called.get('pgupdate', False))
+        self.assertEqual(5, self.c.iterations)
+
 
 class SimpleControl(tools.Control):
     """A simple control to use for testing"""
@@ -0,0 +1,205 @@
+"""Tests for the event system"""
+
+import gc
+import unittest
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import events
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestEventAware(unittest.TestCase):
+    """Tests for linking and processing events"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.broadcaster = events.Broadcaster()
+        self.called = []
+
+    def handler(self, name):
+        return lambda obj, arg: self.called.append((name, obj, arg))
+
+    def testPriorities(self):
+        """Handlers with a higher priority are called first"""
+        b = self.broadcaster
+        b.linkEvent('e', self.handler('first'))
+        b.linkEvent('e', self.handler('urgent'), 'x', priority=5)
+        b.linkEvent('e', self.handler('second'))
+        b.linkEvent('e', self.handler('late'), priority=-1)
+        b.processEvent(('e', 1))
+        self.assertEqual([name for name, obj, arg in self.called],
+                         ['urgent', 'first', 'second', 'late'])
+        self.assertEqual(self.called[0], ('urgent', 1, 'x'))
+
+    def testUnlink(self):
+        """Unlinking removes every link to the callback"""
+        b = self.broadcaster
+        handler, other = self.handler('a'), self.handler('b')
+        b.linkEvent('e', handler)
+        b.linkEvent('e', other)
+        b.linkEvent('e', handler, 2)
+        links = b._event_handlers['e']
+        b.unlinkEvent('e', handler)
+        self.assertIs(b._event_handlers['e'], links)
+        b.processEvent(('e', None))
+        self.assertEqual(self.called, [('b', None, None)])
+        self.assertRaises(events.EventNotLinked, b.unlinkEvent, 'e', handler)
+        self.assertRaises(events.EventNotLinked, b.unlinkEvent, 'f', handler)
+
+    def testLinkWhileProcessing(self):
+        """A handler linking one with a higher priority is not called again"""
+        b = self.broadcaster
+        def link(obj, arg):
+            self.called.append(('link', obj, arg))
+            b.linkEvent('e', self.handler('urgent'), priority=1)
+        b.linkEvent('e', link)
+        b.processEvent(('e', None))
+        self.assertEqual([name for name, obj, arg in self.called], ['link'])
+        b.processEvent(('e', None))
+        self.assertEqual([name for name, obj, arg in self.called[1:]],
+                         ['urgent', 'link'])
+
+    def testUnlinkWhileProcessing(self):
+        """A handler unlinking another does not make handlers get skipped"""
+        b = self.broadcaster
+        last = self.handler('last')
+        def unlink(obj, arg):
+            self.called.append(('unlink', obj, arg))
+            b.unlinkEvent('e', unlink)
+        b.linkEvent('e', unlink)
+        b.linkEvent('e', last)
+        b.processEvent(('e', None))
+        b.processEvent(('e', None))
+        self.assertEqual([name for name, obj, arg in self.called],
+                         ['unlink', 'last', 'last'])
+
+
+class Listener(object):
+    """An object linking one of its methods"""
+    def __init__(self, called):
+        self.called = called
+
+    def handle(self, obj, arg):
+        self.called.append(('listener', obj, arg))
+
+
+class TestWeakLinks(unittest.TestCase):
+    """Tests for links to methods"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.broadcaster = events.Broadcaster()
+        self.called = []
+
+    def testMethodsDoNotKeepObjectsAlive(self):
+        """Links to methods are dropped with their object"""
+        b = self.broadcaster
+        listener = Listener(self.called)
+        b.linkEvent('e', listener.handle)
+        b.linkEvent('e', lambda obj, arg: self.called.append(('lambda', obj, arg)))
+        b.linkEvent('f', listener.handle, 1)
+        self.assertEqual(b.liveHandlers(), {'e': 2, 'f': 1})
+        b.processEvent(('e', 0))
+        self.assertEqual(self.called, [('listener', 0, None), ('lambda', 0, None)])
+        del listener
+        gc.collect()
+        b.processEvent(('e', 1))
+        self.assertEqual(self.called[2:], [('lambda', 1, None)])
+        self.assertEqual(len(b._event_handlers['e']), 1)
+        self.assertEqual(b.liveHandlers(), {'e': 1})
+        self.assertNotIn('f', b._event_handlers)
+
+    def testUnlinkMethod(self):
+        """Methods are unlinked by a new reference to the same method"""
+        b = self.broadcaster
+        listener = Listener(self.called)
+        b.linkEvent('e', listener.handle)
+        b.unlinkEvent('e', listener.handle)
+        b.processEvent(('e', 0))
+        self.assertEqual(self.called, [])
+        self.assertEqual(b.liveHandlers(), {})
+
+
+class TestQueuedBroadcaster(unittest.TestCase):
+    """Tests for posting events to a queued Broadcaster"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.broadcaster = events.Broadcaster(queued=True)
+        self.called = []
+        for name in ('a', 'b', 'c'):
+            self.broadcaster.linkEvent(name, self.record, name)
+
+    def record(self, obj, name):
+        self.called.append((name, obj))
+
+    def testPostedEventsWait(self):
+        """Posted events are handled by drain, by priority then in order"""
+        b = self.broadcaster
+        b.postEvent(('a', 1))
+        b.postEvent(('b', 2))
+        b.postEvent(('c', 3), priority=1)
+        self.assertEqual(self.called, [])
+        self.assertEqual(len(b), 3)
+        self.assertEqual(b.drain(), 3)
+        self.assertEqual(self.called, [('c', 3), ('a', 1), ('b', 2)])
+        self.assertEqual(len(b), 0)
+
+    def testCoalesce(self):
+        """Coalesced events are only queued once until handled"""
+        b = self.broadcaster
+        for i in range(5):
+            b.postEvent(('a', 1), coalesce=True)
+            b.postEvent(('a', 2), coalesce=True)
+        b.postEvent(('a', 1))
+        b.drain()
+        self.assertEqual(self.called, [('a', 1), ('a', 2), ('a', 1)])
+        b.postEvent(('a', 1), coalesce=True)
+        b.drain()
+        self.assertEqual(self.called[-1], ('a', 1))
+        self.assertEqual(len(self.called), 4)
+
+    def testCascade(self):
+        """Events posted by handlers are handled in the same drain"""
+        b = self.broadcaster
+        b.linkEvent('a', lambda obj, arg: b.postEvent(('b', obj)))
+        b.postEvent(('a', 1))
+        self.assertEqual(b.drain(), 2)
+        self.assertEqual(self.called, [('a', 1), ('b', 1)])
+
+    def testBudget(self):
+        """Events left over when the budget runs out wait for the next drain"""
+        b = self.broadcaster
+        for i in range(3):
+            b.postEvent(('a', i))
+        self.assertEqual(b.drain(budget=0), 1)
+        self.assertEqual(len(b), 2)
+        self.assertEqual(b.drain(budget=0), 1)
+        self.assertEqual(b.drain(), 1)
+        self.assertEqual(self.called, [('a', 0), ('a', 1), ('a', 2)])
+
+    def testNotQueued(self):
+        """Without queued, posted events are handled immediately"""
+        b = self.broadcaster
+        b.queued = False
+        b.postEvent(('a', 1), coalesce=True)
+        b.postEvent(('a', 1), coalesce=True)
+        self.assertEqual(self.called, [('a', 1), ('a', 1)])
+
+    def testClearEvents(self):
+        """Cleared events are never handled"""
+        b = self.broadcaster
+        b.postEvent(('a', 1), coalesce=True)
+        b.clearEvents()
+        b.postEvent(('a', 1), coalesce=True)
+        b.drain()
+        self.assertEqual(self.called, [('a', 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
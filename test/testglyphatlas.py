@@ -0,0 +1,111 @@
+"""Tests for the glyph atlas text renderer"""
+
+import os
+import unittest
+
+import pygame as pg
+pg.init()
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import glyph_atlas, labels
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+FONT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    "resources", "fonts", "Saniretro.ttf")
+
+
+class TestGlyphAtlas(unittest.TestCase):
+    """Tests for the GlyphAtlas"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.font = pg.font.Font(FONT, 36)
+        self.color = pg.Color("gold3")
+
+    def assertSameImage(self, first, second):
+        """Check two surfaces have the same size and pixels"""
+        self.assertEqual(first.get_size(), second.get_size())
+        self.assertEqual(pg.image.tostring(first, "RGBA"),
+                         pg.image.tostring(second, "RGBA"))
+
+    def testMatchesFontRender(self):
+        """Text built from the atlas looks like the font's render"""
+        atlas = glyph_atlas.GlyphAtlas(self.font, self.color)
+        for text in ("Balance:  $1,234", "Bet: $25", "Spot: 10"):
+            self.assertSameImage(atlas.render(text),
+                                 self.font.render(text, True, self.color))
+
+    def testTallCharacters(self):
+        """Characters reaching above the font line up with the others"""
+        font = pg.font.Font(os.path.join(os.path.dirname(FONT),
+                                         "PerfectDOSVGA437.ttf"), 36)
+        atlas = glyph_atlas.GlyphAtlas(font, self.color)
+
+        def on_felt(image):
+            #Transparent pixels can differ in color, so compare as drawn
+            felt = pg.Surface(image.get_size())
+            felt.fill((0, 153, 51))
+            felt.blit(image, (0, 0))
+            return felt
+
+        for text in ("$1^2", "Bet: $25"):
+            expected = font.render(text, True, self.color)
+            self.assertGreater(expected.get_height(), font.get_height())
+            self.assertSameImage(on_felt(atlas.render(text)), on_felt(expected))
+            image = atlas.render(text, (0, 153, 51))
+            self.assertTrue(atlas.redraw(image, text, text.replace("$", "^"),
+                                         (0, 153, 51)))
+            self.assertSameImage(image, atlas.render(text.replace("$", "^"),
+                                                     (0, 153, 51)))
+
+    def testCharactersOutsideCharsetAreAdded(self):
+        """Characters missing from the charset are rendered when needed"""
+        atlas = glyph_atlas.GlyphAtlas(self.font, self.color, "0123456789")
+        self.assertNotIn("$", atlas.glyphs)
+        self.assertSameImage(atlas.render("$90"),
+                             self.font.render("$90", True, self.color))
+        self.assertIn("$", atlas.glyphs)
+
+    def testRedrawChangesOnlyWhatDiffers(self):
+        """Redrawing in place matches a fresh render"""
+        for font in (self.font, pg.font.Font(None, 36)):
+            atlas = glyph_atlas.GlyphAtlas(font, self.color)
+            for bg in (None, (0, 153, 51)):
+                image = atlas.render("Bet: $250", bg)
+                self.assertTrue(atlas.redraw(image, "Bet: $250", "Bet: $280", bg))
+                self.assertSameImage(image, atlas.render("Bet: $280", bg))
+        atlas = glyph_atlas.GlyphAtlas(self.font, self.color)
+        image = atlas.render("$20")
+        self.assertFalse(atlas.redraw(image, "$20", "$200"))
+        self.assertFalse(atlas.redraw(image, "$20", "$21"))
+        self.assertSameImage(image, atlas.render("$20"))
+
+    def testAtlasesAreShared(self):
+        """One atlas is made for each font and color"""
+        first = glyph_atlas.get_atlas(self.font, self.color)
+        self.assertIs(glyph_atlas.get_atlas(self.font, (205, 173, 0)), first)
+        self.assertIsNot(glyph_atlas.get_atlas(self.font, (0, 0, 0)), first)
+
+    def testGlyphLabel(self):
+        """GlyphLabel works like a Label"""
+        label = labels.GlyphLabel(FONT, 36, "Pot: $0", "gold3",
+                                  {"midleft": (650, 610)})
+        label.set_text("Pot: $420")
+        self.assertEqual(label.rect.midleft, (650, 610))
+        self.assertEqual(label.rect.size, self.font.size("Pot: $420"))
+        label.set_alpha(100)
+        self.assertEqual(label.image.get_alpha(), 100)
+        label.set_text("Pot: $480")
+        self.assertEqual(label.image.get_alpha(), 100)
+        self.assertSameImage(label.image, labels.GlyphLabel(
+            FONT, 36, "Pot: $480", "gold3", {"center": (0, 0)}).image)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Tests for the video poker hold advisor"""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from itertools import combinations
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import card_core, poker_eval
+    from data.states.video_poker import video_poker_advisor as advisor
+    from data.states.video_poker.video_poker_dealer import video_poker_rank
+    from data.states.video_poker.video_poker_data import HAND_RANKS, NO_HAND, PAYTABLE
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+def hand(*names):
+    """Cards from short names like "AS" or "10H" """
+    values = {"A": 1, "J": 11, "Q": 12, "K": 13}
+    return [card_core.make_card(values.get(name[:-1]) or int(name[:-1]),
+                                "CHDS".index(name[-1]))
+            for name in names]
+
+
+def brute_force(cards, hold):
+    """Count the draws for hold by evaluating every one"""
+    held = [cards[index] for index in advisor.held_cards(hold)]
+    deck = [card for card in range(52) if card not in cards]
+    counts = [0] * (advisor.NOTHING + 1)
+    for drawn in combinations(deck, 5 - len(held)):
+        rank = video_poker_rank(poker_eval.evaluate5(*(held + list(drawn))))
+        counts[advisor.NOTHING if rank == NO_HAND else rank] += 1
+    return counts
+
+
+class TestCountHolds(unittest.TestCase):
+    """Tests for counting the draws of each hold"""
+
+    def testMatchesBruteForce(self):
+        """Counts match evaluating every draw, and cover every draw"""
+        rng = random.Random(4)
+        hands = [hand("AS", "KS", "QS", "JS", "3D"),
+                 hand("7C", "7D", "8H", "9H", "10H"),
+                 rng.sample(range(52), 5)]
+        for cards in hands:
+            counts = advisor.count_holds(cards)
+            for hold in range(advisor.NUM_HOLDS):
+                held = len(advisor.held_cards(hold))
+                self.assertEqual(sum(counts[hold]),
+                                 advisor.COMBINATIONS[47][5 - held])
+                if held >= 3:
+                    self.assertEqual(counts[hold], brute_force(cards, hold))
+
+    def testValues(self):
+        """Standing pat pays the hand, and four to a royal is worth holding"""
+        royal = hand("AH", "KH", "QH", "JH", "10H")
+        self.assertEqual(advisor.hold_values(advisor.count_holds(royal))[31], 250)
+        self.assertEqual(advisor.hold_values(advisor.count_holds(royal), 5)[31], 4000)
+        cards = hand("AS", "KS", "QS", "JS", "3D")
+        values = advisor.hold_values(advisor.count_holds(cards))
+        self.assertEqual(max(range(32), key=values.__getitem__), 15)
+        #One royal, eight other flushes, three straights and twelve high pairs.
+        pays = dict((name, PAYTABLE[0][rank]) for name, rank in HAND_RANKS.items())
+        self.assertAlmostEqual(values[15], (pays['ROYAL_FLUSH'] + 8*pays['FLUSH'] +
+                                            3*pays['STRAIGHT'] +
+                                            12*pays['JACKS_OR_BETTER']) / 47.)
+
+
+class TestHoldAdvisor(unittest.TestCase):
+    """Tests for the cached advisor"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testSuitsAndOrder(self):
+        """Hands the same up to suits and order share one cached entry"""
+        hold_advisor = advisor.HoldAdvisor()
+        cards = hand("AS", "KS", "QS", "JS", "3D")
+        other = hand("3C", "JH", "QH", "KH", "AH")
+        hold, value = hold_advisor.best_hold(cards)
+        self.assertEqual(hold, 15)
+        self.assertEqual(hold_advisor.best_hold(other), (30, value))
+        self.assertEqual(len(hold_advisor.cache), 1)
+        self.assertEqual(advisor.canonical(cards)[0], advisor.canonical(other)[0])
+
+    def testSaveAndLoad(self):
+        """The cache is kept in a file between advisors"""
+        path = os.path.join(self.directory, "cache.json")
+        cards = hand("7C", "7D", "8H", "9H", "10H")
+        first = advisor.HoldAdvisor(path)
+        values = first.values(cards, 3)
+        first.save()
+        second = advisor.HoldAdvisor(path)
+        self.assertEqual(list(second.cache), list(first.cache))
+        self.assertEqual(second.values(cards, 3), values)
+        self.assertEqual(advisor.HoldAdvisor(os.path.join(self.directory,
+                                                          "missing")).cache, {})
+
+    def testSaveOnlyChanges(self):
+        """Nothing is written until there are new hands, or if it can't be"""
+        path = os.path.join(self.directory, "cache.json")
+        hold_advisor = advisor.HoldAdvisor(path)
+        self.assertTrue(hold_advisor.save())
+        self.assertFalse(os.path.exists(path))
+        hold_advisor.values(hand("7C", "7D", "8H", "9H", "10H"))
+        hold_advisor.path = os.path.join(self.directory, "missing", "cache.json")
+        self.assertFalse(hold_advisor.save())
+        hold_advisor.path = path
+        self.assertTrue(hold_advisor.save())
+        os.remove(path)
+        hold_advisor.values(hand("7C", "7D", "8H", "9H", "10H"))
+        self.assertTrue(hold_advisor.save())
+        self.assertFalse(os.path.exists(path))
+
+    def testMaxHands(self):
+        """Only the most recently seen hands are kept"""
+        path = os.path.join(self.directory, "cache.json")
+        hold_advisor = advisor.HoldAdvisor(path, max_hands=2)
+        hands = [hand("7C", "7D", "8H", "9H", "10H"),
+                 hand("AS", "KS", "QS", "JS", "3D"),
+                 hand("2C", "5D", "8H", "JS", "KD")]
+        hold_advisor.values(hands[0])
+        hold_advisor.values(hands[1])
+        hold_advisor.values(hands[0])
+        hold_advisor.values(hands[2])
+        keys = [advisor.canonical(cards)[0] for cards in hands]
+        self.assertEqual(list(hold_advisor.cache), [keys[0], keys[2]])
+        hold_advisor.save()
+        self.assertEqual(list(advisor.HoldAdvisor(path, max_hands=1).cache),
+                         [keys[2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
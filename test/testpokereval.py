@@ -0,0 +1,136 @@
+"""Tests for the poker hand evaluator"""
+
+import unittest
+import random
+from collections import Counter
+from itertools import combinations
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import poker_eval, card_core
+    from data.states.video_poker import video_poker_dealer
+    from data.states.video_poker.video_poker_data import HAND_RANKS, NO_HAND
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+def hand(*names):
+    """Cards from short names like "AS" or "10H" """
+    values = {"A": 1, "J": 11, "Q": 12, "K": 13}
+    return [card_core.make_card(values.get(name[:-1]) or int(name[:-1]),
+                                "CHDS".index(name[-1]))
+            for name in names]
+
+
+class TestEvaluate5(unittest.TestCase):
+    """Tests for 5 card hands"""
+
+    def testOrder(self):
+        """Hands are ranked best first"""
+        hands = [hand("AS", "KS", "QS", "JS", "10S"),
+                 hand("5D", "4D", "3D", "2D", "AD"),
+                 hand("9C", "9D", "9H", "9S", "2C"),
+                 hand("3C", "3D", "3H", "2S", "2C"),
+                 hand("AH", "QH", "9H", "5H", "3H"),
+                 hand("AS", "KS", "QS", "JS", "10D"),
+                 hand("5D", "4D", "3D", "2S", "AD"),
+                 hand("QC", "QD", "QH", "5S", "2C"),
+                 hand("KC", "KD", "4H", "4S", "2C"),
+                 hand("KC", "KD", "3H", "3S", "AC"),
+                 hand("AC", "AD", "4H", "3S", "2C"),
+                 hand("JC", "JD", "AH", "KS", "QC"),
+                 hand("AC", "KD", "QH", "JS", "9C"),
+                 hand("7C", "5D", "4H", "3S", "2C")]
+        ranks = [poker_eval.evaluate5(*cards) for cards in hands]
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(set(ranks)), len(ranks))
+        self.assertEqual((ranks[0], ranks[-1]), (1, poker_eval.WORST_RANK))
+        kinds = [poker_eval.category(rank) for rank in ranks]
+        self.assertEqual(kinds[:8], ["Straight Flush"]*2 + ["Four of a Kind",
+                         "Full House", "Flush", "Straight", "Straight",
+                         "Three of a Kind"])
+        self.assertEqual(poker_eval.pair_value(ranks[10]), 1)
+        self.assertEqual(poker_eval.pair_value(ranks[11]), 11)
+        self.assertIsNone(poker_eval.pair_value(ranks[9]))
+
+    def testAnyOrder(self):
+        """The order of the cards doesn't matter"""
+        rng = random.Random(2)
+        for _ in range(200):
+            cards = rng.sample(range(52), 5)
+            rank = poker_eval.evaluate(cards)
+            rng.shuffle(cards)
+            self.assertEqual(poker_eval.evaluate5(*cards), rank)
+
+    def testCategoryCounts(self):
+        """Every hand gets a rank, and each kind of hand is as common as it should be"""
+        if poker_eval.numpy is None:
+            hands = list(combinations(range(0, 52, 2), 5))
+            ranks = [poker_eval.evaluate5(*cards) for cards in hands]
+        else:
+            hands = poker_eval.numpy.array(list(combinations(range(52), 5)))
+            ranks = poker_eval.evaluate5_array(hands)
+            counts = Counter()
+            for rank, count in zip(*[array.tolist() for array in
+                                     poker_eval.numpy.unique(ranks, return_counts=True)]):
+                counts[poker_eval.category(rank)] += count
+            self.assertEqual(counts, {"Straight Flush": 40, "Four of a Kind": 624,
+                                      "Full House": 3744, "Flush": 5108,
+                                      "Straight": 10200, "Three of a Kind": 54912,
+                                      "Two Pair": 123552, "One Pair": 1098240,
+                                      "High Card": 1302540})
+            self.assertEqual(len(poker_eval.numpy.unique(ranks)),
+                             poker_eval.WORST_RANK)
+            rng = random.Random(3)
+            for index in rng.sample(range(len(ranks)), 2000):
+                self.assertEqual(poker_eval.evaluate5(*hands[index].tolist()),
+                                 ranks[index])
+            ranks = ranks.tolist()
+        self.assertTrue(all(1 <= rank <= poker_eval.WORST_RANK for rank in ranks))
+
+    def testVideoPokerRanks(self):
+        """Ranks map to the video poker pay table"""
+        rank = video_poker_dealer.video_poker_rank
+        evaluate = lambda *names: rank(poker_eval.evaluate5(*hand(*names)))
+        self.assertEqual(evaluate("AS", "KS", "QS", "JS", "10S"),
+                         HAND_RANKS['ROYAL_FLUSH'])
+        self.assertEqual(evaluate("KS", "QS", "JS", "10S", "9S"),
+                         HAND_RANKS['STR_FLUSH'])
+        self.assertEqual(evaluate("JC", "JD", "AH", "KS", "QC"),
+                         HAND_RANKS['JACKS_OR_BETTER'])
+        self.assertEqual(evaluate("10C", "10D", "AH", "KS", "QC"), NO_HAND)
+        self.assertEqual(evaluate("AC", "KD", "QH", "JS", "9C"), NO_HAND)
+
+
+class TestEvaluate2(unittest.TestCase):
+    """Tests for guts hands"""
+
+    def testOrder(self):
+        """Pairs beat high cards, then higher cards win"""
+        hands = [hand("AC", "AD"), hand("2C", "2D"), hand("AS", "KS"),
+                 hand("AS", "2S"), hand("KS", "QS"), hand("3S", "2S")]
+        ranks = [poker_eval.evaluate(cards) for cards in hands]
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual((ranks[0], ranks[-1]), (1, poker_eval.WORST_RANK2))
+        self.assertEqual(poker_eval.evaluate2(*hand("KD", "AH")), ranks[2])
+
+    def testBest(self):
+        """best finds every hand that ties for best"""
+        hands = [hand("KC", "QD"), hand("KH", "QS"), hand("KS", "JD")]
+        self.assertEqual(poker_eval.best(hands), [0, 1])
+        self.assertEqual(poker_eval.best([]), [])
+
+    @unittest.skipIf(poker_eval.numpy is None, "needs NumPy")
+    def testArray(self):
+        """Bulk ranks match single ones"""
+        hands = list(combinations(range(52), 2))
+        ranks = poker_eval.evaluate2_array(poker_eval.numpy.array(hands))
+        self.assertEqual(ranks.tolist(),
+                         [poker_eval.evaluate2(*cards) for cards in hands])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Tests for the prepare module"""
+
+import unittest
+import subprocess
+import os
+
+import pygame as pg
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import prepare
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestPrepare(unittest.TestCase):
+    """Tests for the prepare module"""
+
+    def _run(self, code):
+        """Run code in a fresh interpreter and return its output"""
+        env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+        return subprocess.check_output([sys.executable, "-c", code],
+                                       cwd=ROOT, env=env).decode().split()
+
+    def testImportHasNoSideEffects(self):
+        """Importing the game leaves pygame and the resources alone"""
+        output = self._run(
+            "import pygame as pg\n"
+            "from data import main, prepare\n"
+            "from data.components import cards, casino_player\n"
+            "print(pg.display.get_init(), pg.mixer.get_init())\n"
+            "print('GFX' in vars(prepare), 'SFX' in vars(prepare))\n")
+        self.assertEqual(output[-4:], ["False", "None", "False", "False"])
+
+    def testInitAppliesArguments(self):
+        """init parses the given arguments and loads the resources"""
+        prepare.init(display=False, audio=False,
+                     args=["-M", "250", "-s", "600", "400"])
+        try:
+            self.assertEqual(prepare.MONEY, 250)
+            self.assertEqual(prepare.START_SIZE, (600, 400))
+            self.assertTrue(prepare.ARGS["music_off"])
+            self.assertEqual(pg.display.get_surface().get_size(), (600, 400))
+            self.assertIn("GFX", vars(prepare))
+            self.assertNotEqual(pg.display.get_caption()[0], prepare.CAPTION)
+        finally:
+            prepare.init(display=False, audio=False, args=[])
+
+    def testResourcesAreCreatedOnFirstAccess(self):
+        """Resources not loaded by init are made when first used"""
+        output = self._run(
+            "from data import prepare\n"
+            "print('FONTS' in vars(prepare))\n"
+            "print('Saniretro' in prepare.FONTS, 'FONTS' in vars(prepare))\n")
+        self.assertEqual(output[-3:], ["False", "True", "True"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for recording and replaying input"""
+
+import unittest
+import tempfile
+import shutil
+import os
+import random
+
+import pygame as pg
+pg.init()
+pg.display.set_mode((10, 10))
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import tools, replay
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class LoggingState(tools._State):
+    """A state that logs what it sees each frame"""
+
+    def __init__(self):
+        super(LoggingState, self).__init__()
+        self.log = []
+
+    def get_event(self, event, scale=(1, 1)):
+        self.log.append(('event', event.type, getattr(event, 'pos', None)))
+
+    def update(self, surface, keys, now, dt, scale):
+        self.log.append(('frame', now, dt, tools.get_mouse_pos(),
+                         keys[pg.K_SPACE], random.random()))
+
+
+class TestReplay(unittest.TestCase):
+    """Tests for the Recorder and Player"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'replay.json.gz')
+
+    def tearDown(self):
+        """Tear down the tests"""
+        shutil.rmtree(self.directory)
+
+    def _run(self, control, frames, post=False):
+        """Run the control for a number of frames"""
+        control.headless = True
+        control.setup_states({'log': LoggingState}, 'log')
+        for frame in range(frames):
+            if post and frame % 3 == 0:
+                pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(frame, 2), button=1))
+            control.max_iterations = 1
+            control.main()
+        return control.state.log
+
+    def testEventsRoundTrip(self):
+        """events should survive being encoded"""
+        event = pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(3, 4), button=1)
+        decoded = replay.decode_event(replay.encode_event(event))
+        self.assertEqual(pg.MOUSEBUTTONDOWN, decoded.type)
+        self.assertEqual((3, 4), decoded.pos)
+        self.assertEqual(1, decoded.button)
+
+    def testReplayMatchesRecording(self):
+        """replaying should feed the states exactly what they saw when recorded"""
+        pg.event.clear()
+        control = tools.Control('caption', (10, 10), [])
+        control.recorder = replay.Recorder(self.path)
+        recorded = self._run(control, 10, post=True)
+        control.recorder.save()
+        #
+        control = tools.Control('caption', (10, 10), [])
+        control.replay = replay.Player(self.path)
+        control.headless = True
+        control.setup_states({'log': LoggingState}, 'log')
+        control.main()
+        control.replay.close()
+        #
+        self.assertEqual(recorded, control.state.log)
+        self.assertTrue(('event', pg.MOUSEBUTTONDOWN, (3, 2)) in recorded)
+        self.assertEqual(tools.get_ticks, replay.SOURCES[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
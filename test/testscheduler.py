@@ -0,0 +1,119 @@
+"""Tests for the Task scheduler"""
+
+import unittest
+
+import pygame as pg
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.scheduler import Scheduler
+    from data.components.animation import AnimationGroup, Task
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestScheduler(unittest.TestCase):
+    """Tests for the Scheduler"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.scheduler = Scheduler()
+        self.fired = []
+
+    def task(self, name, interval, loops=1):
+        return Task(self.fired.append, interval, loops, args=(name,))
+
+    def testTasksFireWhenDue(self):
+        """Tasks fire once their interval has passed, in order added"""
+        for name, interval in (("late", 100), ("b", 30), ("a", 10)):
+            self.scheduler.add(self.task(name, interval))
+        self.scheduler.advance(20)
+        self.assertEqual(self.fired, ["a"])
+        self.scheduler.advance(20)
+        self.assertEqual(self.fired, ["a", "b"])
+        self.scheduler.advance(100)
+        self.assertEqual(self.fired, ["a", "b", "late"])
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertIsNone(self.scheduler.next_due())
+
+    def testSameFrameKeepsOrderAdded(self):
+        """Tasks due in the same advance fire in the order they were added"""
+        self.scheduler.add(self.task("first", 40))
+        self.scheduler.add(self.task("second", 20))
+        self.scheduler.advance(50)
+        self.assertEqual(self.fired, ["first", "second"])
+
+    def testRepeatingFiresOncePerAdvance(self):
+        """Repeating Tasks catch up one interval per advance, like update"""
+        task = self.task("tick", 10, 3)
+        self.scheduler.add(task)
+        self.scheduler.advance(35)
+        self.assertEqual(self.fired, ["tick"])
+        self.assertEqual(self.scheduler.next_due(), 0)
+        self.scheduler.advance(0)
+        self.scheduler.advance(0)
+        self.assertEqual(self.fired, ["tick"] * 3)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def testCancelAndKill(self):
+        """Cancelled and killed Tasks don't fire"""
+        cancelled = self.task("cancelled", 10)
+        killed = self.task("killed", 10)
+        self.scheduler.add(cancelled)
+        self.scheduler.add(killed)
+        self.scheduler.advance(4)
+        self.scheduler.cancel(cancelled)
+        killed.kill()
+        self.scheduler.advance(20)
+        self.assertEqual(self.fired, [])
+        self.assertEqual(cancelled._timer, 4)
+
+    def testMoveToAnotherTimeline(self):
+        """A Task moved to another timeline keeps the time it has waited"""
+        task = self.task("moved", 300)
+        self.scheduler.advance(1000)
+        self.scheduler.add(task)
+        self.scheduler.advance(100)
+        other = Scheduler()
+        other.add(task)
+        self.assertEqual(task._timer, 100)
+        self.assertEqual(other.next_due(), 200)
+        self.assertIsNone(self.scheduler.next_due())
+
+    def testChain(self):
+        """Chained Tasks are scheduled when the first finishes"""
+        task = self.task("first", 10)
+        task.chain(self.task("chained", 5))
+        self.scheduler.add(task)
+        self.scheduler.advance(10)
+        self.assertEqual(self.fired, ["first"])
+        self.assertEqual(self.scheduler.next_due(), 5)
+        self.scheduler.advance(5)
+        self.assertEqual(self.fired, ["first", "chained"])
+
+    def testAnimationGroupSchedulesTasks(self):
+        """Tasks in an AnimationGroup wait in its timeline"""
+        group = AnimationGroup()
+        task = self.task("first", 30)
+        task.chain(self.task("chained", 10))
+        group.add(task, self.task("forever", 25, -1))
+        self.assertEqual(len(group.timeline), 2)
+        group.update(20)
+        self.assertEqual(self.fired, [])
+        group.update(20)
+        self.assertEqual(self.fired, ["first", "forever"])
+        self.assertEqual(len(group), 2)
+        group.update(20)
+        fired = ["first", "forever", "forever", "chained"]
+        self.assertEqual(self.fired, fired)
+        group.empty()
+        group.update(100)
+        self.assertEqual(len(group.timeline), 0)
+        self.assertEqual(self.fired, fired)
+
+
+if __name__ == '__main__':
+    unittest.main()
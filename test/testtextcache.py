@@ -0,0 +1,76 @@
+"""Tests for the shared text render cache"""
+
+import unittest
+
+import pygame as pg
+pg.init()
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import tools
+    from data.components import text_cache, labels
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestTextCache(unittest.TestCase):
+    """Tests for the TextCache"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.font = pg.font.Font(None, 24)
+        self.cache = text_cache.TextCache()
+
+    def testSameTextIsRenderedOnce(self):
+        """Repeated renders return the cached surface"""
+        first = self.cache.render(self.font, "Bet: $5", True, (255, 0, 0))
+        second = self.cache.render(self.font, "Bet: $5", True,
+                                   pg.Color(255, 0, 0))
+        self.assertIs(first, second)
+        self.assertEqual(len(self.cache.surfaces), 1)
+
+    def testEveryArgumentIsPartOfTheKey(self):
+        """Changing any argument renders again"""
+        base = ("Bet: $5", True, (255, 0, 0), None)
+        changes = [("Bet: $6", True, (255, 0, 0), None),
+                   ("Bet: $5", False, (255, 0, 0), None),
+                   ("Bet: $5", True, (0, 255, 0), None),
+                   ("Bet: $5", True, (255, 0, 0), (0, 0, 0))]
+        first = self.cache.render(self.font, *base)
+        for args in changes:
+            self.assertIsNot(self.cache.render(self.font, *args), first)
+        other_font = pg.font.Font(None, 30)
+        self.assertIsNot(self.cache.render(other_font, *base), first)
+
+    def testBudgetDropsLeastRecentlyUsed(self):
+        """Old renders are dropped once the budget is exceeded"""
+        white = (255, 255, 255)
+        first = self.cache.render(self.font, "111", True, white)
+        self.cache.budget = tools.surface_bytes(first)*5//2
+        self.cache.render(self.font, "222", True, white)
+        self.cache.render(self.font, "111", True, white)
+        self.cache.render(self.font, "333", True, white)
+        texts = [key[1] for key in self.cache.surfaces]
+        self.assertEqual(texts, ["111", "333"])
+        self.assertLessEqual(self.cache.size, self.cache.budget)
+        self.assertEqual(self.cache.size, sum(
+            tools.surface_bytes(s) for s in self.cache.surfaces.values()))
+
+    def testLabelAlphaDoesNotChangeSharedImage(self):
+        """Labels copy the shared render before changing it"""
+        first = labels.Label(None, 24, "Stayed in", "gold3", {"center": (0, 0)})
+        second = labels.Label(None, 24, "Stayed in", "gold3", {"center": (0, 0)})
+        self.assertIs(first.image, second.image)
+        first.set_alpha(100)
+        self.assertIsNot(first.image, second.image)
+        self.assertEqual(first.image.get_alpha(), 100)
+        self.assertNotEqual(second.image.get_alpha(), 100)
+        first.set_text("Stayed in")
+        self.assertIs(first.image, second.image)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests for word wrapping and draw_text"""
+
+import unittest
+
+import pygame as pg
+pg.init()
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data.components import text_layout, dialog
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestTextLayout(unittest.TestCase):
+    """Tests for text_layout"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.font = pg.font.Font(None, 24)
+        self.text = ("Dealer must draw to 16 and stand on all 17s.\n"
+                     "Insurance pays 2 to 1.")
+
+    def lines(self, text, width):
+        return [text[start:end]
+                for start, end, line_width in text_layout.wrap(self.font,
+                                                               text, width)]
+
+    def testLinesFitAndBreakAtSpaces(self):
+        """Lines are no wider than asked and end at spaces or newlines"""
+        lines = text_layout.wrap(self.font, self.text, 150)
+        self.assertGreater(len(lines), 2)
+        for start, end, width in lines:
+            line = self.text[start:end]
+            self.assertEqual(width, self.font.size(line)[0])
+            self.assertLessEqual(width, 150)
+            self.assertTrue(end == len(self.text) or line.endswith(" ")
+                            or self.text[end] == "\n")
+        joined = "".join(self.lines(self.text, 150))
+        self.assertEqual(joined, self.text.replace("\n", ""))
+
+    def testNewlinesAndLongWords(self):
+        """Newlines always break and words too wide are split"""
+        self.assertEqual(self.lines("Split\nhand", 1000), ["Split", "hand"])
+        lines = self.lines("Superstitious", 40)
+        self.assertGreater(len(lines), 1)
+        self.assertEqual("".join(lines), "Superstitious")
+        self.assertEqual(self.lines("", 100), [])
+
+    def testLayoutsAreRemembered(self):
+        """Wrapping the same text again returns the same layout"""
+        first = text_layout.wrap(self.font, self.text, 200)
+        self.assertIs(text_layout.wrap(self.font, self.text, 200), first)
+        self.assertIsNot(text_layout.wrap(self.font, self.text, 201), first)
+
+    def testWrapWords(self):
+        """Words are wrapped to a number of characters"""
+        lines = text_layout.wrap_words("Ace is highest, two is lowest", 12)
+        self.assertEqual(lines, ("Ace is", "highest, two", "is lowest"))
+
+    def testDrawTextLeftover(self):
+        """draw_text returns the widest line and the text that didn't fit"""
+        height = self.font.size("Tg")[1]
+        rect = pg.Rect(0, 0, 150, height*2)
+        lines = self.lines(self.text, 150)
+        width, leftover = dialog.draw_text(None, self.text, rect, self.font)
+        self.assertEqual(width, max(self.font.size(line)[0]
+                                    for line in lines[:2]))
+        self.assertTrue(leftover.startswith(lines[2]))
+        surface = pg.Surface(rect.size)
+        self.assertEqual(dialog.draw_text(surface, self.text, rect, self.font,
+                                          bg_color=(255, 255, 255)),
+                         (width, leftover))
+        rect.height = 1000
+        self.assertEqual(dialog.draw_text(None, self.text, rect, self.font)[1],
+                         "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for the frame timings"""
+
+import unittest
+import tempfile
+import shutil
+import os
+import csv
+import json
+
+import pygame as pg
+pg.init()
+
+# Make the tests work from the test directory
+import sys
+sys.path.append('..')
+try:
+    from data import instrumentation
+except ImportError:
+    print('\n** ERROR ** Tests must be run from the test directory\n\n')
+    sys.exit(1)
+
+
+class TestFrameTimings(unittest.TestCase):
+    """Tests for the FrameTimings ring buffer"""
+
+    def setUp(self):
+        """Set up the tests"""
+        self.timings = instrumentation.FrameTimings(capacity=100)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Tear down the tests"""
+        shutil.rmtree(self.directory)
+
+    def _record(self, state_name, ms):
+        """Record a frame that took ms, all of it in update"""
+        self.timings.record(state_name, 0, ms/1000.0, 0, 0)
+
+    def testPercentilesPerState(self):
+        """summary should give percentiles of frame time for each state"""
+        for ms in range(1, 101):
+            self._record('slow' if ms % 2 else 'fast', ms)
+        summary = self.timings.summary()
+        self.assertEqual(50, summary['fast']['frames'])
+        self.assertAlmostEqual(50, summary['fast']['p50'])
+        self.assertAlmostEqual(96, summary['fast']['p95'])
+        self.assertAlmostEqual(99, summary['slow']['p99'])
+
+    def testOldestFramesAreOverwritten(self):
+        """the buffer should only keep the latest frames"""
+        for ms in range(150):
+            self._record('state', ms)
+        self.assertEqual(100, self.timings.count)
+        totals = [self.timings.total(i) for i in self.timings.frames()]
+        self.assertAlmostEqual(50, totals[0])
+        self.assertAlmostEqual(149, totals[-1])
+
+    def testExport(self):
+        """timings can be exported as CSV or JSON"""
+        self._record('a', 10)
+        self._record('b', 20)
+        csv_path = os.path.join(self.directory, 'timings.csv')
+        self.timings.export(csv_path)
+        with open(csv_path) as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(['state', 'event', 'update', 'render', 'flip'], rows[0])
+        self.assertEqual(['a', 'b'], [row[0] for row in rows[1:]])
+        with open(csv_path, 'rb') as f:
+            self.assertEqual(3, f.read().count(b'\r\n'))
+        #
+        json_path = os.path.join(self.directory, 'timings.json')
+        self.timings.export(json_path)
+        with open(json_path) as f:
+            data = json.load(f)
+        self.assertAlmostEqual(20, data['frames'][1]['update'])
+        self.assertAlmostEqual(10, data['summary']['a']['p99'])
+
+    def testDrawOverlay(self):
+        """the overlay should draw without a display"""
+        self._record('a', 10)
+        surface = pg.Surface((400, 300))
+        self.timings.draw(surface)
+        self.assertNotEqual((0, 0, 0, 255), surface.get_at((10, 289)))
+
+
+if __name__ == '__main__':
+    unittest.main()